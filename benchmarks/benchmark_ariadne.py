@@ -135,7 +135,7 @@ def parameterized_bound(n=4, theta_val=0.3):
     qc.ry(theta, 0)
     for i in range(n - 1):
         qc.cx(i, i + 1)
-    qc = qc.assign_parameters({theta: theta_val})
+    qc.assign_parameters({theta: float(theta_val)}, inplace=True)
     qc.measure_all()
     return qc, {"family": "param_bound", "n_qubits": n, "depth": None}
 
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import time
 from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass
 
 from qiskit import QuantumCircuit
@@ -170,6 +172,32 @@ def benchmark_case(
     return results
 
 
+def run_cases(
+    cases: list[BenchmarkCase],
+    shots: int,
+    repetitions: int,
+    include_qiskit: bool,
+    mps_backend: MPSBackend | None,  # type: ignore[name-defined]
+    jobs: int = 1,
+) -> list[BenchmarkResult]:
+    """Benchmark every case, fanning independent cases out over ``jobs`` worker processes."""
+    workers = max(1, min(jobs, len(cases)))
+    results: list[BenchmarkResult] = []
+
+    if workers == 1:
+        for case in cases:
+            results.extend(benchmark_case(case, shots, repetitions, include_qiskit, mps_backend))
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(benchmark_case, case, shots, repetitions, include_qiskit, mps_backend) for case in cases
+        ]
+        for future in futures:
+            results.extend(future.result())
+    return results
+
+
 def format_table(results: Iterable[BenchmarkResult]) -> str:
     headers = ["Circuit", "Backend", "Shots", "Runs", "Mean (s)", "Status"]
     rows = [headers]
@@ -209,6 +237,15 @@ def main() -> None:
         help="Optional path to write results as JSON",
     )
     parser.add_argument("--skip-qiskit", action="store_true", help="Skip Qiskit baseline measurements")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            f"Benchmark cases to run concurrently (default: 1; this machine has {os.cpu_count()} CPUs). "
+            "Concurrent runs finish sooner but compete for CPU, so timings are noisier."
+        ),
+    )
 
     args = parser.parse_args()
 
@@ -218,18 +255,14 @@ def main() -> None:
     else:
         backend_instance = MPSBackend()
 
-    cases = case_definitions()
-    results: list[BenchmarkResult] = []
-    for case in cases:
-        results.extend(
-            benchmark_case(
-                case,
-                shots=args.shots,
-                repetitions=args.repetitions,
-                include_qiskit=not args.skip_qiskit,
-                mps_backend=backend_instance,
-            )
-        )
+    results = run_cases(
+        case_definitions(),
+        shots=args.shots,
+        repetitions=args.repetitions,
+        include_qiskit=not args.skip_qiskit,
+        mps_backend=backend_instance,
+        jobs=args.jobs,
+    )
 
     if not results:
         print("No benchmarks were executed.")
@@ -4,9 +4,11 @@
 import argparse
 import json
 import math
+import os
 import subprocess
 import sys
 from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -26,16 +28,30 @@ class BenchmarkExecution:
     config: BenchmarkConfig
     success: bool
     output_path: Path | None
-    stdout: str
-    stderr: str
+    output: str
+    log_path: Path
+
+
+LOG_TAIL_LINES = 20
+
+
+def _tail(text: str, lines: int = LOG_TAIL_LINES) -> str:
+    return "\n".join(text.strip().splitlines()[-lines:])
 
 
 def run_benchmark(config: BenchmarkConfig, results_dir: Path, shots: int) -> BenchmarkExecution:
-    """Run a benchmark script and capture its results."""
+    """Run a benchmark script and capture its results.
+
+    The child's stdout and stderr are streamed straight into
+    ``<results_dir>/logs/<key>.log`` so concurrent runs never interleave on the
+    terminal and every run can be inspected afterwards.
+    """
 
     script_path = Path(__file__).parent / config.script
     output_path = results_dir / config.output_name
     output_path.unlink(missing_ok=True)
+    log_path = results_dir / "logs" / f"{config.key}.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
 
     cmd = [
         sys.executable,
@@ -44,8 +60,10 @@ def run_benchmark(config: BenchmarkConfig, results_dir: Path, shots: int) -> Ben
         f"{config.json_flag}={output_path}",
     ]
 
-    print(f"🚀 Running {config.script}...")
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    print(f"🚀 Running {config.script} (log: {log_path})...")
+    with log_path.open("wb") as log_file:
+        result = subprocess.run(cmd, stdout=log_file, stderr=subprocess.STDOUT)
+    output = log_path.read_text(errors="replace")
 
     if result.returncode == 0:
         print(f"✅ {config.script} completed successfully")
@@ -54,9 +72,9 @@ def run_benchmark(config: BenchmarkConfig, results_dir: Path, shots: int) -> Ben
         else:
             print("⚠️ Benchmark finished but did not produce an output file.")
     else:
-        print(f"❌ {config.script} failed:")
-        if result.stderr.strip():
-            print(result.stderr)
+        print(f"❌ {config.script} failed (last {LOG_TAIL_LINES} lines of {log_path}):")
+        if output.strip():
+            print(_tail(output))
 
     stored_output = output_path if output_path.exists() else None
 
@@ -64,11 +82,35 @@ def run_benchmark(config: BenchmarkConfig, results_dir: Path, shots: int) -> Ben
         config=config,
         success=result.returncode == 0,
         output_path=stored_output,
-        stdout=result.stdout,
-        stderr=result.stderr,
+        output=output,
+        log_path=log_path,
     )
 
 
+def run_benchmarks(
+    configs: list[BenchmarkConfig], results_dir: Path, shots: int, jobs: int
+) -> list[BenchmarkExecution]:
+    """Run benchmark scripts, dispatching up to ``jobs`` of them concurrently.
+
+    Each benchmark is an independent child process, so a thread pool is enough to
+    overlap them.  Results are returned in ``configs`` order regardless of which
+    script finishes first.
+    """
+
+    workers = max(1, min(jobs, len(configs)))
+    if workers == 1:
+        executions = []
+        for config in configs:
+            executions.append(run_benchmark(config, results_dir, shots))
+            print("")
+        return executions
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        executions = list(executor.map(lambda config: run_benchmark(config, results_dir, shots), configs))
+    print("")
+    return executions
+
+
 def _group_by_circuit(
     entries: Iterable[dict[str, object]], circuit_key: str = "circuit"
 ) -> dict[str, list[dict[str, object]]]:
@@ -157,8 +199,8 @@ def _summarise_cuda(path: Path, execution: BenchmarkExecution) -> str:
     cuda_available = any(entry.get("backend") == "ariadne-cuda" for entry in entries)
     availability_note = ""
     if not cuda_available:
-        lower_stdout = execution.stdout.lower()
-        if "cuda not available" in lower_stdout:
+        lower_output = execution.output.lower()
+        if "cuda not available" in lower_output:
             availability_note = "CUDA backend unavailable on this system."
         else:
             availability_note = "No CUDA backend measurements recorded."
@@ -289,8 +331,12 @@ def generate_summary_report(results_dir: Path, executions: list[BenchmarkExecuti
         lines.append("")
 
         if not execution.success:
-            failure_message = execution.stderr.strip() or "Benchmark process exited with an error."
-            lines.append(f"Benchmark failed: {failure_message}")
+            failure_message = _tail(execution.output) or "Benchmark process exited with an error."
+            lines.append(f"Benchmark failed (full log: `{execution.log_path}`):")
+            lines.append("")
+            lines.append("```")
+            lines.append(failure_message)
+            lines.append("```")
             lines.append("")
             continue
 
@@ -321,6 +367,13 @@ def main() -> int:
     parser.add_argument("--skip-cuda", action="store_true", help="Skip CUDA benchmarks")
     parser.add_argument("--skip-stim", action="store_true", help="Skip Stim benchmarks")
     parser.add_argument("--skip-mps", action="store_true", help="Skip MPS benchmarks")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=f"Benchmark scripts to run concurrently (default: 1; this machine has {os.cpu_count()} CPUs). "
+        "Concurrent runs finish sooner but compete for CPU, so timings are noisier.",
+    )
 
     args = parser.parse_args()
 
@@ -363,19 +416,15 @@ def main() -> int:
     print(f"🎯 Shots per circuit: {args.shots}")
     print("")
 
-    executions: list[BenchmarkExecution] = []
+    skipped = {
+        "metal": args.skip_metal,
+        "cuda": args.skip_cuda,
+        "stim": args.skip_stim,
+        "mps": args.skip_mps,
+    }
+    selected = [config for config in configs if not skipped.get(config.key, False)]
 
-    for config in configs:
-        if config.key == "metal" and args.skip_metal:
-            continue
-        if config.key == "cuda" and args.skip_cuda:
-            continue
-        if config.key == "stim" and args.skip_stim:
-            continue
-        if config.key == "mps" and args.skip_mps:
-            continue
-        executions.append(run_benchmark(config, results_dir, args.shots))
-        print("")
+    executions = run_benchmarks(selected, results_dir, args.shots, args.jobs)
 
     success_count = sum(1 for exec_info in executions if exec_info.success)
     total_benchmarks = len(executions)
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import time
 from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass
 
+import stim
 from qiskit import QuantumCircuit
 from qiskit.providers.basic_provider import BasicProvider
 
@@ -99,6 +102,39 @@ def run_stim_backend(circuit: QuantumCircuit, shots: int) -> None:
     simulate_stim_circuit(stim_circuit, measurement_map, shots, num_clbits)
 
 
+def run_stim_native(stim_circuit: stim.Circuit, shots: int) -> None:
+    stim_circuit.compile_sampler().sample(shots)
+
+
+def time_repeated(
+    case: BenchmarkCase,
+    backend: str,
+    shots: int,
+    repetitions: int,
+    fn: Callable[[], object],
+) -> BenchmarkResult:
+    timings: list[float] = []
+    success = True
+    error: str | None = None
+    for _ in range(repetitions):
+        try:
+            timings.append(time_call(fn))
+        except Exception as exc:  # noqa: BLE001
+            success = False
+            error = str(exc)
+            break
+
+    return BenchmarkResult(
+        circuit=case.name,
+        backend=backend,
+        shots=shots,
+        repetitions=len(timings),
+        timings=timings,
+        success=success,
+        error=error,
+    )
+
+
 def benchmark_case(
     case: BenchmarkCase,
     shots: int,
@@ -108,51 +144,55 @@ def benchmark_case(
     results: list[BenchmarkResult] = []
 
     if include_qiskit:
-        timings: list[float] = []
-        success = True
-        error: str | None = None
-        for _ in range(repetitions):
-            try:
-                timings.append(time_call(lambda: run_qiskit_backend(case.circuit, shots)))
-            except Exception as exc:  # noqa: BLE001
-                success = False
-                error = str(exc)
-                break
+        results.append(
+            time_repeated(case, "qiskit-basic", shots, repetitions, lambda: run_qiskit_backend(case.circuit, shots))
+        )
+
+    results.append(time_repeated(case, "stim", shots, repetitions, lambda: run_stim_backend(case.circuit, shots)))
+
+    # Convert once up front so this leg times Stim's sampler alone, without Qiskit translation
+    try:
+        stim_circuit, _ = convert_qiskit_to_stim(case.circuit)
+    except Exception as exc:  # noqa: BLE001
         results.append(
             BenchmarkResult(
                 circuit=case.name,
-                backend="qiskit-basic",
+                backend="stim-native",
                 shots=shots,
-                repetitions=len(timings),
-                timings=timings,
-                success=success,
-                error=error,
+                repetitions=0,
+                timings=[],
+                success=False,
+                error=str(exc),
             )
         )
+    else:
+        results.append(
+            time_repeated(case, "stim-native", shots, repetitions, lambda: run_stim_native(stim_circuit, shots))
+        )
 
-    stim_timings: list[float] = []
-    stim_success = True
-    stim_error: str | None = None
-    for _ in range(repetitions):
-        try:
-            stim_timings.append(time_call(lambda: run_stim_backend(case.circuit, shots)))
-        except Exception as exc:  # noqa: BLE001
-            stim_success = False
-            stim_error = str(exc)
-            break
+    return results
 
-    results.append(
-        BenchmarkResult(
-            circuit=case.name,
-            backend="stim",
-            shots=shots,
-            repetitions=len(stim_timings),
-            timings=stim_timings,
-            success=stim_success,
-            error=stim_error,
-        )
-    )
 
+def run_cases(
+    cases: list[BenchmarkCase],
+    shots: int,
+    repetitions: int,
+    include_qiskit: bool,
+    jobs: int = 1,
+) -> list[BenchmarkResult]:
+    """Benchmark every case, fanning independent cases out over ``jobs`` worker processes."""
+    workers = max(1, min(jobs, len(cases)))
+    results: list[BenchmarkResult] = []
+
+    if workers == 1:
+        for case in cases:
+            results.extend(benchmark_case(case, shots, repetitions, include_qiskit))
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(benchmark_case, case, shots, repetitions, include_qiskit) for case in cases]
+        for future in futures:
+            results.extend(future.result())
     return results
 
 
@@ -195,20 +235,25 @@ def main() -> None:
         help="Optional path to write results as JSON",
     )
     parser.add_argument("--skip-qiskit", action="store_true", help="Skip Qiskit baseline measurements")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            f"Benchmark cases to run concurrently (default: 1; this machine has {os.cpu_count()} CPUs). "
+            "Concurrent runs finish sooner but compete for CPU, so timings are noisier."
+        ),
+    )
 
     args = parser.parse_args()
 
-    cases = case_definitions()
-    results: list[BenchmarkResult] = []
-    for case in cases:
-        results.extend(
-            benchmark_case(
-                case,
-                shots=args.shots,
-                repetitions=args.repetitions,
-                include_qiskit=not args.skip_qiskit,
-            )
-        )
+    results = run_cases(
+        case_definitions(),
+        shots=args.shots,
+        repetitions=args.repetitions,
+        include_qiskit=not args.skip_qiskit,
+        jobs=args.jobs,
+    )
 
     if not results:
         print("No benchmarks were executed.")
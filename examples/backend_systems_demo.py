@@ -7,6 +7,7 @@ including health checking, pooling, fallback strategies, and performance monitor
 """
 
 import time
+from itertools import islice
 
 from qiskit import QuantumCircuit
 
@@ -248,7 +249,7 @@ def demo_enhanced_interface():
     exec_time = time.time() - start_time
 
     print(f"✓ Circuit simulated in {exec_time:.3f}s")
-    print(f"✓ Result: {dict(list(result.items())[:3])}")
+    print(f"✓ Result: {dict(islice(result.items(), 3))}")
 
     # Get performance metrics
     metrics = enhanced.get_performance_metrics()
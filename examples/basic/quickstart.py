@@ -25,8 +25,7 @@ def create_ghz_state(n_qubits=10):
     print(f"Creating {n_qubits}-qubit GHZ state...")
     qc = QuantumCircuit(n_qubits, n_qubits)
     qc.h(0)
-    for i in range(n_qubits - 1):
-        qc.cx(i, i + 1)
+    qc.cx(range(n_qubits - 1), range(1, n_qubits))
     qc.measure_all()
     return qc
 
@@ -37,18 +36,14 @@ def create_variational_circuit(n_qubits=8):
     qc = QuantumCircuit(n_qubits, n_qubits)
 
     # Layer 1: Hadamard layer
-    for i in range(n_qubits):
-        qc.h(i)
+    qc.h(range(n_qubits))
 
     # Layer 2: Entangling layer
-    for i in range(n_qubits - 1):
-        qc.cx(i, i + 1)
+    qc.cx(range(n_qubits - 1), range(1, n_qubits))
 
     # Layer 3: Rotation layer (non-Clifford gates)
-    for i in range(n_qubits):
-        qc.ry(0.5, i)  # Parameterized rotation
-        if i % 2 == 0:
-            qc.t(i)  # T gates trigger GPU selection
+    qc.ry(0.5, range(n_qubits))  # Parameterized rotation
+    qc.t(range(0, n_qubits, 2))  # T gates trigger GPU selection
 
     qc.measure_all()
     return qc
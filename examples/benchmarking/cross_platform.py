@@ -55,16 +55,16 @@ def create_benchmark_circuits():
 
     # Random Circuit (non-Clifford)
     random_circ = QuantumCircuit(6, 6)
-    np.random.seed(42)  # For reproducibility
+    rng = np.random.default_rng(42)  # For reproducibility
     for i in range(6):
         random_circ.h(i)
     for _ in range(10):
-        control = np.random.randint(6)
-        target = np.random.randint(6)
+        control = rng.integers(6)
+        target = rng.integers(6)
         if control != target:
             random_circ.cx(control, target)
-        qubit = np.random.randint(6)
-        random_circ.rz(np.random.uniform(0, 2 * np.pi), qubit)
+        qubit = rng.integers(6)
+        random_circ.rz(rng.uniform(0, 2 * np.pi), qubit)
     random_circ.measure_all()
     circuits["random"] = random_circ
 
@@ -25,7 +25,7 @@ def main():
     qc.measure_all()
 
     print(f"Circuit: {qc.num_qubits} qubits, {qc.depth()} depth")
-    print(f"Gates: {len([inst for inst, _, _ in qc.data if inst.name != 'measure'])}")
+    print(f"Gates: {len(qc.data) - qc.count_ops().get('measure', 0)}")
 
     # Simulate with Ariadne (should route to Stim for Clifford circuits)
     result = simulate(qc, shots=1000)
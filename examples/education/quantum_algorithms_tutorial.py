@@ -22,6 +22,13 @@ from ariadne import explain_routing, simulate
 from ariadne.education import AlgorithmExplorer
 
 
+def _most_common(counts):
+    """Return the most frequent measurement outcome in ``counts``."""
+    keys = list(counts)
+    values = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+    return keys[int(values.argmax())]
+
+
 def main():
     print("=" * 70)
     print("ARIADNE QUANTUM ALGORITHMS TUTORIAL")
@@ -110,7 +117,7 @@ def deutsch_jozsa_tutorial(explorer):
         print(f"Results: {dict(result.counts)}")
 
         # Interpret results
-        most_common = max(result.counts, key=result.counts.get)
+        most_common = _most_common(result.counts)
         if most_common == "0" * (dj_circuit.num_qubits - 1):
             print(f"{func_type.title()} function detected correctly!")
         else:
@@ -196,7 +203,7 @@ def grover_tutorial(explorer):
     print(f"Results: {dict(result.counts)}")
 
     # Check success
-    most_common = max(result.counts, key=result.counts.get)
+    most_common = _most_common(result.counts)
     success_rate = result.counts[marked_item] / sum(result.counts.values())
 
     print("\nAlgorithm Performance:")
@@ -7,6 +7,8 @@ including algorithm exploration, interactive learning, and
 quantum circuit construction.
 """
 
+from itertools import islice
+
 from ariadne import (
     AlgorithmParameters,
     explain_routing,
@@ -66,7 +68,7 @@ def demonstrate_education_features():
     print(f"Backend used: {result.backend_used.value}")
     print(f"Execution time: {result.execution_time:.4f}s")
     print(f"Routing explanation: {result.routing_explanation}")
-    print(f"Sample results: {dict(list(result.counts.items())[:5])}")
+    print(f"Sample results: {dict(islice(result.counts.items(), 5))}")
 
     # Show educational content
     print("\nEducational Content:")
@@ -89,7 +91,7 @@ def demonstrate_education_features():
     result = simulate(qft_circuit, shots=100)
     print(f"Backend used: {result.backend_used.value}")
     print(f"Routing explanation: {result.routing_explanation}")
-    print(f"Sample results: {dict(list(result.counts.items())[:5])}")
+    print(f"Sample results: {dict(islice(result.counts.items(), 5))}")
 
     # 4. Demonstrate interactive circuit building
     print("\n4. Interactive Circuit Builder Demo:")
@@ -7,6 +7,7 @@ that automatically optimizes quantum circuit simulation across all available bac
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from qiskit import QuantumCircuit
@@ -19,6 +20,7 @@ try:
         MultiObjectiveOptimizer,
         ObjectiveWeight,
     )
+    from ariadne.route.analyze import analyze_circuit_fused
     from ariadne.route.context_detection import (
         ContextDetector,
         detect_user_context,
@@ -132,19 +134,37 @@ def demonstrate_enhanced_routing(context):
         RouterType.HYBRID_ROUTER,
     ]
 
-    for circuit_name, circuit in circuits.items():
-        print(f"📋 Circuit: {circuit_name} ({circuit.num_qubits} qubits, depth {circuit.depth()})")
-
+    def route_all_strategies(circuit):
+        analysis = analyze_circuit_fused(circuit)
+        decisions = []
         for strategy in strategies:
             decision = router.select_optimal_backend(circuit, strategy)
+            decisions.append((strategy, decision))
+            # Clifford circuits are sent to Stim by the router's strategy-independent
+            # fast path, so the remaining strategies cannot pick anything else.
+            if analysis["is_clifford"] and decision.recommended_backend is BackendType.STIM:
+                break
+        return analysis, decisions
+
+    # Circuits are routed independently, so analyze them concurrently; ``map``
+    # keeps the output in circuit order.
+    with ThreadPoolExecutor(max_workers=min(4, len(circuits))) as executor:
+        routed = executor.map(route_all_strategies, circuits.values())
+
+        for (circuit_name, circuit), (analysis, decisions) in zip(circuits.items(), routed, strict=True):
+            print(f"📋 Circuit: {circuit_name} ({circuit.num_qubits} qubits, depth {analysis['depth']})")
+
+            for strategy, decision in decisions:
+                print(
+                    f"  {strategy.value:>15}: {decision.recommended_backend.value} "
+                    f"(confidence: {decision.confidence_score:.1%}, "
+                    f"speedup: {decision.expected_speedup:.1f}x)"
+                )
 
-            print(
-                f"  {strategy.value:>15}: {decision.recommended_backend.value} "
-                f"(confidence: {decision.confidence_score:.1%}, "
-                f"speedup: {decision.expected_speedup:.1f}x)"
-            )
+            if len(decisions) < len(strategies):
+                print(f"  {'(all others)':>15}: stim (Clifford fast path is strategy-independent)")
 
-        print()
+            print()
 
 
 def demonstrate_performance_prediction():
@@ -6,6 +6,8 @@ This example demonstrates the new production-ready features of Ariadne,
 including improved error handling, resource management, and logging.
 """
 
+from itertools import islice
+
 from qiskit import QuantumCircuit
 
 from ariadne import (
@@ -36,7 +38,7 @@ def main():
     result = simulate(bell, shots=1000)
     logger.info(f"Simulation completed using {result.backend_used.value} backend")
     logger.info(f"Execution time: {result.execution_time:.4f}s")
-    logger.info(f"Results: {dict(list(result.counts.items())[:3])}")
+    logger.info(f"Results: {dict(islice(result.counts.items(), 3))}")
     print()
 
     # Example 2: Resource management
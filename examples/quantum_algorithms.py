@@ -58,11 +58,8 @@ def quantum_phase_estimation(n_counting_qubits: int = 3) -> QuantumCircuit:
         qc.h(qubit)
 
     # Controlled rotations
-    repetitions = 1
     for counting_qubit in range(n_counting_qubits):
-        for _ in range(repetitions):
-            qc.cp(np.pi / 4, counting[counting_qubit], target)
-        repetitions *= 2
+        qc.cp(np.pi / 4 * 2**counting_qubit, counting[counting_qubit], target)
 
     # Inverse QFT on counting qubits
     for qubit in range(n_counting_qubits // 2):
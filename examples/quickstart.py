@@ -10,6 +10,14 @@ from ariadne import simulate, explain_routing
 from qiskit import QuantumCircuit
 
 
+def _run(qc: QuantumCircuit):
+    """Simulate ``qc`` and print which backend ran it and how long it took."""
+    result = simulate(qc, shots=1000)
+    print(f"\nBackend used: {result.backend_used}")
+    print(f"Execution time: {result.execution_time:.4f}s")
+    return result
+
+
 def main():
     """Run the quickstart example."""
     print("=" * 60)
@@ -28,9 +36,7 @@ def main():
     print("Circuit created:")
     print(qc.draw(output="text"))
 
-    result = simulate(qc, shots=1000)
-    print(f"\nBackend used: {result.backend_used}")
-    print(f"Execution time: {result.execution_time:.4f}s")
+    result = _run(qc)
     print(f"Results: {dict(result.counts)}")
 
     # Example 2: Large GHZ State with Routing Explanation
@@ -49,9 +55,7 @@ def main():
     explanation = explain_routing(qc_large)
     print(f"\nRouting explanation: {explanation}")
 
-    result_large = simulate(qc_large, shots=1000)
-    print(f"\nBackend used: {result_large.backend_used}")
-    print(f"Execution time: {result_large.execution_time:.4f}s")
+    result_large = _run(qc_large)
     print(f"Number of unique outcomes: {len(result_large.counts)}")
 
     # Example 3: Non-Clifford Circuit
@@ -69,9 +73,7 @@ def main():
     print("Circuit created with T gates (non-Clifford)")
     print(f"\nRouting explanation: {explain_routing(qc_non_clifford)}")
 
-    result_non_clifford = simulate(qc_non_clifford, shots=1000)
-    print(f"\nBackend used: {result_non_clifford.backend_used}")
-    print(f"Execution time: {result_non_clifford.execution_time:.4f}s")
+    _run(qc_non_clifford)
 
     print("\n" + "=" * 60)
     print("✓ Quickstart complete! Ariadne automatically selected")
@@ -11,6 +11,7 @@ With timings, memory usage, and explain_routing() outputs.
 """
 
 import time
+from itertools import islice
 from typing import Any
 
 from qiskit import QuantumCircuit
@@ -42,7 +43,7 @@ def benchmark_circuit(name: str, circuit: QuantumCircuit, shots: int = 1000) ->
         print(f"   Backend: {result.backend_used.value}")
         print(f"   Time: {execution_time:.4f}s")
         print(f"   Throughput: {throughput:.0f} shots/s")
-        print(f"   Sample results: {dict(list(result.counts.items())[:3])}")
+        print(f"   Sample results: {dict(islice(result.counts.items(), 3))}")
 
         if result.fallback_reason:
             print(f"   Fallback reason: {result.fallback_reason}")
@@ -54,7 +55,7 @@ def benchmark_circuit(name: str, circuit: QuantumCircuit, shots: int = 1000) ->
             "throughput": throughput,
             "explanation": explanation,
             "fallback_reason": result.fallback_reason,
-            "sample_counts": dict(list(result.counts.items())[:3]),
+            "sample_counts": dict(islice(result.counts.items(), 3)),
         }
 
     except Exception as e:
@@ -67,8 +68,7 @@ def create_large_clifford_circuit(n_qubits: int = 35) -> QuantumCircuit:
     """Create a large Clifford (GHZ) circuit that should route to Stim."""
     qc = QuantumCircuit(n_qubits, n_qubits)
     qc.h(0)
-    for i in range(n_qubits - 1):
-        qc.cx(i, i + 1)
+    qc.cx(range(n_qubits - 1), range(1, n_qubits))
     qc.measure_all()
     return qc
 
@@ -78,18 +78,17 @@ def create_low_entanglement_circuit(n_qubits: int = 12) -> QuantumCircuit:
     qc = QuantumCircuit(n_qubits, n_qubits)
 
     # Initial superposition
-    for i in range(n_qubits):
-        qc.h(i)
+    qc.h(range(n_qubits))
 
-    # Light entanglement (QAOA cost layer)
-    for i in range(0, n_qubits - 1, 2):
-        qc.cx(i, i + 1)
-        qc.rz(0.5, i + 1)
-        qc.cx(i, i + 1)
+    # Light entanglement (QAOA cost layer) on disjoint pairs, applied layer-wide
+    controls = range(0, n_qubits - 1, 2)
+    targets = range(1, n_qubits, 2)
+    qc.cx(controls, targets)
+    qc.rz(0.5, targets)
+    qc.cx(controls, targets)
 
     # Mixer layer
-    for i in range(n_qubits):
-        qc.rx(0.7, i)
+    qc.rx(0.7, range(n_qubits))
 
     qc.measure_all()
     return qc
@@ -100,16 +99,13 @@ def create_general_circuit(n_qubits: int = 5) -> QuantumCircuit:
     qc = QuantumCircuit(n_qubits, n_qubits)
 
     qc.h(0)
-    for i in range(n_qubits - 1):
-        qc.cx(i, i + 1)
+    qc.cx(range(n_qubits - 1), range(1, n_qubits))
 
     # Add T gates to make it non-Clifford
-    for i in range(n_qubits):
-        qc.t(i)
+    qc.t(range(n_qubits))
 
     # More entanglement
-    for i in range(n_qubits - 1):
-        qc.cx(i, i + 1)
+    qc.cx(range(n_qubits - 1), range(1, n_qubits))
 
     qc.measure_all()
     return qc
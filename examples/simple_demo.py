@@ -6,7 +6,7 @@ from __future__ import annotations
 from qiskit import QuantumCircuit
 
 from ariadne import QuantumRouter, simulate
-from ariadne.route.analyze import analyze_circuit
+from ariadne.route.analyze import analyze_circuit_fused
 
 
 def main() -> None:
@@ -21,8 +21,8 @@ def main() -> None:
             qc.cx(idx, idx + 1)
     qc.measure_all()
 
-    # Analyze circuit using the analyze_circuit function
-    analysis = analyze_circuit(qc)
+    # Gate statistics, Clifford flag and depth in a single pass over the circuit
+    analysis = analyze_circuit_fused(qc)
 
     # Get routing decision separately
     router = QuantumRouter()
@@ -30,7 +30,8 @@ def main() -> None:
 
     print("\nCircuit Analysis:")
     print(f"  • Gate entropy: {analysis['gate_entropy']:.2f} bits")
-    print(f"  • Is Clifford? {analysis.get('is_clifford', 'N/A')}")
+    print(f"  • Is Clifford? {analysis['is_clifford']}")
+    print(f"  • Depth: {analysis['depth']}")
     print(f"  • Recommended backend: {routing_decision.recommended_backend.value}")
     print(f"  • Expected speedup: {routing_decision.expected_speedup:.1f}x")
 
@@ -14,6 +14,7 @@ For CI environments, some operations are simplified to avoid unsupported gates.
 """
 
 import os
+from itertools import islice
 
 from ariadne import (
     demo_bell_state,
@@ -56,7 +57,7 @@ def demonstrate_ux_improvements():
     print("\nRunning GHZ State demo...")
     result = demo_ghz_state(n_qubits=4, shots=1000, verbose=False)
     print(f"  -> Backend used: {result.backend_used.value}")
-    print(f"  -> Results: {dict(list(result.counts.items())[:3])}")
+    print(f"  -> Results: {dict(islice(result.counts.items(), 3))}")
 
     print("\n2. ACTIVE ROUTING TRANSPARENCY")
     print("-" * 40)
@@ -10,15 +10,35 @@ import json
 import os
 import platform
 import sys
-import time
+import tempfile
 import traceback
-from typing import Any
+from collections.abc import Callable
+from time import perf_counter_ns
+from typing import IO, Any
 
 # Add src directory to Python path
 _root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 _src_dir = os.path.join(_root_dir, "src")
 sys.path.insert(0, _src_dir)
 
+# Built on first use and shared by every later run; simulate() does not mutate its input.
+# Qiskit is imported lazily so that a missing install is reported by the import check below.
+_BELL_QC: Any = None
+
+
+def _bell_circuit() -> Any:
+    """Return the shared Bell-state circuit used by the basic simulation check."""
+    global _BELL_QC
+    if _BELL_QC is None:
+        from qiskit import QuantumCircuit
+
+        qc = QuantumCircuit(2, 2)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.measure_all()
+        _BELL_QC = qc
+    return _BELL_QC
+
 
 def log_environment_details() -> None:
     """Log detailed environment information for debugging."""
@@ -39,14 +59,28 @@ def log_environment_details() -> None:
     print("--------------------------")
 
 
+def _write_atomic(path: str, write: Callable[[IO[str]], object]) -> None:
+    """Write ``path`` through a temporary sibling file so readers never see a partial file."""
+    with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(os.path.abspath(path)), delete=False) as f:
+        write(f)
+    os.replace(f.name, path)
+
+
+def _write_results(results: dict[str, Any], success_rate: float) -> None:
+    """Persist the results JSON and success-rate summary consumed by CI."""
+    _write_atomic("benchmark_results.json", lambda f: json.dump(results, f, indent=2, default=str))
+    _write_atomic("success_rate.txt", lambda f: f.write(f"{success_rate:.2%}"))
+
+
 def run_quantum_regression_tests() -> int:
     """Run minimal quantum regression tests."""
     print("Quantum Regression Test Suite (Minimal)")
     print("=" * 50)
     log_environment_details()
 
-    # Initialize results
+    # Initialize results; they are written once, whichever way the run ends
     results: dict[str, Any] = {"results": {"minimal_test": {"backends": {}}}}
+    success_rate = 0.0
 
     try:
         # Test 1: Can we import the core library?
@@ -67,10 +101,6 @@ def run_quantum_regression_tests() -> int:
                 "error": f"ModuleNotFoundError: {e}. Check PYTHONPATH.",
             }
             # If import fails, we can't continue
-            with open("benchmark_results.json", "w") as f:
-                json.dump(results, f, indent=2, default=str)
-            with open("success_rate.txt", "w") as f:
-                f.write("0.00%")
             return 1
 
         # Test 2: Can we import Qiskit?
@@ -105,12 +135,7 @@ def run_quantum_regression_tests() -> int:
         # Test 4: Can we create a simple quantum circuit and simulate?
         print("4. Testing basic simulation...")
         try:
-            from qiskit import QuantumCircuit
-
-            qc = QuantumCircuit(2, 2)
-            qc.h(0)
-            qc.cx(0, 1)
-            qc.measure_all()
+            qc = _bell_circuit()
             print("   OK Quantum circuit creation successful")
 
             # If we have simulate function, test it
@@ -120,14 +145,17 @@ def run_quantum_regression_tests() -> int:
                 print("   OK Ariadne simulate function available")
 
                 # Run a minimal simulation
-                start_time = time.time()
+                start_ns = perf_counter_ns()
                 result = simulate(qc, shots=10)  # Minimal shots for speed
-                execution_time = time.time() - start_time
-                print(f"   OK Basic simulation successful (time: {execution_time:.3f}s)")
+                total_time = (perf_counter_ns() - start_ns) / 1e9
+                print(f"   OK Basic simulation successful (time: {total_time:.3f}s)")
 
                 results["results"]["minimal_test"]["backends"]["basic_simulation"] = {
                     "success": True,
-                    "execution_time": execution_time,
+                    "execution_time": total_time,
+                    # Routing and backend run reported separately by simulate()
+                    "routing_time": result.metadata.get("routing_time"),
+                    "backend_time": result.execution_time,
                     "shots": 10,
                     "backend_used": str(getattr(result, "backend_used", "unknown")),
                 }
@@ -140,8 +168,11 @@ def run_quantum_regression_tests() -> int:
 
         except Exception as e:
             print(f"   Basic simulation failed: {e}")
-            print(f"   Full error: {traceback.format_exc()}")
-            results["results"]["minimal_test"]["backends"]["basic_simulation"] = {"success": False, "error": str(e)}
+            results["results"]["minimal_test"]["backends"]["basic_simulation"] = {
+                "success": False,
+                "error": str(e),
+                "traceback": traceback.format_exc(),
+            }
 
         # Determine overall success
         successful_tests = sum(
@@ -150,16 +181,18 @@ def run_quantum_regression_tests() -> int:
         total_tests = len(results["results"]["minimal_test"]["backends"])
         success_rate = successful_tests / total_tests if total_tests > 0 else 0
 
+        # Emit captured tracebacks in one write instead of flushing each as it happens
+        tracebacks = [
+            f"--- {name} ---\n{entry['traceback']}"
+            for name, entry in results["results"]["minimal_test"]["backends"].items()
+            if "traceback" in entry
+        ]
+        if tracebacks:
+            print("\nFull errors:\n" + "\n".join(tracebacks))
+
         # For CI purposes, consider success if core import works
         overall_success = results["results"]["minimal_test"]["backends"]["core_import"]["success"]
 
-        # Save results
-        with open("benchmark_results.json", "w") as f:
-            json.dump(results, f, indent=2, default=str)
-
-        with open("success_rate.txt", "w") as f:
-            f.write(f"{success_rate:.2%}")
-
         if overall_success:
             print(f"\nQuantum regression tests passed! ({successful_tests}/{total_tests} components working)")
             return 0
@@ -173,12 +206,12 @@ def run_quantum_regression_tests() -> int:
 
         # Create minimal results to avoid CI failures
         results = {"results": {"critical_error": {"backends": {"error": {"success": False, "error": str(e)}}}}}
-        with open("benchmark_results.json", "w") as f:
-            json.dump(results, f, indent=2, default=str)
-        with open("success_rate.txt", "w") as f:
-            f.write("0.00%")
+        success_rate = 0.0
         return 1
 
+    finally:
+        _write_results(results, success_rate)
+
 
 if __name__ == "__main__":
     sys.exit(run_quantum_regression_tests())
@@ -1,8 +1,9 @@
 """Ariadne: intelligent quantum circuit routing."""
 
-from ._version import __version__
+import importlib
+from typing import Any
 
-__all__ = ["__version__"]
+from ._version import __version__
 
 # Configuration system data classes
 # Education tools - now more integrated
@@ -59,41 +60,28 @@ from .route.enhanced_router import EnhancedQuantumRouter
 from .route.routing_tree import ComprehensiveRoutingTree, explain_routing, get_available_backends, show_routing_tree
 
 # Main simulation interface
-from .router import simulate, simulate_and_explain
+from .router import simulate, simulate_and_explain, warmup
 from .types import BackendCapacity, BackendType, RoutingDecision, SimulationResult
 
 # Create alias for backward compatibility
 QuantumRouter = EnhancedQuantumRouter
 
-# Optional backends - may not be available
-try:
-    from .backends.cuda_backend import CUDABackend, get_cuda_info, simulate_cuda
-
-    _CUDA_AVAILABLE = True
-except ImportError:
-    _CUDA_AVAILABLE = False
-    from typing import Any
-
-    CUDABackend: Any = None
-    get_cuda_info: Any = None
-    simulate_cuda: Any = None
-
-try:
-    from .backends.metal_backend import MetalBackend, get_metal_info, simulate_metal
-
-    _METAL_AVAILABLE = True
-except ImportError:
-    _METAL_AVAILABLE = False
-    from typing import Any
-
-    MetalBackend: Any = None
-    get_metal_info: Any = None
-    simulate_metal: Any = None
-
-__all__ = [
+# Optional backends are imported on first attribute access (see __getattr__)
+_LAZY_EXPORTS = {
+    "CUDABackend": ".backends.cuda_backend",
+    "simulate_cuda": ".backends.cuda_backend",
+    "get_cuda_info": ".backends.cuda_backend",
+    "MetalBackend": ".backends.metal_backend",
+    "simulate_metal": ".backends.metal_backend",
+    "get_metal_info": ".backends.metal_backend",
+}
+
+__all__: tuple[str, ...] = (
+    "__version__",
     # Core functionality
     "simulate",
     "simulate_and_explain",
+    "warmup",
     "BackendType",
     "RoutingDecision",
     "SimulationResult",
@@ -142,23 +130,31 @@ __all__ = [
     "demo_ghz_state",
     "demo_qft",
     "demo_grover",
-]
-
-# Add optional backends if available
-if _CUDA_AVAILABLE:
-    __all__.extend(
-        [
-            "CUDABackend",
-            "simulate_cuda",
-            "get_cuda_info",
-        ]
-    )
-
-if _METAL_AVAILABLE:
-    __all__.extend(
-        [
-            "MetalBackend",
-            "simulate_metal",
-            "get_metal_info",
-        ]
-    )
+)
+
+
+def _importable(module_name: str) -> bool:
+    """Return True if the optional backend module ``module_name`` imports."""
+    try:
+        importlib.import_module(module_name, __name__)
+    except ImportError:
+        return False
+    return True
+
+
+# Optional backend names are only exported when their module imports; the router
+# has already imported both modules by now, so checking them costs nothing
+__all__ += tuple(name for name, module_name in _LAZY_EXPORTS.items() if _importable(module_name))
+
+
+def __getattr__(name: str) -> Any:
+    """Import optional backend exports on first access; ``None`` if unavailable."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except ImportError:
+        value = None
+    globals()[name] = value
+    return value
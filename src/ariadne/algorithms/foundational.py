@@ -192,10 +192,9 @@ class QuantumPhaseEstimation(QuantumAlgorithm):
 
         # Apply controlled unitary operations
         # For demonstration, use Z gate as the unitary
+        # U^(2^i) for a phase gate is a single phase gate with the angle scaled by 2^i
         for i in range(n_estimation):
-            repetitions = 2**i
-            for _ in range(repetitions):
-                circuit.cp(np.pi, i, self.params.n_qubits - 1)  # Controlled-Z rotation
+            circuit.cp(np.pi * 2**i, i, self.params.n_qubits - 1)  # Controlled-Z rotation
 
         # Apply inverse QFT to estimation qubits
         qft_gate = QFT(num_qubits=n_estimation).inverse()
@@ -65,14 +65,11 @@ class QAOA(QuantumAlgorithm):
         # Ring graph: each qubit connected to next, last connected to first
         for i in range(self.params.n_qubits):
             j = (i + 1) % self.params.n_qubits
-            circuit.cx(i, j)
-            circuit.rz(2 * gamma, j)
-            circuit.cx(i, j)
+            circuit.rzz(2 * gamma, i, j)
 
     def _apply_mixer_hamiltonian(self, circuit: QuantumCircuit, beta: float) -> None:
         """Apply the mixer Hamiltonian."""
-        for i in range(self.params.n_qubits):
-            circuit.rx(2 * beta, i)
+        circuit.rx(2 * beta, range(self.params.n_qubits))
 
     def _get_mathematical_background(self) -> str:
         return """
@@ -67,6 +67,8 @@ class GroverSearch(QuantumAlgorithm):
         # Multi-controlled Z gate
         if self.params.n_qubits == 2:
             circuit.cz(0, 1)
+        elif self.params.n_qubits == 3:
+            circuit.ccz(0, 1, 2)
         else:
             # Use ancilla method for multi-controlled Z
             circuit.h(self.params.n_qubits - 1)
@@ -91,6 +93,8 @@ class GroverSearch(QuantumAlgorithm):
         # Multi-controlled Z
         if self.params.n_qubits == 2:
             circuit.cz(0, 1)
+        elif self.params.n_qubits == 3:
+            circuit.ccz(0, 1, 2)
         else:
             circuit.h(self.params.n_qubits - 1)
             circuit.mcx(list(range(self.params.n_qubits - 1)), self.params.n_qubits - 1)
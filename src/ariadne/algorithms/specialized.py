@@ -342,6 +342,8 @@ class AmplitudeAmplification(QuantumAlgorithm):
         # Multi-controlled Z
         if self.params.n_qubits == 2:
             circuit.cz(0, 1)
+        elif self.params.n_qubits == 3:
+            circuit.ccz(0, 1, 2)
         else:
             circuit.h(self.params.n_qubits - 1)
             circuit.mcx(list(range(self.params.n_qubits - 1)), self.params.n_qubits - 1)
@@ -359,6 +361,8 @@ class AmplitudeAmplification(QuantumAlgorithm):
 
         if self.params.n_qubits == 2:
             circuit.cz(0, 1)
+        elif self.params.n_qubits == 3:
+            circuit.ccz(0, 1, 2)
         else:
             circuit.h(self.params.n_qubits - 1)
             circuit.mcx(list(range(self.params.n_qubits - 1)), self.params.n_qubits - 1)
@@ -18,6 +18,7 @@ import importlib.util
 import logging
 import os
 import warnings
+from itertools import islice
 from typing import Any
 
 from qiskit import QuantumCircuit
@@ -665,7 +666,7 @@ def benchmark_azure_quantum(
 
                 circuit_result["success"] = True
                 circuit_result["execution_time"] = circuit_end - circuit_start
-                circuit_result["counts_sample"] = dict(list(counts.items())[:3])
+                circuit_result["counts_sample"] = dict(islice(counts.items(), 3))
                 successful_runs += 1
 
             except Exception as e:
@@ -17,6 +17,7 @@ from __future__ import annotations
 import importlib.util
 import logging
 import warnings
+from itertools import islice
 from typing import Any
 
 from qiskit import QuantumCircuit
@@ -603,7 +604,7 @@ def benchmark_aws_braket(
 
                 circuit_result["success"] = True
                 circuit_result["execution_time"] = circuit_end - circuit_start
-                circuit_result["counts_sample"] = dict(list(counts.items())[:3])
+                circuit_result["counts_sample"] = dict(islice(counts.items(), 3))
                 successful_runs += 1
 
             except Exception as e:
@@ -20,6 +20,7 @@ import importlib.util
 import logging
 import warnings
 from collections.abc import Callable, Generator
+from itertools import islice
 from typing import Any
 
 import numpy as np
@@ -610,7 +611,7 @@ def benchmark_cirq_noise_models(
                 "simulation_time": simulation_time,
                 "fidelity": fidelity,
                 "success": True,
-                "counts_sample": dict(list(noisy_counts.items())[:5]),  # Sample of results
+                "counts_sample": dict(islice(noisy_counts.items(), 5)),  # Sample of results
             }
 
         except Exception as e:
@@ -621,7 +622,7 @@ def benchmark_cirq_noise_models(
         "simulation_time": 0.0,  # Reference
         "fidelity": 1.0,
         "success": True,
-        "counts_sample": dict(list(ideal_counts.items())[:5]),
+        "counts_sample": dict(islice(ideal_counts.items(), 5)),
     }
 
     return results
@@ -459,10 +459,8 @@ class BackendFallbackManager:
         provider = BasicProvider()
         qiskit_backend = provider.get_backend("basic_simulator")
 
-        from qiskit import QuantumCircuit as QiskitCircuit
-
         # Convert circuit if needed
-        if not isinstance(circuit, QiskitCircuit):
+        if not isinstance(circuit, QuantumCircuit):
             # This is a simplified conversion - real implementation would be more robust
             raise RuntimeError("Circuit type not supported for fallback simulation")
 
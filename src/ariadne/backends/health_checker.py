@@ -12,6 +12,7 @@ import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import islice
 from typing import Any
 
 from qiskit import QuantumCircuit
@@ -457,7 +458,7 @@ def create_circuit_based_health_check(
                     "backend": backend_name,
                     "test_circuit_qubits": test_circuit.num_qubits,
                     "test_circuit_depth": test_circuit.depth(),
-                    "result_sample": dict(list(result.items())[:3]),
+                    "result_sample": dict(islice(result.items(), 3)),
                 },
             )
         except Exception as e:
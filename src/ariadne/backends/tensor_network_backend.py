@@ -8,6 +8,8 @@ from typing import Any
 import numpy as np
 from qiskit import QuantumCircuit
 
+from ..core.cache import CircuitAnalysisCache
+
 
 @dataclass
 class TensorNetworkOptions:
@@ -34,9 +36,14 @@ class TensorNetworkOptions:
 class TensorNetworkBackend:
     """Perform circuit simulation via tensor network contraction."""
 
+    # Compiled quimb circuits are memoized per circuit structure so repeated runs
+    # skip the transpile / OpenQASM export / parse round-trip.
+    COMPILED_CACHE_SIZE = 128
+
     def __init__(self, options: TensorNetworkOptions | None = None) -> None:
         self._options = options or TensorNetworkOptions()
         self._optimizer: Any | None = None
+        self._compiled_cache = CircuitAnalysisCache(max_size=self.COMPILED_CACHE_SIZE, ttl_seconds=float("inf"))
 
     def simulate(self, circuit: QuantumCircuit, shots: int) -> dict[str, int]:
         """Return measurement counts for ``circuit`` using tensor networks."""
@@ -52,7 +59,7 @@ class TensorNetworkBackend:
             return {"": shots}
 
         try:
-            quimb_circuit = self._compile_to_tensor_network(circuit)
+            quimb_circuit = self._compiled_circuit(circuit)
             state = self._contract_statevector(quimb_circuit)
         except ImportError:
             # Optional deps missing; fall back to Qiskit's statevector path
@@ -64,6 +71,15 @@ class TensorNetworkBackend:
     # ------------------------------------------------------------------
     # Internal helpers
 
+    def _compiled_circuit(self, circuit: QuantumCircuit) -> Any:
+        cached = self._compiled_cache.get_analysis(circuit)
+        if cached is not None:
+            return cached["quimb_circuit"]
+
+        quimb_circuit = self._compile_to_tensor_network(circuit)
+        self._compiled_cache.store_analysis(circuit, {"quimb_circuit": quimb_circuit})
+        return quimb_circuit
+
     def _compile_to_tensor_network(self, circuit: QuantumCircuit) -> Any:
         try:
             import qiskit.qasm2 as qasm2
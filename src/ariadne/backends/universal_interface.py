@@ -14,6 +14,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
 from typing import Any, cast
 
 from qiskit import QuantumCircuit
@@ -260,7 +261,7 @@ class BackendManager:
                 results[backend_name] = {
                     "success": True,
                     "execution_time": execution_time,
-                    "counts_sample": dict(list(counts.items())[:3]),
+                    "counts_sample": dict(islice(counts.items(), 3)),
                     "total_counts": sum(counts.values()),
                     "backend_info": backend.get_backend_info(),
                 }
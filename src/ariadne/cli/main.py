@@ -12,6 +12,7 @@ import platform
 import sys
 import time
 from argparse import ArgumentParser, _SubParsersAction
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -842,8 +843,6 @@ Examples:
     def _run_quickstart_algorithm(self, algorithm: str, shots: int) -> int:
         """Run a specific quickstart algorithm demonstration."""
         try:
-            from qiskit import QuantumCircuit
-
             print(f"\n🚀 Running {algorithm.upper()} Algorithm Demonstration")
             print("=" * 50)
 
@@ -1289,7 +1288,7 @@ Examples:
             print(f"  Backend: {result.backend_used.value}")
             print(f"  Execution time: {result.execution_time:.4f}s")
             print(f"  Shots: {args.shots}")
-            print(f"  Counts: {dict(list(result.counts.items())[:5])}")
+            print(f"  Counts: {dict(islice(result.counts.items(), 5))}")
 
             if len(result.counts) > 5:
                 print(f"  ... and {len(result.counts) - 5} more")
@@ -1635,7 +1634,7 @@ Examples:
                     )
                     if counts_preview is None and result is not None and hasattr(result, "counts"):
                         try:
-                            counts_preview = dict(list(result.counts.items())[:3])
+                            counts_preview = dict(islice(result.counts.items(), 3))
                         except Exception:
                             counts_preview = None
                         else:
@@ -1815,7 +1814,7 @@ Examples:
             print("\nSimulation Results:")
             print(f"  Backend used: {result.backend_used.value}")
             print(f"  Execution time: {result.execution_time:.4f}s")
-            print(f"  Sample counts: {dict(list(result.counts.items())[:5])}")
+            print(f"  Sample counts: {dict(islice(result.counts.items(), 5))}")
 
             if len(result.counts) > 5:
                 print(f"  ... and {len(result.counts) - 5} more outcomes")
@@ -1891,8 +1890,6 @@ Examples:
     def _cmd_education_visualize(self, args: argparse.Namespace) -> int:
         """Execute the education visualization command."""
         try:
-            from qiskit import QuantumCircuit
-
             # Load circuit
             circuit_path = Path(args.circuit_file)
             if not circuit_path.exists():
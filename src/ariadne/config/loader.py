@@ -7,20 +7,47 @@ with support for environment-specific configurations and progressive overrides.
 
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
 import json
+import logging
 import os
+import re
+import stat
 import sys
+import threading
+import tomllib
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
-try:
-    import yaml
+# orjson parses integers beyond 64 bits as floats; documents with 19 or more
+# consecutive digits go through the stdlib parser, which keeps them exact.
+# orjson also rejects the NaN/Infinity literals json.loads accepts, so its
+# failures are retried with the stdlib parser.
+_LONG_DIGITS_RE = re.compile(rb"\d{19}")
 
-    YAML_AVAILABLE = True
+try:
+    import orjson
 except ImportError:
-    YAML_AVAILABLE = False
+
+    def _json_loads(document: str | bytes) -> Any:
+        return json.loads(document)
+
+else:
+
+    def _json_loads(document: str | bytes) -> Any:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+        raw = document.encode() if isinstance(document, str) else document
+        if _LONG_DIGITS_RE.search(raw):
+            return json.loads(raw)
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return json.loads(raw)
+
 
 try:
     from ariadne.core import ConfigurationError
@@ -38,6 +65,8 @@ else:
         sys.path.append(os.path.dirname(os.path.abspath(__file__)))
         from validation import ConfigurationValidator
 
+logger = logging.getLogger(__name__)
+
 
 class ConfigFormat(Enum):
     """Supported configuration file formats."""
@@ -49,6 +78,28 @@ class ConfigFormat(Enum):
     ENV = "env"
 
 
+_SUFFIX_TO_FORMAT = {
+    ".json": ConfigFormat.JSON,
+    ".yaml": ConfigFormat.YAML,
+    ".yml": ConfigFormat.YAML,
+    ".toml": ConfigFormat.TOML,
+    ".ini": ConfigFormat.INI,
+    ".env": ConfigFormat.ENV,
+}
+
+
+def _config_digest(data: dict[str, Any]) -> str:
+    """Stable digest of a configuration mapping, comparable across processes."""
+    encoded = json.dumps(data, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _detect_format(path: str) -> ConfigFormat | None:
+    """Detect a configuration format from a file suffix (``.env`` included)."""
+    _, dot, ext = path.rpartition(".")
+    return _SUFFIX_TO_FORMAT.get(dot + ext.lower()) if dot else None
+
+
 @dataclass
 class ConfigSource:
     """A configuration source with metadata."""
@@ -65,16 +116,7 @@ class ConfigSource:
         """Post-initialization processing."""
         # Auto-detect format from path if not specified
         if self.path and not self.format:
-            if self.path.endswith(".json"):
-                self.format = ConfigFormat.JSON
-            elif self.path.endswith((".yaml", ".yml")):
-                self.format = ConfigFormat.YAML
-            elif self.path.endswith(".toml"):
-                self.format = ConfigFormat.TOML
-            elif self.path.endswith(".ini"):
-                self.format = ConfigFormat.INI
-            elif self.path.endswith(".env"):
-                self.format = ConfigFormat.ENV
+            self.format = _detect_format(self.path)
 
 
 class ConfigLoadError(ConfigurationError):
@@ -83,6 +125,41 @@ class ConfigLoadError(ConfigurationError):
     pass
 
 
+# (yaml module, safe loader, safe dumper), resolved on first YAML use
+_YAML: tuple[Any, Any, Any] | None = None
+
+
+def _import_yaml() -> tuple[Any, Any, Any]:
+    """Import PyYAML on first use, preferring its LibYAML-backed C loader and dumper."""
+    global _YAML
+    if _YAML is None:
+        try:
+            import yaml
+        except ImportError:
+            _YAML = (None, None, None)
+        else:
+            _YAML = (
+                yaml,
+                getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+                getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+            )
+    return _YAML
+
+
+# Parsed file contents keyed by (resolved path, format), invalidated by mtime/size.
+_FILE_CACHE: dict[tuple[str, ConfigFormat], tuple[int, int, dict[str, Any]]] = {}
+_FILE_CACHE_LOCK = threading.Lock()
+
+_MISSING = object()
+
+# First characters of JSON objects, arrays, strings, numbers, true/false/null and
+# the NaN/Infinity literals json.loads accepts
+_JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+
+# KEY=value, KEY="value" or KEY='value', with optional whitespace around "="
+_ENV_LINE_RE = re.compile(r"""([^=]+?)\s*=\s*(?:"(.*)"|'(.*)'|(.*))$""")
+
+
 class ProgressiveConfigLoader:
     """
     Progressive configuration loader that loads from multiple sources.
@@ -92,17 +169,22 @@ class ProgressiveConfigLoader:
     configurations and progressive overrides.
     """
 
-    def __init__(self, validator: ConfigurationValidator | None = None) -> None:
+    def __init__(self, validator: ConfigurationValidator | None = None, record_history: bool = False) -> None:
         """
         Initialize the progressive config loader.
 
         Args:
             validator: Configuration validator to use
+            record_history: Whether to record a per-source summary in the load history
         """
         self.validator = validator or ConfigurationValidator()
+        self.record_history = record_history
         self.sources: list[ConfigSource] = []
         self.loaded_config: dict[str, Any] = {}
         self.load_history: list[dict[str, Any]] = []
+        self.flat_config: dict[str, Any] = {}
+        self._last_validated_hash: str | None = None
+        self._last_schema: str | None = None
 
     def add_source(self, source: ConfigSource) -> None:
         """
@@ -112,8 +194,6 @@ class ProgressiveConfigLoader:
             source: Configuration source to add
         """
         self.sources.append(source)
-        # Sort sources by priority (higher first)
-        self.sources.sort(key=lambda s: s.priority, reverse=True)
 
     def add_file_source(
         self, path: str, priority: int = 0, environment: str | None = None, required: bool = False
@@ -161,17 +241,23 @@ class ProgressiveConfigLoader:
             required: Whether this source is required
         """
         # Load environment variables with prefix
+        prefix_len = len(prefix)
         env_data = {}
         for key, value in os.environ.items():
-            if key.startswith(prefix):
-                # Remove prefix and convert to lowercase
-                config_key = key[len(prefix) :].lower()
-
-                # Try to parse as JSON, fall back to string
+            if not key.startswith(prefix):
+                continue
+            # Remove prefix and convert to lowercase
+            config_key = key[prefix_len:].lower()
+
+            # Try to parse as JSON only if the value could start a JSON document,
+            # which may be preceded by whitespace
+            if value.lstrip()[:1] in _JSON_START_CHARS:
                 try:
-                    env_data[config_key] = json.loads(value)
-                except (json.JSONDecodeError, ValueError):
-                    env_data[config_key] = value
+                    env_data[config_key] = _json_loads(value)
+                    continue
+                except ValueError:
+                    pass
+            env_data[config_key] = value
 
         source = ConfigSource(
             name=f"env:{prefix}",
@@ -197,10 +283,11 @@ class ProgressiveConfigLoader:
             ConfigLoadError: If configuration loading fails
         """
         self.loaded_config = {}
+        self.flat_config = {}
         self.load_history = []
 
-        # Filter sources by environment if specified
-        sources = self.sources
+        # Sort sources by priority (higher first), then filter by environment if specified
+        sources = sorted(self.sources, key=lambda s: s.priority, reverse=True)
         if environment:
             sources = [s for s in sources if s.environment is None or s.environment == environment]
 
@@ -212,14 +299,15 @@ class ProgressiveConfigLoader:
                     # Merge with existing configuration
                     self._merge_config(self.loaded_config, config_data)
 
-                    # Record in history
-                    self.load_history.append(
-                        {
-                            "source": source.name,
-                            "data": config_data.copy(),
-                            "merged": self.loaded_config.copy(),
-                        }
-                    )
+                    # Record a summary rather than snapshots of the merged config
+                    if self.record_history:
+                        self.load_history.append(
+                            {
+                                "source": source.name,
+                                "keys_added": list(config_data.keys()),
+                                "hash": _config_digest(config_data),
+                            }
+                        )
             except Exception as e:
                 if source.required:
                     raise ConfigLoadError(
@@ -229,21 +317,54 @@ class ProgressiveConfigLoader:
                     ) from e
                 else:
                     # Log warning but continue
-                    print(f"Warning: Failed to load source {source.name}: {e}")
+                    logger.warning("Failed to load source %s: %s", source.name, e)
 
-        # Validate against schema if specified
+        # Validate against schema if specified, skipping configs already validated against it
         if schema_name:
-            result = self.validator.validate(self.loaded_config, schema_name)
-            if not result.is_valid:
-                error_messages = [issue.message for issue in result.error_issues]
-                raise ConfigLoadError(
-                    schema_name or "config",
-                    self.loaded_config,
-                    f"Configuration validation failed: {'; '.join(error_messages)}",
-                )
+            config_hash = _config_digest(self.loaded_config)
+            if config_hash != self._last_validated_hash or schema_name != self._last_schema:
+                result = self.validator.validate(self.loaded_config, schema_name)
+                if not result.is_valid:
+                    error_messages = [issue.message for issue in result.error_issues]
+                    raise ConfigLoadError(
+                        schema_name or "config",
+                        self.loaded_config,
+                        f"Configuration validation failed: {'; '.join(error_messages)}",
+                    )
+                self._last_validated_hash = config_hash
+                self._last_schema = schema_name
 
+        self.flat_config = self._flatten_config(self.loaded_config)
         return self.loaded_config
 
+    def get(self, dotted_key: str, default: Any = None) -> Any:
+        """
+        Look up a leaf value of the loaded configuration by dotted key.
+
+        Args:
+            dotted_key: Key path such as ``"backends.default_backend"``
+            default: Value returned when the key is not present
+
+        Returns:
+            The configured value, or ``default``
+        """
+        return self.flat_config.get(dotted_key, default)
+
+    @staticmethod
+    def _flatten_config(config: dict[str, Any]) -> dict[str, Any]:
+        """Flatten nested configuration into interned dotted keys mapping to leaf values."""
+        flat: dict[str, Any] = {}
+        stack = [("", config)]
+        while stack:
+            prefix, section = stack.pop()
+            for key, value in section.items():
+                flat_key = sys.intern(f"{prefix}{key}")
+                if isinstance(value, dict):
+                    stack.append((flat_key + ".", value))
+                else:
+                    flat[flat_key] = value
+        return flat
+
     def _load_source(self, source: ConfigSource) -> dict[str, Any]:
         """Load configuration from a specific source."""
         if source.data:
@@ -257,137 +378,135 @@ class ProgressiveConfigLoader:
 
     def _load_file(self, path: str, format: ConfigFormat | None = None) -> dict[str, Any]:
         """Load configuration from a file."""
-        file_path = Path(path)
-
-        if not file_path.exists():
-            raise ConfigLoadError("file", path, "Configuration file not found")
-
-        if not file_path.is_file():
-            raise ConfigLoadError("file", path, "Configuration path is not a file")
+        # A single open + fstat covers existence, file type and the cache key
+        try:
+            fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        except FileNotFoundError as e:
+            raise ConfigLoadError("file", path, "Configuration file not found") from e
+        except OSError as e:
+            raise ConfigLoadError("file", path, f"Failed to load file {path}: {e}") from e
 
-        # Auto-detect format if not specified
-        if not format:
-            if path.endswith(".json"):
-                format = ConfigFormat.JSON
-            elif path.endswith((".yaml", ".yml")):
-                format = ConfigFormat.YAML
-            elif path.endswith(".toml"):
-                format = ConfigFormat.TOML
-            elif path.endswith(".ini"):
-                format = ConfigFormat.INI
-            elif path.endswith(".env"):
-                format = ConfigFormat.ENV
-            else:
-                raise ConfigLoadError("file_format", path, "Cannot determine format for file")
+        try:
+            st = os.fstat(fd)
+            if not stat.S_ISREG(st.st_mode):
+                raise ConfigLoadError("file", path, "Configuration path is not a file")
+
+            # Auto-detect format if not specified
+            if not format:
+                format = _detect_format(path)
+                if format is None:
+                    raise ConfigLoadError("file_format", path, "Cannot determine format for file")
+
+            # Reuse the parsed contents while the file is unchanged on disk
+            cache_key = (os.path.abspath(path), format)
+            cached = _FILE_CACHE.get(cache_key)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return copy.deepcopy(cached[2])
 
-        # Load based on format
+            try:
+                raw = os.read(fd, st.st_size)
+            except OSError as e:
+                raise ConfigLoadError("file", path, f"Failed to load file {path}: {e}") from e
+        finally:
+            os.close(fd)
+
+        data = self._parse_file(raw, path, format)
+        with _FILE_CACHE_LOCK:
+            _FILE_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(data))
+        return data
+
+    def _parse_file(self, raw: bytes, path: str, format: ConfigFormat) -> dict[str, Any]:
+        """Parse raw configuration file contents in the given format."""
         try:
-            with open(file_path, encoding="utf-8") as f:
-                if format == ConfigFormat.JSON:
-                    data = json.load(f)
-                    if not isinstance(data, dict):
-                        raise ConfigLoadError(
-                            "file",
-                            path,
-                            "JSON configuration must be a JSON object",
-                        )
-                    return cast(dict[str, Any], data)
-                elif format == ConfigFormat.YAML:
-                    if not YAML_AVAILABLE:
-                        raise ConfigLoadError(
-                            "file_format",
-                            "yaml",
-                            "YAML support not available. Install PyYAML.",
-                        )
-                    data = yaml.safe_load(f) or {}
-                    if not isinstance(data, dict):
-                        raise ConfigLoadError(
-                            "file",
-                            path,
-                            "YAML configuration must be a mapping",
-                        )
-                    return cast(dict[str, Any], data)
-                elif format == ConfigFormat.TOML:
-                    try:
-                        import tomllib
-
-                        with open(file_path, "rb") as fb:
-                            data = tomllib.load(fb)
-                            if not isinstance(data, dict):
-                                raise ConfigLoadError(
-                                    "file",
-                                    path,
-                                    "TOML configuration must be a mapping",
-                                )
-                            return cast(dict[str, Any], data)
-                    except ImportError:
-                        try:
-                            import toml
-
-                            data = toml.load(f)
-                            if not isinstance(data, dict):
-                                raise ConfigLoadError(
-                                    "file",
-                                    path,
-                                    "TOML configuration must be a mapping",
-                                )
-                            return cast(dict[str, Any], data)
-                        except ImportError as exc:
-                            raise ConfigLoadError(
-                                "file_format",
-                                "toml",
-                                "TOML support not available. Install tomli or toml.",
-                            ) from exc
-                elif format == ConfigFormat.INI:
-                    import configparser
-
-                    parser = configparser.ConfigParser()
-                    parser.read(file_path)
-                    # Convert to nested dictionary
-                    return {section: dict(parser[section]) for section in parser.sections()}
-                elif format == ConfigFormat.ENV:
-                    # Parse .env file format
-                    env_data: dict[str, Any] = {}
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith("#"):
-                            if "=" in line:
-                                key, value = line.split("=", 1)
-                                key = key.strip()
-                                value = value.strip()
-                                # Remove quotes if present
-                                if value.startswith('"') and value.endswith('"'):
-                                    value = value[1:-1]
-                                elif value.startswith("'") and value.endswith("'"):
-                                    value = value[1:-1]
-                                env_data[key] = value
-                    return env_data
-                else:
+            if format == ConfigFormat.JSON:
+                data = _json_loads(raw)
+                if not isinstance(data, dict):
+                    raise ConfigLoadError(
+                        "file",
+                        path,
+                        "JSON configuration must be a JSON object",
+                    )
+                return cast(dict[str, Any], data)
+            elif format == ConfigFormat.YAML:
+                yaml, safe_loader, _ = _import_yaml()
+                if yaml is None:
                     raise ConfigLoadError(
                         "file_format",
-                        format.value if isinstance(format, ConfigFormat) else str(format),
-                        "Unsupported configuration format",
+                        "yaml",
+                        "YAML support not available. Install PyYAML.",
+                    )
+                data = yaml.load(raw, Loader=safe_loader) or {}
+                if not isinstance(data, dict):
+                    raise ConfigLoadError(
+                        "file",
+                        path,
+                        "YAML configuration must be a mapping",
+                    )
+                return cast(dict[str, Any], data)
+            elif format == ConfigFormat.TOML:
+                data = tomllib.loads(raw.decode("utf-8"))
+                if not isinstance(data, dict):
+                    raise ConfigLoadError(
+                        "file",
+                        path,
+                        "TOML configuration must be a mapping",
                     )
+                return cast(dict[str, Any], data)
+            elif format == ConfigFormat.INI:
+                import configparser
+
+                parser = configparser.ConfigParser()
+                parser.read_string(raw.decode("utf-8"), source=path)
+                # Convert to nested dictionary
+                return {section: dict(parser[section]) for section in parser.sections()}
+            elif format == ConfigFormat.ENV:
+                # Parse .env file format
+                env_data: dict[str, Any] = {}
+                for line in raw.decode("utf-8").splitlines():
+                    line = line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    match = _ENV_LINE_RE.match(line)
+                    if match:
+                        # Exactly one of the quoted/unquoted value groups participates
+                        env_data[match.group(1)] = match.group(match.lastindex or 0)
+                return env_data
+            else:
+                raise ConfigLoadError(
+                    "file_format",
+                    format.value if isinstance(format, ConfigFormat) else str(format),
+                    "Unsupported configuration format",
+                )
         except Exception as e:
             raise ConfigLoadError("file", path, f"Failed to load file {path}: {e}") from e
 
     def _merge_config(self, base: dict[str, Any], override: dict[str, Any]) -> None:
         """Merge override configuration into base configuration."""
-        for key, value in override.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                # Recursively merge nested dictionaries
-                self._merge_config(base[key], value)
-            else:
-                # Override or add new key
-                base[key] = value
+        stack = [(base, override)]
+        while stack:
+            base_sub, override_sub = stack.pop()
+            for key, value in override_sub.items():
+                base_value = base_sub.get(key, _MISSING)
+                if isinstance(base_value, dict) and isinstance(value, dict):
+                    # Merge nested dictionaries in place
+                    stack.append((base_value, value))
+                else:
+                    # Override or add new key
+                    base_sub[key] = value
+
+    @staticmethod
+    def clear_file_cache() -> None:
+        """Drop all cached file contents so the next load re-reads from disk."""
+        with _FILE_CACHE_LOCK:
+            _FILE_CACHE.clear()
 
-    def get_load_history(self) -> list[dict[str, Any]]:
+    def get_load_history(self) -> tuple[dict[str, Any], ...]:
         """Get the configuration load history."""
-        return self.load_history.copy()
+        return tuple(self.load_history)
 
-    def get_sources(self) -> list[ConfigSource]:
-        """Get all configuration sources."""
-        return self.sources.copy()
+    def get_sources(self) -> tuple[ConfigSource, ...]:
+        """Get all configuration sources in priority order."""
+        return tuple(sorted(self.sources, key=lambda s: s.priority, reverse=True))
 
 
 class ConfigTemplate:
@@ -404,6 +523,7 @@ class ConfigTemplate:
         self.name = name
         self.description = description
         self.sections: dict[str, dict[str, Any]] = {}
+        self.frozen = False
 
     def add_section(self, name: str, data: dict[str, Any], description: str = "") -> None:
         """
@@ -413,9 +533,19 @@ class ConfigTemplate:
             name: Section name
             data: Section data
             description: Section description
+
+        Raises:
+            ConfigurationError: If the template has been frozen
         """
+        if self.frozen:
+            raise ConfigurationError("template", self.name, "Template is frozen and cannot be modified")
         self.sections[name] = {"data": data, "description": description}
 
+    def freeze(self) -> ConfigTemplate:
+        """Prevent further sections from being added, e.g. for shared cached templates."""
+        self.frozen = True
+        return self
+
     def generate(self, format: ConfigFormat = ConfigFormat.YAML) -> str:
         """
         Generate configuration file content.
@@ -435,13 +565,14 @@ class ConfigTemplate:
         if format == ConfigFormat.JSON:
             return json.dumps(config_data, indent=2)
         elif format == ConfigFormat.YAML:
-            if not YAML_AVAILABLE:
+            yaml, _, safe_dumper = _import_yaml()
+            if yaml is None:
                 raise ConfigLoadError(
                     "format",
                     "yaml",
                     "YAML support not available. Install PyYAML.",
                 )
-            return str(yaml.dump(config_data, default_flow_style=False, sort_keys=False))
+            return str(yaml.dump(config_data, Dumper=safe_dumper, default_flow_style=False, sort_keys=False))
         elif format == ConfigFormat.TOML:
             try:
                 import tomli_w
@@ -475,13 +606,8 @@ class ConfigTemplate:
         """
         # Auto-detect format if not specified
         if not format:
-            if path.endswith(".json"):
-                format = ConfigFormat.JSON
-            elif path.endswith((".yaml", ".yml")):
-                format = ConfigFormat.YAML
-            elif path.endswith(".toml"):
-                format = ConfigFormat.TOML
-            else:
+            format = _detect_format(path)
+            if format not in (ConfigFormat.JSON, ConfigFormat.TOML):
                 format = ConfigFormat.YAML  # Default to YAML
 
         # Generate content
@@ -493,8 +619,9 @@ class ConfigTemplate:
 
 
 # Common configuration templates
+@functools.cache
 def create_default_template() -> ConfigTemplate:
-    """Create a default configuration template."""
+    """Return the shared, frozen default configuration template."""
     template = ConfigTemplate(name="default", description="Default Ariadne configuration")
 
     # Backend configuration
@@ -534,11 +661,12 @@ def create_default_template() -> ConfigTemplate:
         description="Performance settings",
     )
 
-    return template
+    return template.freeze()
 
 
+@functools.cache
 def create_development_template() -> ConfigTemplate:
-    """Create a development configuration template."""
+    """Return the shared, frozen development configuration template."""
     template = ConfigTemplate(name="development", description="Development environment configuration")
 
     # Backend configuration
@@ -578,11 +706,12 @@ def create_development_template() -> ConfigTemplate:
         description="Performance settings for development",
     )
 
-    return template
+    return template.freeze()
 
 
+@functools.cache
 def create_production_template() -> ConfigTemplate:
-    """Create a production configuration template."""
+    """Return the shared, frozen production configuration template."""
     template = ConfigTemplate(name="production", description="Production environment configuration")
 
     # Backend configuration
@@ -622,7 +751,7 @@ def create_production_template() -> ConfigTemplate:
         description="Performance settings for production",
     )
 
-    return template
+    return template.freeze()
 
 
 # Global loader instance
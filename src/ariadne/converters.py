@@ -25,6 +25,7 @@ STIM_GATE_MAP = {
     "cz": "CZ",
     "swap": "SWAP",
     "measure": "M",
+    "reset": "R",
 }
 
 
@@ -409,13 +409,13 @@ class BenchmarkRunner:
         circuit = QuantumCircuit(qubits, qubits)
 
         # Add some structure to make it more realistic than pure random
-        np.random.seed(42)  # Deterministic for comparison
+        rng = np.random.default_rng(42)  # Deterministic for comparison, without reseeding global state
 
         for _layer in range(depth):
             # Random single-qubit gates
             for qubit in range(qubits):
-                if np.random.random() < 0.7:  # 70% chance of single-qubit gate
-                    gate_type = np.random.choice(["h", "x", "y", "z", "rx", "ry", "rz"])
+                if rng.random() < 0.7:  # 70% chance of single-qubit gate
+                    gate_type = rng.choice(["h", "x", "y", "z", "rx", "ry", "rz"])
 
                     if gate_type == "h":
                         circuit.h(qubit)
@@ -426,22 +426,22 @@ class BenchmarkRunner:
                     elif gate_type == "z":
                         circuit.z(qubit)
                     elif gate_type == "rx":
-                        circuit.rx(np.random.uniform(0, 2 * np.pi), qubit)
+                        circuit.rx(rng.uniform(0, 2 * np.pi), qubit)
                     elif gate_type == "ry":
-                        circuit.ry(np.random.uniform(0, 2 * np.pi), qubit)
+                        circuit.ry(rng.uniform(0, 2 * np.pi), qubit)
                     elif gate_type == "rz":
-                        circuit.rz(np.random.uniform(0, 2 * np.pi), qubit)
+                        circuit.rz(rng.uniform(0, 2 * np.pi), qubit)
 
             # Random two-qubit gates
             available_qubits = list(range(qubits))
-            np.random.shuffle(available_qubits)
+            rng.shuffle(available_qubits)
 
             for i in range(0, len(available_qubits) - 1, 2):
-                if np.random.random() < 0.3:  # 30% chance of two-qubit gate
+                if rng.random() < 0.3:  # 30% chance of two-qubit gate
                     control = available_qubits[i]
                     target = available_qubits[i + 1]
 
-                    gate_type = np.random.choice(["cx", "cz", "cy"])
+                    gate_type = rng.choice(["cx", "cz", "cy"])
                     if gate_type == "cx":
                         circuit.cx(control, target)
                     elif gate_type == "cz":
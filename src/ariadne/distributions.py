@@ -0,0 +1,30 @@
+"""Helpers for comparing measurement count distributions."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+
+def probability_matrix(counts_list: Sequence[dict[str, int]]) -> np.ndarray:
+    """Stack count dicts into normalized probability rows over one shared outcome order.
+
+    Rows only need a common column order, not a sorted one, so outcomes are
+    indexed in first-seen order and every pair of rows is already aligned.
+    Empty count dicts give all-zero rows.
+    """
+    index: dict[str, int] = {}
+    for counts in counts_list:
+        for key in counts:
+            index.setdefault(key, len(index))
+
+    matrix = np.zeros((len(counts_list), len(index)), dtype=float)
+    for row, counts in enumerate(counts_list):
+        if counts:
+            matrix[row, [index[key] for key in counts]] = list(counts.values())
+
+    totals = matrix.sum(axis=1, keepdims=True)
+    totals[totals == 0] = 1.0
+    matrix /= totals
+    return matrix
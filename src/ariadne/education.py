@@ -8,6 +8,7 @@ simulations.
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from itertools import islice
 from typing import Any, cast
 
 import numpy as np
@@ -666,7 +667,7 @@ class EducationDashboard:
                 print(step.circuit.draw())
             if step.visualization_data:
                 if "counts" in step.visualization_data:
-                    print(f"\nResults: {dict(list(step.visualization_data['counts'].items())[:5])}")
+                    print(f"\nResults: {dict(islice(step.visualization_data['counts'].items(), 5))}")
                     if len(step.visualization_data["counts"]) > 5:
                         print(f"  ... and {len(step.visualization_data['counts']) - 5} more")
             print("-" * 50)
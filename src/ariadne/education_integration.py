@@ -5,6 +5,7 @@ This module provides helpers and integration points to make educational
 features more discoverable and accessible in primary workflows.
 """
 
+from itertools import islice
 from typing import Any
 
 from .algorithms import AlgorithmParameters, get_algorithm, list_algorithms
@@ -52,7 +53,7 @@ def run_educational_simulation(
     if verbose:
         print(f"Backend used: {result.backend_used.value}")
         print(f"Execution time: {result.execution_time:.4f}s")
-        print(f"Sample results: {dict(list(result.counts.items())[:5])}")
+        print(f"Sample results: {dict(islice(result.counts.items(), 5))}")
 
     # Get educational content
     educational_content = None
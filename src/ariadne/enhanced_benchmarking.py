@@ -15,12 +15,14 @@ from collections import defaultdict
 from collections.abc import Iterable
 from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 import matplotlib.pyplot as plt
+import numpy as np
 from qiskit import QuantumCircuit
 
 from .algorithms import AlgorithmParameters, get_algorithm
+from .distributions import probability_matrix
 from .router import simulate
 
 
@@ -170,8 +172,6 @@ class EnhancedBenchmarkSuite:
                     unique_outcomes=len(result.counts),
                 )
 
-                comparison_results[backend_name] = benchmark_result
-
             except Exception as e:
                 benchmark_result = BenchmarkResult(
                     algorithm=algorithm_name,
@@ -184,7 +184,7 @@ class EnhancedBenchmarkSuite:
                     error_message=str(e),
                 )
 
-                comparison_results[backend_name] = benchmark_result
+            comparison_results[backend_name] = benchmark_result
 
         # Store results
         self.results.extend(comparison_results.values())
@@ -421,6 +421,19 @@ class EnhancedBenchmarkSuite:
         print(f"Results exported to: {filepath}")
 
 
+def _max_probability_differences(reference: dict[str, int], others: list[dict[str, int]]) -> list[float]:
+    """Largest per-outcome probability gap between ``reference`` and each of ``others``.
+
+    All distributions are laid out over the same outcomes once, so every comparison
+    against the reference happens in one vectorized reduction.
+    """
+    if not others:
+        return []
+
+    probs = probability_matrix([reference, *others])
+    return cast(list[float], np.abs(probs[1:] - probs[0]).max(axis=1, initial=0.0).tolist())
+
+
 class CrossValidationSuite:
     """Suite for cross-validation of quantum simulation results."""
 
@@ -456,43 +469,44 @@ class CrossValidationSuite:
                 }
 
         # Compare results for consistency
-        successful_backends = [backend for backend, result in results.items() if result["success"]]
+        successful = [(backend, outcome) for backend, outcome in results.items() if outcome["success"]]
 
-        if len(successful_backends) < 2:
+        if len(successful) < 2:
             return {
-                "consistent": len(successful_backends) > 0,
-                "message": f"Not enough successful backends for comparison. Success: {successful_backends}",
+                "consistent": len(successful) > 0,
+                "message": f"Not enough successful backends for comparison. Success: {[b for b, _ in successful]}",
                 "results": results,
             }
 
         # Compare first successful backend with others
-        reference_backend = successful_backends[0]
-        reference_counts = results[reference_backend]["counts"]
+        reference_counts = successful[0][1]["counts"]
 
         all_consistent = True
         differences: dict[str, float] = {}
 
-        for backend in successful_backends[1:]:
-            comparison_counts = results[backend]["counts"]
+        # Type guard: only dictionaries of counts can be compared
+        comparisons: dict[str, dict[str, int]] = {}
+        max_diffs: dict[str, float] = {}
+        if isinstance(reference_counts, dict):
+            for backend, outcome in successful[1:]:
+                comparison_counts = outcome["counts"]
+                if isinstance(comparison_counts, dict):
+                    comparisons[backend] = comparison_counts
+            max_diffs = dict(
+                zip(
+                    comparisons,
+                    _max_probability_differences(reference_counts, list(comparisons.values())),
+                    strict=True,
+                )
+            )
 
-            # Type guard: ensure counts are dictionaries
-            if not isinstance(reference_counts, dict) or not isinstance(comparison_counts, dict):
+        for backend, _ in successful[1:]:
+            if backend not in max_diffs:
                 differences[backend] = 1.0  # Maximum difference if not dicts
                 all_consistent = False
                 continue
 
-            # Calculate distribution similarity
-            all_keys = set(reference_counts.keys()) | set(comparison_counts.keys())
-            total_ref = sum(reference_counts.values())
-            total_comp = sum(comparison_counts.values())
-
-            max_diff = 0.0
-            for key in all_keys:
-                ref_prob = reference_counts.get(key, 0) / total_ref
-                comp_prob = comparison_counts.get(key, 0) / total_comp
-                diff = abs(ref_prob - comp_prob)
-                max_diff = max(max_diff, diff)
-
+            max_diff = max_diffs[backend]
             differences[backend] = max_diff
             if max_diff > tolerance:
                 all_consistent = False
@@ -14,10 +14,12 @@ from .cache import (
     Memoizer,
     MemoryCacheBackend,
     SimulationCache,
+    TinyLFUAdmission,
     cached_simulate,
     get_memoizer,
     get_simulation_cache,
     memoize,
+    memoize_hashable,
 )
 from .memory import (
     MemoryEfficientSimulator,
@@ -34,6 +36,7 @@ from .metrics import (
     BenchmarkMetricsAggregator,
     BenchmarkSummary,
     ExecutionTelemetry,
+    dump_telemetry,
     format_duration,
     format_memory,
     measure_simulation_run,
@@ -59,10 +62,12 @@ __all__ = [
     "MemoryCacheBackend",
     "Memoizer",
     "SimulationCache",
+    "TinyLFUAdmission",
     "cached_simulate",
     "get_memoizer",
     "get_simulation_cache",
     "memoize",
+    "memoize_hashable",
     # Memory management
     "MemoryEfficientSimulator",
     "MemoryLevel",
@@ -86,6 +91,7 @@ __all__ = [
     "BenchmarkMetricsAggregator",
     "BenchmarkSummary",
     "ExecutionTelemetry",
+    "dump_telemetry",
     "format_duration",
     "format_memory",
     "measure_simulation_run",
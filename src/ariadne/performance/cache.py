@@ -8,14 +8,17 @@ for expensive calculations, and distributed caching for multi-node deployments.
 from __future__ import annotations
 
 import hashlib
+import itertools
 import json
-import pickle
+import struct
+import sys
 import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Mapping
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import asdict, dataclass
 from enum import Enum
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, ParamSpec, TypeVar, cast
 
 from qiskit import QuantumCircuit
@@ -35,6 +38,27 @@ except ImportError:
     from ariadne.types import SimulationResult
 
 
+_U32 = struct.Struct("<I")
+_U32X2 = struct.Struct("<II")
+_F64 = struct.Struct("<d")
+
+# Timer wheel for proactive TTL expiry: slot count, and sets between piggybacked sweeps
+_WHEEL_SIZE = 64
+_EXPIRE_EVERY_SETS = 64
+
+# Bounds for _estimate_size: container nesting depth and elements sampled per container
+_SIZE_MAX_DEPTH = 4
+_SIZE_SAMPLE = 64
+
+# TinyLFU count-min sketch: odd multipliers picking one counter per row, the
+# saturation value of each (4-bit) counter, and a table halving every counter
+_SKETCH_SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93)
+_SKETCH_MAX_COUNT = 15
+_SKETCH_HALVE = bytes(count >> 1 for count in range(256))
+
+# Argument types whose repr is exact and cheap enough to key memoized calls directly
+_SCALAR_KEY_TYPES = frozenset({str, int, float, bool, type(None)})
+
 P = ParamSpec("P")
 R = TypeVar("R")
 SimulationCallable = Callable[..., SimulationResult]
@@ -49,7 +73,7 @@ class CachePolicy(Enum):
     TTL = "ttl"  # Time To Live
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """Entry in the cache."""
 
@@ -66,11 +90,11 @@ class CacheEntry:
         if self.last_accessed == 0:
             self.last_accessed = self.created_at
 
-    def is_expired(self) -> bool:
-        """Check if the entry is expired."""
+    def is_expired(self, now: float | None = None) -> bool:
+        """Check if the entry is expired (at ``now``, defaulting to the current time)."""
         if self.ttl is None:
             return False
-        return time.time() - self.created_at > self.ttl
+        return (time.time() if now is None else now) - self.created_at > self.ttl
 
     def touch(self) -> None:
         """Update last accessed time and increment access count."""
@@ -78,6 +102,17 @@ class CacheEntry:
         self.access_count += 1
 
 
+@dataclass(slots=True)
+class _CacheStats:
+    """Hit/miss counters for :class:`IntelligentCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
 class CacheBackend(ABC):
     """Abstract base class for cache backends."""
 
@@ -111,32 +146,165 @@ class CacheBackend(ABC):
         """Get the number of entries in the cache."""
         pass
 
+    def scan(self) -> Iterator[tuple[str, Any]]:
+        """Iterate over live ``(key, value)`` pairs, ideally without updating access metadata."""
+        for key in self.keys():
+            value = self.get(key)
+            if value is not None:
+                yield key, value
+
+
+def _estimate_size(value: Any, depth: int = 0) -> int:
+    """
+    Estimate the memory footprint of a cached value in bytes.
+
+    Objects may report their own size through ``__cache_size__``; arrays report
+    ``nbytes``. Containers are walked up to ``_SIZE_MAX_DEPTH`` levels deep, and
+    only the first ``_SIZE_SAMPLE`` elements of each are measured, extrapolating
+    for the rest.
+    """
+    reported = getattr(value, "__cache_size__", None)
+    if isinstance(reported, int):
+        return reported
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    size = sys.getsizeof(value)
+    if depth >= _SIZE_MAX_DEPTH or isinstance(value, str | bytes | bytearray | int | float | Enum):
+        return size
+
+    if isinstance(value, Mapping):
+        count = len(value)
+        sample = itertools.islice(value.items(), _SIZE_SAMPLE)
+        sampled = sum(_estimate_size(k, depth + 1) + _estimate_size(v, depth + 1) for k, v in sample)
+    elif isinstance(value, list | tuple | set | frozenset):
+        count = len(value)
+        sampled = sum(_estimate_size(item, depth + 1) for item in itertools.islice(value, _SIZE_SAMPLE))
+    elif hasattr(value, "__dict__"):
+        return size + _estimate_size(vars(value), depth + 1)
+    else:
+        return size
+
+    if count > _SIZE_SAMPLE:
+        sampled = sampled * count // _SIZE_SAMPLE
+    return size + sampled
+
+
+class TinyLFUAdmission:
+    """
+    TinyLFU admission filter backed by a count-min sketch of key frequencies.
+
+    A full cache consults the filter before evicting: a new key is only
+    admitted if it has been requested at least as often as the entry it would
+    displace, which keeps one-off keys from flushing popular ones. Counters
+    saturate at 15 and are all halved every ``sample_size`` recordings so that
+    old popularity fades.
+    """
+
+    def __init__(self, width: int = 4096, sample_size: int | None = None) -> None:
+        """
+        Initialize the admission filter.
+
+        Args:
+            width: Counters per sketch row; must be a power of two
+            sample_size: Recordings between agings, defaulting to ``10 * width``
+        """
+        if width < 2 or width & (width - 1):
+            raise ValueError(f"Sketch width must be a power of two, got {width}")
+        self.width = width
+        self.sample_size = sample_size or 10 * width
+        self._shift = 64 - (width.bit_length() - 1)
+        self._rows = [bytearray(width) for _ in _SKETCH_SEEDS]
+        self._recorded = 0
+
+    def _indexes(self, key: str) -> Iterator[int]:
+        """Counter index of ``key`` in each sketch row."""
+        key_hash = hash(key) & 0xFFFFFFFFFFFFFFFF
+        for seed in _SKETCH_SEEDS:
+            yield ((key_hash * seed) & 0xFFFFFFFFFFFFFFFF) >> self._shift
+
+    def record(self, key: str) -> None:
+        """Count one request for ``key``."""
+        for row, index in zip(self._rows, self._indexes(key), strict=True):
+            if row[index] < _SKETCH_MAX_COUNT:
+                row[index] += 1
+        self._recorded += 1
+        if self._recorded >= self.sample_size:
+            for row in self._rows:
+                row[:] = row.translate(_SKETCH_HALVE)
+            self._recorded //= 2
+
+    def frequency(self, key: str) -> int:
+        """Estimated number of recent requests for ``key``."""
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key), strict=True))
+
+    def admit(self, candidate: str, victim: str) -> bool:
+        """Whether ``candidate`` should replace ``victim`` in a full cache."""
+        return self.frequency(candidate) >= self.frequency(victim)
+
+    def reset(self) -> None:
+        """Forget all recorded frequencies."""
+        for row in self._rows:
+            row[:] = bytes(self.width)
+        self._recorded = 0
+
 
 class MemoryCacheBackend(CacheBackend):
     """In-memory cache backend."""
 
-    def __init__(self, max_size: int = 1000, max_memory_mb: int = 100) -> None:
+    def __init__(
+        self,
+        max_size: int = 1000,
+        max_memory_mb: int = 100,
+        policy: CachePolicy = CachePolicy.LRU,
+        tick_seconds: float = 1.0,
+        admission: TinyLFUAdmission | None = None,
+    ) -> None:
         """
         Initialize the memory cache backend.
 
         Args:
             max_size: Maximum number of entries
             max_memory_mb: Maximum memory usage in MB
+            policy: Eviction policy; LFU evicts the least frequently used entry,
+                every other policy evicts the least recently used one
+            tick_seconds: Granularity of the TTL timer wheel
+            admission: Optional filter deciding whether a new key may evict
+                an entry once the cache is full
         """
         self.max_size = max_size
         self.max_memory_bytes = max_memory_mb * 1024 * 1024
+        self.policy = policy
+        self.tick_seconds = tick_seconds
+        self.admission = admission
 
-        # Storage
-        self._cache: dict[str, CacheEntry] = {}
-        self._access_order: list[str] = []  # For LRU
+        # TTL timer wheel: keys bucketed by deadline tick, swept by expire_tick()
+        self._wheel: list[set[str]] = [set() for _ in range(_WHEEL_SIZE)]
+        self._last_tick = int(time.time() // tick_seconds)
+        self._sets_since_sweep = 0
+
+        # Storage, kept in LRU order (least recently used first)
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+
+        # LFU bookkeeping: access count -> keys with that count in LRU order
+        self._freq_buckets: dict[int, OrderedDict[str, None]] = {}
+        self._min_freq = 0
         self._current_memory_bytes = 0
         self._peak_memory_bytes = 0
         self._eviction_count = 0
+        self._rejection_count = 0
+
+        # Entries freed by eviction/deletion, reused by set() instead of allocating
+        self._entry_pool: list[CacheEntry] = []
 
         self.logger = get_logger("memory_cache")
 
     def get(self, key: str) -> Any | None:
         """Get a value from the cache."""
+        if self.admission is not None:
+            self.admission.record(key)
+
         if key not in self._cache:
             return None
 
@@ -148,52 +316,61 @@ class MemoryCacheBackend(CacheBackend):
             return None
 
         # Update access information
-        entry.touch()
+        if self.policy is CachePolicy.LFU:
+            self._lfu_remove(key, entry.access_count)
+            entry.touch()
+            self._lfu_add(key, entry.access_count)
+        else:
+            entry.touch()
 
         # Update LRU order
-        if key in self._access_order:
-            self._access_order.remove(key)
-        self._access_order.append(key)
+        self._cache.move_to_end(key)
 
         return entry.value
 
     def set(self, key: str, value: Any, ttl: float | None = None) -> None:
         """Set a value in the cache."""
         # Calculate size
-        try:
-            size = len(pickle.dumps(value))
-        except Exception:
-            size = 1024  # Default size estimate
+        size = _estimate_size(value)
+
+        # Requests are only counted in get(), so a miss followed by a set counts once
+        if self.admission is not None and key not in self._cache:
+            victim_key = self._eviction_candidate(size)
+            if victim_key is not None and not self.admission.admit(key, victim_key):
+                self._rejection_count += 1
+                return
 
         # Check if we need to evict entries
         self._evict_if_needed(size)
 
         # Create entry
-        entry = CacheEntry(
-            key=key,
-            value=value,
-            created_at=time.time(),
-            last_accessed=time.time(),
-            ttl=ttl,
-            size=size,
-        )
+        entry = self._new_entry(key, value, ttl, size)
 
         # Update cache
-        if key in self._cache:
-            # Update existing entry
-            old_entry = self._cache[key]
+        old_entry = self._cache.get(key)
+        if old_entry is not None:
+            # Replace existing entry and mark it most recently used
             self._current_memory_bytes -= old_entry.size
-
-            # Remove from access order
-            if key in self._access_order:
-                self._access_order.remove(key)
+            self._cache.move_to_end(key)
+            if self.policy is CachePolicy.LFU:
+                # Overwriting keeps the key's access frequency
+                self._lfu_remove(key, old_entry.access_count)
+                entry.access_count = old_entry.access_count
+            self._release_entry(old_entry)
 
         self._cache[key] = entry
-        self._access_order.append(key)
+        if self.policy is CachePolicy.LFU:
+            self._lfu_add(key, entry.access_count)
+        if ttl is not None:
+            self._wheel[self._wheel_slot(entry)].add(key)
         self._current_memory_bytes += size
         if self._current_memory_bytes > self._peak_memory_bytes:
             self._peak_memory_bytes = self._current_memory_bytes
 
+        self._sets_since_sweep += 1
+        if self._sets_since_sweep >= _EXPIRE_EVERY_SETS:
+            self.expire_tick()
+
     def delete(self, key: str) -> bool:
         """Delete a value from the cache."""
         if key not in self._cache:
@@ -203,19 +380,27 @@ class MemoryCacheBackend(CacheBackend):
         self._current_memory_bytes -= entry.size
 
         del self._cache[key]
-
-        if key in self._access_order:
-            self._access_order.remove(key)
+        if self.policy is CachePolicy.LFU:
+            self._lfu_remove(key, entry.access_count)
+        if entry.ttl is not None:
+            self._wheel[self._wheel_slot(entry)].discard(key)
+        self._release_entry(entry)
 
         return True
 
     def clear(self) -> None:
         """Clear all values from the cache."""
         self._cache.clear()
-        self._access_order.clear()
+        for bucket in self._wheel:
+            bucket.clear()
+        self._freq_buckets.clear()
+        self._min_freq = 0
         self._current_memory_bytes = 0
         self._peak_memory_bytes = 0
         self._eviction_count = 0
+        self._rejection_count = 0
+        if self.admission is not None:
+            self.admission.reset()
 
     def keys(self) -> list[str]:
         """Get all keys in the cache."""
@@ -225,6 +410,13 @@ class MemoryCacheBackend(CacheBackend):
         """Get the number of entries in the cache."""
         return len(self._cache)
 
+    def scan(self) -> Iterator[tuple[str, Any]]:
+        """Iterate over unexpired entries without touching LRU/LFU bookkeeping."""
+        # Snapshot so callers may delete entries while scanning
+        for key, entry in list(self._cache.items()):
+            if not entry.is_expired():
+                yield key, entry.value
+
     def _evict_if_needed(self, new_entry_size: int) -> None:
         """Evict entries if needed to make space."""
         evicted_entries = 0
@@ -234,19 +426,123 @@ class MemoryCacheBackend(CacheBackend):
             if not self._cache:
                 break
 
-            # Evict least recently used entry
-            lru_key = self._access_order.pop(0)
-            if lru_key in self._cache:
-                entry = self._cache[lru_key]
-                self._current_memory_bytes -= entry.size
-                del self._cache[lru_key]
-                evicted_entries += 1
+            if self.policy is CachePolicy.LFU:
+                # Evict the least recently used of the least frequently used entries
+                victim_key = self._lfu_pop()
+                entry = self._cache.pop(victim_key)
+            else:
+                # Evict least recently used entry
+                victim_key, entry = self._cache.popitem(last=False)
+            self._current_memory_bytes -= entry.size
+            self._release_entry(entry)
+            evicted_entries += 1
 
-                self.logger.debug(f"Evicted cache entry: {lru_key}")
+            self.logger.debug(f"Evicted cache entry: {victim_key}")
 
         if evicted_entries:
             self._eviction_count += evicted_entries
 
+    def _new_entry(self, key: str, value: Any, ttl: float | None, size: int) -> CacheEntry:
+        """Return a fresh entry, recycling a pooled one when available."""
+        now = time.time()
+        if not self._entry_pool:
+            return CacheEntry(key=key, value=value, created_at=now, last_accessed=now, ttl=ttl, size=size)
+        entry = self._entry_pool.pop()
+        entry.key = key
+        entry.value = value
+        entry.created_at = now
+        entry.last_accessed = now
+        entry.access_count = 0
+        entry.ttl = ttl
+        entry.size = size
+        return entry
+
+    def _release_entry(self, entry: CacheEntry) -> None:
+        """Return a removed entry to the pool, dropping its value so it can be collected."""
+        if len(self._entry_pool) < self.max_size:
+            entry.value = None
+            self._entry_pool.append(entry)
+
+    def _eviction_candidate(self, new_entry_size: int) -> str | None:
+        """Key that inserting a new entry would evict first, or None if nothing would be evicted."""
+        if not self._cache or (
+            self._current_memory_bytes + new_entry_size <= self.max_memory_bytes and len(self._cache) < self.max_size
+        ):
+            return None
+        if self.policy is CachePolicy.LFU:
+            if self._min_freq not in self._freq_buckets:
+                self._min_freq = min(self._freq_buckets)
+            return next(iter(self._freq_buckets[self._min_freq]))
+        return next(iter(self._cache))
+
+    def expire_tick(self, now: float | None = None) -> int:
+        """
+        Remove expired entries from the timer-wheel slots that have come due.
+
+        Called automatically every few sets; may also be driven by a periodic task.
+
+        Args:
+            now: Current time, defaulting to ``time.time()``
+
+        Returns:
+            Number of entries removed
+        """
+        if now is None:
+            now = time.time()
+        self._sets_since_sweep = 0
+        current_tick = int(now // self.tick_seconds)
+        # The current tick is revisited next time, as its deadlines may not all have passed yet
+        first_tick = max(self._last_tick, current_tick - _WHEEL_SIZE + 1)
+        self._last_tick = current_tick
+
+        expired = 0
+        for tick in range(first_tick, current_tick + 1):
+            slot = tick % _WHEEL_SIZE
+            bucket = self._wheel[slot]
+            for key in list(bucket):
+                entry = self._cache.get(key)
+                if entry is None or entry.ttl is None or self._wheel_slot(entry) != slot:
+                    # Deleted, evicted or overwritten since it was scheduled
+                    bucket.discard(key)
+                elif entry.is_expired(now):
+                    self.delete(key)
+                    expired += 1
+        return expired
+
+    def _wheel_slot(self, entry: CacheEntry) -> int:
+        """Timer-wheel slot holding an entry's expiry deadline."""
+        return int((entry.created_at + cast(float, entry.ttl)) // self.tick_seconds) % _WHEEL_SIZE
+
+    def _lfu_add(self, key: str, freq: int) -> None:
+        """Record ``key`` as most recently used within its frequency bucket."""
+        bucket = self._freq_buckets.get(freq)
+        if bucket is None:
+            bucket = self._freq_buckets[freq] = OrderedDict()
+        bucket[key] = None
+        if freq < self._min_freq:
+            self._min_freq = freq
+
+    def _lfu_remove(self, key: str, freq: int) -> None:
+        """Drop ``key`` from its frequency bucket, discarding the bucket once empty."""
+        bucket = self._freq_buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._freq_buckets[freq]
+            if freq == self._min_freq:
+                self._min_freq = freq + 1
+
+    def _lfu_pop(self) -> str:
+        """Remove and return the eviction candidate under LFU."""
+        bucket = self._freq_buckets.get(self._min_freq)
+        if bucket is None:
+            # Deletes can leave the minimum stale; rescan the (few) live buckets
+            self._min_freq = min(self._freq_buckets)
+            bucket = self._freq_buckets[self._min_freq]
+        key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self._freq_buckets[self._min_freq]
+        return key
+
     def get_statistics(self) -> dict[str, Any]:
         """Return detailed statistics about the cache backend."""
 
@@ -261,6 +557,7 @@ class MemoryCacheBackend(CacheBackend):
             "max_memory_bytes": self.max_memory_bytes,
             "memory_utilization": utilization,
             "evictions": self._eviction_count,
+            "admission_rejections": self._rejection_count,
         }
 
     @property
@@ -292,10 +589,10 @@ class IntelligentCache:
         self.default_ttl = default_ttl
 
         # Use provided backend or create default
-        self.backend = backend or MemoryCacheBackend()
+        self.backend = backend or MemoryCacheBackend(policy=policy)
 
         # Statistics
-        self._stats = {"hits": 0, "misses": 0, "sets": 0, "evictions": 0, "expirations": 0}
+        self._stats = _CacheStats()
 
         # Cache invalidation rules
         self._invalidation_rules: list[Callable[[str, Any], bool]] = []
@@ -313,10 +610,10 @@ class IntelligentCache:
         value = self.backend.get(key)
 
         if value is not None:
-            self._stats["hits"] += 1
+            self._stats.hits += 1
             self.logger.debug(f"Cache hit: {key}")
         else:
-            self._stats["misses"] += 1
+            self._stats.misses += 1
             self.logger.debug(f"Cache miss: {key}")
 
         return value
@@ -335,10 +632,10 @@ class IntelligentCache:
             ttl = self.default_ttl
 
         self.backend.set(key, value, ttl)
-        self._stats["sets"] += 1
+        self._stats.sets += 1
         if hasattr(self.backend, "eviction_count"):
             try:
-                self._stats["evictions"] = self.backend.eviction_count
+                self._stats.evictions = self.backend.eviction_count
             except Exception as e:
                 # Fallback: keep previous value if backend doesn't expose eviction count
                 self.logger.debug(f"Failed to get eviction_count from backend: {e}")
@@ -366,10 +663,10 @@ class IntelligentCache:
 
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
-        total_requests = self._stats["hits"] + self._stats["misses"]
-        hit_rate = self._stats["hits"] / total_requests if total_requests > 0 else 0.0
+        total_requests = self._stats.hits + self._stats.misses
+        hit_rate = self._stats.hits / total_requests if total_requests > 0 else 0.0
 
-        stats = {**self._stats, "hit_rate": hit_rate, "size": self.backend.size()}
+        stats = {**asdict(self._stats), "hit_rate": hit_rate, "size": self.backend.size()}
 
         if hasattr(self.backend, "get_statistics"):
             try:
@@ -396,24 +693,19 @@ class IntelligentCache:
             Number of entries invalidated
         """
         invalidated_count = 0
-        keys_to_delete = []
 
-        for key in self.backend.keys():
-            value = self.backend.get(key)
-            if value is not None:
-                # Check all invalidation rules
-                for rule in self._invalidation_rules:
-                    try:
-                        if rule(key, value):
-                            keys_to_delete.append(key)
-                            break
-                    except Exception as e:
-                        self.logger.error(f"Invalidation rule error: {e}")
-
-        # Delete invalid entries
-        for key in keys_to_delete:
-            if self.delete(key):
-                invalidated_count += 1
+        for key, value in self.backend.scan():
+            # Check all invalidation rules
+            for rule in self._invalidation_rules:
+                try:
+                    matched = rule(key, value)
+                except Exception as e:
+                    self.logger.error(f"Invalidation rule error: {e}")
+                    continue
+                if matched:
+                    if self.delete(key):
+                        invalidated_count += 1
+                    break
 
         if invalidated_count > 0:
             self.logger.info(f"Invalidated {invalidated_count} cache entries")
@@ -425,43 +717,56 @@ class CircuitHasher:
     """Utility class for hashing quantum circuits."""
 
     @staticmethod
-    def hash_circuit(circuit: QuantumCircuit) -> str:
+    def hash_circuit(circuit: QuantumCircuit, secure: bool = False) -> str:
         """
         Generate a hash for a quantum circuit.
 
         Args:
             circuit: Circuit to hash
+            secure: Use SHA-256 instead of the faster 128-bit BLAKE2b digest
 
         Returns:
             Hash string
         """
-        # Create a deterministic representation of the circuit
-        circuit_data = {
-            "num_qubits": circuit.num_qubits,
-            "num_clbits": circuit.num_clbits,
-            "instructions": [],
-        }
+        # Pack a deterministic, length-prefixed binary representation of the circuit
+        buf = bytearray(_U32X2.pack(circuit.num_qubits, circuit.num_clbits))
+        qubit_indices = {qubit: index for index, qubit in enumerate(circuit.qubits)}
+        clbit_indices = {clbit: index for index, clbit in enumerate(circuit.clbits)}
+        encoded_names: dict[str, bytes] = {}
 
         for item in circuit.data:
             if isinstance(item, CircuitInstruction):
                 instruction = item.operation
-                qargs = list(item.qubits)
-                cargs = list(item.clbits)
+                qargs = item.qubits
+                cargs = item.clbits
             else:  # Legacy tuple form
                 instruction_tuple = cast(tuple[Instruction, list[Any], list[Any]], item)
                 instruction, qargs, cargs = instruction_tuple
 
-            instruction_data = {
-                "name": instruction.name,
-                "params": [float(p) if isinstance(p, int | float) else str(p) for p in instruction.params],
-                "qubits": [circuit.find_bit(q).index for q in qargs],
-                "clbits": [circuit.find_bit(c).index for c in cargs],
-            }
-            circuit_data["instructions"].append(instruction_data)
+            name = encoded_names.get(instruction.name)
+            if name is None:
+                raw_name = instruction.name.encode()
+                name = encoded_names[instruction.name] = _U32.pack(len(raw_name)) + raw_name
+            buf += name
+
+            buf += _U32.pack(len(instruction.params))
+            for param in instruction.params:
+                if isinstance(param, int | float):
+                    buf += b"d"
+                    buf += _F64.pack(float(param))
+                else:
+                    text = str(param).encode()
+                    buf += b"s"
+                    buf += _U32.pack(len(text))
+                    buf += text
+
+            buf += struct.pack(f"<I{len(qargs)}I", len(qargs), *[qubit_indices[q] for q in qargs])
+            buf += struct.pack(f"<I{len(cargs)}I", len(cargs), *[clbit_indices[c] for c in cargs])
 
         # Create hash
-        circuit_str = json.dumps(circuit_data, sort_keys=True)
-        return hashlib.sha256(circuit_str.encode()).hexdigest()
+        if secure:
+            return hashlib.sha256(buf).hexdigest()
+        return hashlib.blake2b(buf, digest_size=16).hexdigest()
 
     @staticmethod
     def hash_simulation_params(circuit: QuantumCircuit, shots: int, backend: str | None = None) -> str:
@@ -474,14 +779,9 @@ class CircuitHasher:
             backend: Backend name
 
         Returns:
-            Hash string
+            Cache key combining the circuit hash, shot count and backend name
         """
-        circuit_hash = CircuitHasher.hash_circuit(circuit)
-
-        params_data = {"circuit_hash": circuit_hash, "shots": shots, "backend": backend}
-
-        params_str = json.dumps(params_data, sort_keys=True)
-        return hashlib.sha256(params_str.encode()).hexdigest()
+        return f"{CircuitHasher.hash_circuit(circuit)}|{shots}|{backend}"
 
 
 class SimulationCache:
@@ -495,13 +795,22 @@ class SimulationCache:
             cache: Cache instance to use
         """
         self.logger = get_logger("simulation_cache")
-        self.cache = cache or IntelligentCache()
+        # Parameter sweeps produce many circuits that are never requested again,
+        # so the default cache only lets repeatedly requested results evict others
+        self.cache = cache or IntelligentCache(backend=MemoryCacheBackend(admission=TinyLFUAdmission()))
         self.hasher = CircuitHasher()
 
         # Add invalidation rule for backend health
         self.cache.add_invalidation_rule(self._backend_health_rule)
 
-    def get(self, circuit: QuantumCircuit, shots: int, backend: str | None = None) -> SimulationResult | None:
+    def get(
+        self,
+        circuit: QuantumCircuit,
+        shots: int,
+        backend: str | None = None,
+        *,
+        cache_key: str | None = None,
+    ) -> SimulationResult | None:
         """
         Get a cached simulation result.
 
@@ -509,11 +818,13 @@ class SimulationCache:
             circuit: Circuit that was simulated
             shots: Number of shots
             backend: Backend that was used
+            cache_key: Precomputed key from ``hash_simulation_params``, to avoid re-hashing
 
         Returns:
             Cached simulation result or None
         """
-        cache_key = self.hasher.hash_simulation_params(circuit, shots, backend)
+        if cache_key is None:
+            cache_key = self.hasher.hash_simulation_params(circuit, shots, backend)
         return self.cache.get(cache_key)
 
     def set(
@@ -523,6 +834,8 @@ class SimulationCache:
         result: SimulationResult,
         backend: str | None = None,
         ttl: float | None = None,
+        *,
+        cache_key: str | None = None,
     ) -> None:
         """
         Cache a simulation result.
@@ -533,8 +846,10 @@ class SimulationCache:
             result: Simulation result
             backend: Backend that was used
             ttl: Time to live in seconds
+            cache_key: Precomputed key from ``hash_simulation_params``, to avoid re-hashing
         """
-        cache_key = self.hasher.hash_simulation_params(circuit, shots, backend)
+        if cache_key is None:
+            cache_key = self.hasher.hash_simulation_params(circuit, shots, backend)
         self.cache.set(cache_key, result, ttl)
 
     def invalidate_backend(self, backend: str) -> int:
@@ -548,14 +863,11 @@ class SimulationCache:
             Number of entries invalidated
         """
 
+        suffix = f"|{backend}"
+
         def backend_rule(key: str, value: Any) -> bool:
-            # Check if the cached result is for the specified backend
-            try:
-                # Parse the key to extract backend information
-                # This is a simplified implementation
-                return backend in key
-            except Exception:
-                return False
+            # Keys from hash_simulation_params end with the backend name
+            return key.endswith(suffix)
 
         # Add temporary rule and invalidate
         self.cache.add_invalidation_rule(backend_rule)
@@ -637,6 +949,10 @@ class Memoizer:
 
     def _generate_cache_key(self, func: Callable[..., Any], args: tuple[Any, ...], kwargs: Mapping[str, Any]) -> str:
         """Generate a cache key for a function call."""
+        fast_key = self._fast_cache_key(func, args, kwargs)
+        if fast_key is not None:
+            return fast_key
+
         # Create a deterministic representation of the function call
         key_data = {
             "function": func.__name__,
@@ -648,6 +964,29 @@ class Memoizer:
         key_str = json.dumps(key_data, sort_keys=True)
         return hashlib.sha256(key_str.encode()).hexdigest()
 
+    @staticmethod
+    def _fast_cache_key(func: Callable[..., Any], args: tuple[Any, ...], kwargs: Mapping[str, Any]) -> str | None:
+        """Key calls made only with scalars and circuits without JSON encoding.
+
+        The repr of the call is hashed rather than the builtin ``hash()``, which
+        conflates values such as ``-1``/``-2`` and ``1``/``1.0``/``True``.
+        Returns None when any argument needs the general serializer.
+        """
+        parts: list[Any] = [func.__module__, func.__qualname__]
+        values: Iterable[Any] = args
+        if kwargs:
+            names = sorted(kwargs)
+            parts.append(tuple(names))
+            values = itertools.chain(args, (kwargs[name] for name in names))
+        for value in values:
+            if type(value) in _SCALAR_KEY_TYPES:
+                parts.append(value)
+            elif isinstance(value, QuantumCircuit):
+                parts.append(("QuantumCircuit", CircuitHasher.hash_circuit(value)))
+            else:
+                return None
+        return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
     def _serialize_args(self, args: Any) -> Any:
         """Serialize arguments for cache key generation."""
         if isinstance(args, str | int | float | bool | type(None)):
@@ -707,8 +1046,11 @@ def cached_simulate(ttl: float | None = None) -> Callable[[SimulationCallable],
             # Get simulation cache
             cache = get_simulation_cache()
 
+            # Hash the circuit once for both the lookup and the store
+            cache_key = cache.hasher.hash_simulation_params(circuit, shots, backend)
+
             # Try to get from cache
-            cached_result = cache.get(circuit, shots, backend)
+            cached_result = cache.get(circuit, shots, backend, cache_key=cache_key)
             if cached_result is not None:
                 return cached_result
 
@@ -716,7 +1058,7 @@ def cached_simulate(ttl: float | None = None) -> Callable[[SimulationCallable],
             result = func(circuit, shots, backend, **kwargs)
 
             # Cache result
-            cache.set(circuit, shots, result, backend, ttl)
+            cache.set(circuit, shots, result, backend, ttl, cache_key=cache_key)
 
             return result
 
@@ -737,3 +1079,43 @@ def memoize(ttl: float | None = None) -> Callable[[Callable[P, R]], Callable[P,
     """
     memoizer = get_memoizer()
     return memoizer.memoize(ttl)
+
+
+def memoize_hashable(
+    maxsize: int | None = 1024, ttl: float | None = None
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Decorator for memoizing pure functions whose arguments are all hashable.
+
+    Unlike :func:`memoize`, lookups go through :func:`functools.lru_cache`
+    instead of the shared :class:`IntelligentCache`, so there is no key
+    serialization, statistics or rule-based invalidation. Calling the
+    decorated function with an unhashable argument raises ``TypeError``.
+
+    Args:
+        maxsize: Maximum number of cached results (None for unbounded)
+        ttl: Time to live for cached results. Expiry is bucketed to multiples
+            of ``ttl``, so a result may be recomputed early but is never served
+            after ``ttl`` seconds.
+
+    Returns:
+        Decorated function exposing ``cache_info()`` and ``cache_clear()``
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        if ttl is None:
+            return cast(Callable[P, R], lru_cache(maxsize=maxsize, typed=True)(func))
+
+        @lru_cache(maxsize=maxsize, typed=True)
+        def cached(epoch: int, /, *args: Any, **kwargs: Any) -> R:
+            return func(*args, **kwargs)
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            return cached(int(time.monotonic() // ttl), *args, **kwargs)  # type: ignore[arg-type]
+
+        wrapper.cache_info = cached.cache_info  # type: ignore[attr-defined]
+        wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
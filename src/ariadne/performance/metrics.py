@@ -2,15 +2,54 @@
 
 from __future__ import annotations
 
+import json
+import sys
 import time
 import tracemalloc
 from collections.abc import Callable, Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from statistics import mean, median, pstdev
-from typing import Any
+from typing import Any, Literal
 
+import numpy as np
 
-@dataclass
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+
+    def _dumps_rows(rows: list[dict[str, Any]]) -> bytes:
+        return json.dumps(rows).encode()
+
+else:
+
+    def _dumps_rows(rows: list[dict[str, Any]]) -> bytes:
+        return orjson.dumps(rows, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+MemoryProfiler = Literal["rusage", "tracemalloc", "off"]
+
+# Numeric ExecutionTelemetry fields kept as aggregator columns, and their initial capacity
+_TELEMETRY_COLUMNS: dict[str, type[np.generic]] = {
+    "iteration": np.int64,
+    "shots": np.int64,
+    "duration_s": np.float64,
+    "start_time": np.float64,
+    "end_time": np.float64,
+    "peak_memory_kb": np.float64,
+    "success": np.bool_,
+}
+_INITIAL_CAPACITY = 16
+
+# Below this many successful samples the statistics module beats NumPy's call overhead
+_VECTORIZE_MIN_SAMPLES = 32
+
+
+@dataclass(slots=True)
 class ExecutionTelemetry:
     """Telemetry captured for a single benchmark execution."""
 
@@ -27,20 +66,10 @@ class ExecutionTelemetry:
     def to_dict(self) -> dict[str, Any]:
         """Convert telemetry data to a serialisable dictionary."""
 
-        return {
-            "backend": self.backend,
-            "iteration": self.iteration,
-            "shots": self.shots,
-            "duration_s": self.duration_s,
-            "start_time": self.start_time,
-            "end_time": self.end_time,
-            "peak_memory_kb": self.peak_memory_kb,
-            "success": self.success,
-            "error": self.error,
-        }
+        return {name: getattr(self, name) for name in _EXECUTION_TELEMETRY_FIELDS}
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkSummary:
     """Aggregated statistics for a benchmark run."""
 
@@ -60,20 +89,18 @@ class BenchmarkSummary:
     def to_dict(self) -> dict[str, Any]:
         """Convert the summary into a serialisable dictionary."""
 
-        return {
-            "backend": self.backend,
-            "iterations": self.iterations,
-            "successes": self.successes,
-            "failures": self.failures,
-            "avg_time_s": self.avg_time_s,
-            "min_time_s": self.min_time_s,
-            "max_time_s": self.max_time_s,
-            "median_time_s": self.median_time_s,
-            "std_time_s": self.std_time_s,
-            "peak_memory_kb": self.peak_memory_kb,
-            "throughput_shots_per_s": self.throughput_shots_per_s,
-            "success_rate": self.success_rate,
-        }
+        return {name: getattr(self, name) for name in _BENCHMARK_SUMMARY_FIELDS}
+
+
+# All fields are scalars, so a flat getattr copy is equivalent to (and much cheaper than) asdict()
+_EXECUTION_TELEMETRY_FIELDS = tuple(field.name for field in fields(ExecutionTelemetry))
+_BENCHMARK_SUMMARY_FIELDS = tuple(field.name for field in fields(BenchmarkSummary))
+
+
+def dump_telemetry(samples: Iterable[ExecutionTelemetry]) -> bytes:
+    """Serialise telemetry samples to a JSON array, using orjson when installed."""
+
+    return _dumps_rows([sample.to_dict() for sample in samples])
 
 
 class BenchmarkMetricsAggregator:
@@ -82,45 +109,78 @@ class BenchmarkMetricsAggregator:
     def __init__(self, backend: str, shots: int) -> None:
         self.backend = backend
         self.shots = shots
-        self._telemetry: list[ExecutionTelemetry] = []
+        # Numeric telemetry fields are stored column-wise, grown geometrically
+        self._size = 0
+        self._columns: dict[str, np.ndarray] = {
+            name: np.empty(_INITIAL_CAPACITY, dtype=dtype) for name, dtype in _TELEMETRY_COLUMNS.items()
+        }
+        self._backends: list[str] = []
+        self._errors: list[str | None] = []
 
     @property
     def telemetry(self) -> Iterable[ExecutionTelemetry]:
         """Return recorded telemetry samples."""
 
-        return tuple(self._telemetry)
+        rows = zip(*(column[: self._size].tolist() for column in self._columns.values()), strict=True)
+        return tuple(
+            ExecutionTelemetry(backend=backend, error=error, **dict(zip(_TELEMETRY_COLUMNS, row, strict=True)))
+            for backend, error, row in zip(self._backends, self._errors, rows, strict=True)
+        )
 
     def add(self, sample: ExecutionTelemetry) -> None:
         """Record a telemetry sample."""
 
-        self._telemetry.append(sample)
+        index = self._size
+        if index == len(self._columns["duration_s"]):
+            for name, column in self._columns.items():
+                grown = np.empty(2 * len(column), dtype=column.dtype)
+                grown[:index] = column
+                self._columns[name] = grown
+        for name, column in self._columns.items():
+            column[index] = getattr(sample, name)
+        self._backends.append(sample.backend)
+        self._errors.append(sample.error)
+        self._size = index + 1
 
     def summary(self) -> BenchmarkSummary:
         """Compute a summary over collected telemetry."""
 
-        iterations = len(self._telemetry)
-        successes = [sample for sample in self._telemetry if sample.success]
-        failures = iterations - len(successes)
-
-        if successes:
-            durations = [sample.duration_s for sample in successes]
+        iterations = self._size
+        success = self._columns["success"][:iterations]
+        durations_array = self._columns["duration_s"][:iterations][success]
+        success_count = len(durations_array)
+        failures = iterations - success_count
+
+        avg_time: float | None
+        min_time: float | None
+        max_time: float | None
+        median_time: float | None
+        std_time: float | None
+        if success_count >= _VECTORIZE_MIN_SAMPLES:
+            avg_time = float(durations_array.mean())
+            min_time = float(durations_array.min())
+            max_time = float(durations_array.max())
+            median_time = float(np.median(durations_array))
+            std_time = float(durations_array.std())
+        elif success_count:
+            durations = durations_array.tolist()
             avg_time = mean(durations)
             min_time = min(durations)
             max_time = max(durations)
             median_time = median(durations)
             std_time = pstdev(durations) if len(durations) > 1 else 0.0
-            throughput = self.shots / avg_time if avg_time > 0 else None
         else:
-            avg_time = min_time = max_time = median_time = std_time = throughput = None
+            avg_time = min_time = max_time = median_time = std_time = None
+        throughput = self.shots / avg_time if avg_time else None
 
-        peak_memory_kb = max(sample.peak_memory_kb for sample in self._telemetry) if self._telemetry else None
+        peak_memory_kb = float(self._columns["peak_memory_kb"][:iterations].max()) if iterations else None
 
-        success_rate = len(successes) / iterations if iterations else 0.0
+        success_rate = success_count / iterations if iterations else 0.0
 
         return BenchmarkSummary(
             backend=self.backend,
             iterations=iterations,
-            successes=len(successes),
+            successes=success_count,
             failures=failures,
             avg_time_s=avg_time,
             min_time_s=min_time,
@@ -133,18 +193,39 @@ class BenchmarkMetricsAggregator:
         )
 
 
+def _max_rss_kb() -> float:
+    """Peak resident set size of this process so far, in kilobytes."""
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    return peak_rss / 1024 if sys.platform == "darwin" else float(peak_rss)
+
+
 def measure_simulation_run(
     func: Callable[[], Any],
     *,
     backend: str,
     iteration: int,
     shots: int,
+    memory_profiler: MemoryProfiler = "tracemalloc",
 ) -> tuple[Any | None, ExecutionTelemetry]:
-    """Execute ``func`` while capturing performance telemetry."""
-
-    tracemalloc.start()
-    start_wall = time.time()
-    start_perf = time.perf_counter()
+    """Execute ``func`` while capturing performance telemetry.
+
+    ``memory_profiler`` selects how ``peak_memory_kb`` is measured:
+    ``"tracemalloc"`` reports the peak of Python allocations made by ``func``,
+    at a significant runtime cost. ``"rusage"`` adds no overhead but only
+    reports how far ``func`` raised the process's peak RSS. That is 0 unless
+    the run set a new high-water mark, and always 0 where the ``resource``
+    module is unavailable. ``"off"`` skips measurement.
+    """
+
+    use_tracemalloc = memory_profiler == "tracemalloc"
+    use_rusage = memory_profiler == "rusage" and resource is not None
+    if use_tracemalloc:
+        tracemalloc.start()
+    start_rss_kb = _max_rss_kb() if use_rusage else 0.0
+    start_wall_ns = time.time_ns()
+    start_perf_ns = time.perf_counter_ns()
 
     try:
         result = func()
@@ -155,20 +236,26 @@ def measure_simulation_run(
         success = False
         error = str(exc)
     finally:
-        _, peak_bytes = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-
-    end_perf = time.perf_counter()
-    end_wall = time.time()
+        end_perf_ns = time.perf_counter_ns()
+        if use_tracemalloc:
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            peak_memory_kb = peak_bytes / 1024
+        elif use_rusage:
+            peak_memory_kb = _max_rss_kb() - start_rss_kb
+        else:
+            peak_memory_kb = 0.0
 
+    # Derive the wall-clock end from the monotonic duration instead of a second clock read
+    duration_ns = end_perf_ns - start_perf_ns
     telemetry = ExecutionTelemetry(
         backend=backend,
         iteration=iteration,
         shots=shots,
-        duration_s=end_perf - start_perf,
-        start_time=start_wall,
-        end_time=end_wall,
-        peak_memory_kb=peak_bytes / 1024,
+        duration_s=duration_ns * 1e-9,
+        start_time=start_wall_ns * 1e-9,
+        end_time=(start_wall_ns + duration_ns) * 1e-9,
+        peak_memory_kb=peak_memory_kb,
         success=success,
         error=error,
     )
@@ -19,6 +19,7 @@ from pathlib import Path
 import numpy as np
 from qiskit import QuantumCircuit
 
+from .distributions import probability_matrix
 from .router import is_cuda_available, is_metal_available, simulate
 from .types import BackendType
 
@@ -44,33 +45,30 @@ def _normalize_counts(counts: dict[str, int]) -> tuple[np.ndarray, list[str]]:
     return vec, keys
 
 
-def jensen_shannon_divergence(c1: dict[str, int], c2: dict[str, int]) -> float:
-    """Compute Jensen–Shannon divergence between two count dictionaries.
-
-    Returns value in [0, 1]. 0 indicates identical distributions.
-    """
-    # Align keys
-    all_keys = sorted(set(c1.keys()) | set(c2.keys()))
-    if not all_keys:
-        return 0.0
+def _kl(a: np.ndarray, b: np.ndarray) -> float:
+    mask = (a > 0) & (b > 0)
+    return float(np.sum(a[mask] * (np.log2(a[mask]) - np.log2(b[mask]))))
 
-    def probs(counts: dict[str, int]) -> np.ndarray:
-        total = float(sum(counts.values())) or 1.0
-        return np.array([counts.get(k, 0) / total for k in all_keys], dtype=float)
 
-    p = probs(c1)
-    q = probs(c2)
+def _js_distance(p: np.ndarray, q: np.ndarray) -> float:
+    """Jensen–Shannon distance between two aligned probability vectors."""
     m = 0.5 * (p + q)
-
-    def _kl(a: np.ndarray, b: np.ndarray) -> float:
-        mask = (a > 0) & (b > 0)
-        return float(np.sum(a[mask] * (np.log2(a[mask]) - np.log2(b[mask]))))
-
     jsd = 0.5 * _kl(p, m) + 0.5 * _kl(q, m)
     # Return the square root (Jensen–Shannon distance) for interpretability
     return float(np.sqrt(jsd))
 
 
+def jensen_shannon_divergence(c1: dict[str, int], c2: dict[str, int]) -> float:
+    """Compute Jensen–Shannon divergence between two count dictionaries.
+
+    Returns value in [0, 1]. 0 indicates identical distributions.
+    """
+    probs = probability_matrix([c1, c2])
+    if probs.shape[1] == 0:
+        return 0.0
+    return _js_distance(probs[0], probs[1])
+
+
 def load_circuit(path_or_name: str | Path) -> QuantumCircuit:
     """Load a circuit from a QASM file or dataset name.
 
@@ -133,11 +131,13 @@ def compare_results(results: list[BackendComparison], metric: str = "jsd") -> di
     """
     distances: dict[str, float] = {}
     ok = [r for r in results if r.success]
+    # Align every distribution once; each pair then compares two matrix rows
+    probs = probability_matrix([r.counts for r in ok])
     for i in range(len(ok)):
         for j in range(i + 1, len(ok)):
             a, b = ok[i], ok[j]
             if metric == "jsd":
-                d = jensen_shannon_divergence(a.counts, b.counts)
+                d = _js_distance(probs[i], probs[j])
             else:
                 raise ValueError(f"Unsupported metric: {metric}")
             distances[f"{a.backend}|{b.backend}"] = d
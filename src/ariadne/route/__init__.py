@@ -1,5 +1,5 @@
 """Route analysis module for Ariadne quantum router."""
 
-from .analyze import analyze_circuit, is_clifford_circuit
+from .analyze import analyze_circuit, analyze_circuit_fused, is_clifford_circuit
 
-__all__ = ["analyze_circuit", "is_clifford_circuit"]
+__all__ = ["analyze_circuit", "analyze_circuit_fused", "is_clifford_circuit"]
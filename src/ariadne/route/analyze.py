@@ -9,64 +9,73 @@ from qiskit import QuantumCircuit
 CLIFFORD_ONE_Q = {"i", "x", "y", "z", "h", "s", "sdg", "sx", "sxdg"}
 CLIFFORD_TWO_Q = {"cx", "cz", "swap"}
 
+# Frozen lookup tables so each instruction costs a single hash probe.  Only gate
+# names the Stim converter understands are treated as Clifford; ``reset`` is a
+# stabilizer operation Stim simulates natively, so it does not disqualify a circuit.
+_NON_GATE_OPS = frozenset({"measure", "barrier", "delay"})
+_CLIFFORD_GATES = frozenset(CLIFFORD_ONE_Q | CLIFFORD_TWO_Q | {"id", "reset"})
+_CLIFFORD_OR_NON_GATE = _CLIFFORD_GATES | _NON_GATE_OPS
+
 
 def is_clifford_circuit(circ: QuantumCircuit, properties: dict[str, Any] | None = None) -> bool:
     if properties is None:
-        # Fallback for standalone use
-        for inst in circ.data:
-            name = inst.operation.name
-            if name in {"measure", "barrier", "delay"}:
-                continue
-            if (name not in CLIFFORD_ONE_Q) and (name not in CLIFFORD_TWO_Q):
-                return False
-        return True
+        # Fallback for standalone use: ``count_ops`` tallies names natively, which is far
+        # cheaper than a Python-level walk over every instruction
+        return bool(circ.count_ops().keys() <= _CLIFFORD_OR_NON_GATE)
 
     # Optimized calculation using pre-calculated properties
     return cast(int, properties.get("total_gates")) == cast(int, properties.get("clifford_gates"))
 
 
-def _get_circuit_properties(circ: QuantumCircuit) -> dict[str, int | set[str] | dict[str, int]]:
-    properties: dict[str, int | set[str] | dict[str, int]] = {
-        "total_gates": 0,
-        "two_qubit_gates": 0,
-        "parameterized_gates": 0,
-        "clifford_gates": 0,
-        "gate_counts": {},
-        "gate_types": set(),
-    }
+def _circuit_depth(circ: QuantumCircuit, properties: dict[str, Any] | None = None) -> int:
+    """Return circuit depth, reusing a value cached in ``properties`` when available."""
+    if properties is not None and "depth" in properties:
+        return cast(int, properties["depth"])
+    return int(circ.depth())
 
-    for inst in circ.data:
-        name = inst.operation.name
-        if name in {"measure", "barrier", "delay"}:
-            continue
 
-        properties["total_gates"] = cast(int, properties["total_gates"]) + 1
-        cast(set, properties["gate_types"]).add(name)
-        gate_counts = cast(dict, properties["gate_counts"])
-        gate_counts[name] = gate_counts.get(name, 0) + 1
+def _gate_counts(circ: QuantumCircuit) -> dict[str, int]:
+    """Per-name gate tally, excluding measurements and directives.
 
-        if inst.operation.num_qubits == 2:
-            properties["two_qubit_gates"] = cast(int, properties["two_qubit_gates"]) + 1
+    ``count_ops`` is tallied natively by Qiskit, so class counts such as the number
+    of Clifford gates reduce to sums over the handful of distinct names instead of
+    a Python-level pass over every instruction.
+    """
+    return {name: count for name, count in circ.count_ops().items() if name not in _NON_GATE_OPS}
 
-        if hasattr(inst.operation, "params") and inst.operation.params:
-            properties["parameterized_gates"] = cast(int, properties["parameterized_gates"]) + 1
 
-        if (name in CLIFFORD_ONE_Q) or (name in CLIFFORD_TWO_Q):
-            properties["clifford_gates"] = cast(int, properties["clifford_gates"]) + 1
+def _get_circuit_properties(circ: QuantumCircuit) -> dict[str, int | set[str] | dict[str, int]]:
+    # One walk tallies names and the per-instruction classes; Clifford counts then
+    # come from a lookup over the handful of distinct names
+    gate_counts: dict[str, int] = {}
+    two_qubit_gates = 0
+    parameterized_gates = 0
+    for inst in circ.data:
+        operation = inst.operation
+        name = operation.name
+        if name in _NON_GATE_OPS:
+            continue
 
-    return properties
+        gate_counts[name] = gate_counts.get(name, 0) + 1
+        if operation.num_qubits == 2:
+            two_qubit_gates += 1
+        if getattr(operation, "params", None):
+            parameterized_gates += 1
+
+    return {
+        "total_gates": sum(gate_counts.values()),
+        "two_qubit_gates": two_qubit_gates,
+        "parameterized_gates": parameterized_gates,
+        "clifford_gates": sum(count for name, count in gate_counts.items() if name in _CLIFFORD_GATES),
+        "gate_counts": gate_counts,
+        "gate_types": set(gate_counts),
+    }
 
 
 def calculate_gate_entropy(circ: QuantumCircuit, properties: dict[str, Any] | None = None) -> float:
     """Calculate Shannon entropy of gate distribution."""
-    gate_counts: dict[str, int] = {}
-    total_gates = 0
-
-    for instruction in circ.data:
-        name = instruction.operation.name
-        if name not in ["measure", "barrier", "delay"]:
-            gate_counts[name] = gate_counts.get(name, 0) + 1
-            total_gates += 1
+    gate_counts = cast(dict[str, int], properties["gate_counts"]) if properties is not None else _gate_counts(circ)
+    total_gates = sum(gate_counts.values())
 
     if total_gates == 0:
         return 0.0
@@ -98,16 +107,17 @@ def estimate_entanglement_entropy(circ: QuantumCircuit, properties: dict[str, An
     return cast(float, max_entropy * saturation_factor)
 
 
-def estimate_quantum_volume(circ: QuantumCircuit) -> float:
+def estimate_quantum_volume(circ: QuantumCircuit, properties: dict[str, Any] | None = None) -> float:
     """Estimate quantum volume based on depth and width."""
     # Quantum volume is 2^m where m = min(depth, width)
-    m = min(circ.depth(), circ.num_qubits)
+    m = min(_circuit_depth(circ, properties), circ.num_qubits)
     return float(2**m)
 
 
 def calculate_parallelization_factor(circ: QuantumCircuit, properties: dict[str, Any] | None = None) -> float:
     """Calculate how much parallelization is possible."""
-    if circ.depth() == 0:
+    depth = _circuit_depth(circ, properties)
+    if depth == 0:
         return 1.0
 
     if properties is None:
@@ -120,7 +130,7 @@ def calculate_parallelization_factor(circ: QuantumCircuit, properties: dict[str,
 
     # Parallelization factor = total_gates / depth
     # Higher values indicate more parallel execution possible
-    return cast(float, total_gates / circ.depth())
+    return total_gates / depth
 
 
 def estimate_noise_susceptibility(circ: QuantumCircuit, properties: dict[str, Any] | None = None) -> float:
@@ -132,7 +142,7 @@ def estimate_noise_susceptibility(circ: QuantumCircuit, properties: dict[str, An
     two_qubit_gates = cast(int, properties["two_qubit_gates"])
 
     # Factors: depth (decoherence), two-qubit gates (higher error), total operations
-    depth_factor = min(1.0, float(circ.depth()) / 100.0)  # Normalize to reasonable scale
+    depth_factor = min(1.0, float(_circuit_depth(circ, properties)) / 100.0)  # Normalize to reasonable scale
 
     if total_gates == 0:
         return 0.0
@@ -153,7 +163,7 @@ def estimate_classical_complexity(circ: QuantumCircuit, properties: dict[str, An
     # Non-Clifford circuits are exponential
     # Complexity roughly 2^n * depth
     base_complexity = 2**circ.num_qubits
-    depth_factor = max(1, circ.depth())
+    depth_factor = max(1, _circuit_depth(circ, properties))
 
     return float(base_complexity * math.log2(depth_factor + 1))
 
@@ -252,10 +262,12 @@ def approximate_treewidth(g: nx.Graph) -> int:
 
 def clifford_ratio(circ: QuantumCircuit, properties: dict[str, Any] | None = None) -> float:
     if properties is None:
-        properties = _get_circuit_properties(circ)
-
-    total = cast(int, properties["total_gates"])
-    cliff = cast(int, properties["clifford_gates"])
+        gate_counts = _gate_counts(circ)
+        total = sum(gate_counts.values())
+        cliff = sum(count for name, count in gate_counts.items() if name in _CLIFFORD_GATES)
+    else:
+        total = cast(int, properties["total_gates"])
+        cliff = cast(int, properties["clifford_gates"])
 
     return float(cliff) / float(total) if total else 1.0
 
@@ -282,17 +294,82 @@ def two_qubit_depth(circ: QuantumCircuit) -> int:
     return depth + (1 if current_layer_qubits else 0)
 
 
-def analyze_circuit(circ: QuantumCircuit) -> dict[str, float | int | bool]:
-    """Enhanced circuit analysis with advanced entropy and complexity metrics."""
+def analyze_circuit_fused(circ: QuantumCircuit) -> dict[str, float | int | bool]:
+    """Lightweight single-pass analysis for callers that only need gate statistics.
+
+    Gate counts, the Clifford flag and ratio, gate entropy and circuit depth are
+    accumulated in one walk over ``circ.data`` instead of separate calls to
+    :func:`is_clifford_circuit`, :func:`analyze_circuit` and ``circ.depth()``.
+    Depth follows Qiskit's convention: directives such as barriers are ignored
+    and classical bits count as wires.
+    """
+    qubit_index = {qubit: idx for idx, qubit in enumerate(circ.qubits)}
+    clbit_index = {clbit: circ.num_qubits + idx for idx, clbit in enumerate(circ.clbits)}
+    last_layer = [0] * (circ.num_qubits + circ.num_clbits)
+
+    gate_counts: dict[str, int] = {}
+    total_gates = 0
+    clifford_gates = 0
+    num_1q = 0
+    num_2q = 0
+
+    for inst in circ.data:
+        operation = inst.operation
+        name = operation.name
+
+        if not getattr(operation, "_directive", False):
+            wires = [qubit_index[q] for q in inst.qubits] + [clbit_index[c] for c in inst.clbits]
+            if wires:
+                layer = 1 + max(last_layer[w] for w in wires)
+                for w in wires:
+                    last_layer[w] = layer
+
+        if name in _NON_GATE_OPS:
+            continue
+
+        total_gates += 1
+        gate_counts[name] = gate_counts.get(name, 0) + 1
+        if name in _CLIFFORD_GATES:
+            clifford_gates += 1
+        if operation.num_qubits == 1:
+            num_1q += 1
+        elif operation.num_qubits == 2:
+            num_2q += 1
+
+    gate_entropy = 0.0
+    for count in gate_counts.values():
+        p = count / total_gates
+        gate_entropy -= p * math.log2(p)
+
+    return {
+        "num_qubits": circ.num_qubits,
+        "depth": max(last_layer, default=0),
+        "total_gates": total_gates,
+        "clifford_gates": clifford_gates,
+        "clifford_ratio": float(clifford_gates) / float(total_gates) if total_gates else 1.0,
+        "is_clifford": clifford_gates == total_gates,
+        "num_1q": num_1q,
+        "num_2q": num_2q,
+        "gate_entropy": gate_entropy,
+    }
+
+
+def analyze_circuit(circ: QuantumCircuit, depth: int | None = None) -> dict[str, float | int | bool]:
+    """Enhanced circuit analysis with advanced entropy and complexity metrics.
+
+    ``depth`` may be passed by callers that already know ``circ.depth()``.
+    """
 
-    # Perform single pass analysis to gather all gate properties
-    properties = _get_circuit_properties(circ)
+    # Perform single pass analysis to gather all gate properties; depth is a full
+    # DAG walk, so compute it once and let every metric below reuse it
+    properties: dict[str, Any] = dict(_get_circuit_properties(circ))
+    properties["depth"] = int(circ.depth()) if depth is None else depth
     g = interaction_graph(circ)
 
     # Basic metrics
     basic_metrics = {
         "num_qubits": circ.num_qubits,
-        "depth": int(circ.depth()),
+        "depth": properties["depth"],
         "two_qubit_depth": two_qubit_depth(circ),
         "edges": g.number_of_edges(),
         "treewidth_estimate": approximate_treewidth(g),
@@ -307,7 +384,7 @@ def analyze_circuit(circ: QuantumCircuit) -> dict[str, float | int | bool]:
     advanced_metrics = {
         "gate_entropy": calculate_gate_entropy(circ, properties=properties),
         "entanglement_entropy_estimate": estimate_entanglement_entropy(circ, properties=properties),
-        "quantum_volume_estimate": estimate_quantum_volume(circ),
+        "quantum_volume_estimate": estimate_quantum_volume(circ, properties=properties),
         "parallelization_factor": calculate_parallelization_factor(circ, properties=properties),
         "noise_susceptibility": estimate_noise_susceptibility(circ, properties=properties),
         "classical_simulation_complexity": estimate_classical_complexity(circ, properties=properties),
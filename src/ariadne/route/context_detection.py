@@ -19,6 +19,9 @@ from qiskit import QuantumCircuit
 from ..router import BackendType
 from .enhanced_router import HardwareProfile, PerformancePreferences, UserContext, WorkflowType
 
+_NON_GATE_OPS = frozenset({"measure", "barrier", "delay"})
+_SIMPLE_CLIFFORD_GATES = frozenset({"h", "x", "y", "z", "s", "sdg", "cx", "cz"})
+
 
 @dataclass
 class CircuitPattern:
@@ -132,13 +135,7 @@ class CircuitFamilyDetector:
 
     def _count_gates(self, circuit: QuantumCircuit) -> dict[str, int]:
         """Count gate types in circuit."""
-        gate_counts: defaultdict[str, int] = defaultdict(int)
-
-        for instruction in circuit.data:
-            if instruction.operation.name not in ["measure", "barrier", "delay"]:
-                gate_counts[instruction.operation.name] += 1
-
-        return dict(gate_counts)
+        return {name: count for name, count in circuit.count_ops().items() if name not in _NON_GATE_OPS}
 
 
 class WorkflowDetector:
@@ -466,32 +463,21 @@ class ContextDetector:
         avg_depth = sum(c.depth() for c in circuits) / len(circuits)
 
         # Analyze gate usage
-        all_gates: list[str] = []
+        gate_counts: defaultdict[str, int] = defaultdict(int)
         clifford_count = 0
 
         for circuit in circuits:
-            circuit_gates = []
-            is_clifford = True
-
-            for instruction in circuit.data:
-                gate_name = instruction.operation.name
-                if gate_name not in ["measure", "barrier", "delay"]:
-                    circuit_gates.append(gate_name)
-                    # Simple Clifford check
-                    if gate_name not in ["h", "x", "y", "z", "s", "sdg", "cx", "cz"]:
-                        is_clifford = False
-
-            all_gates.extend(circuit_gates)
-            if is_clifford:
+            circuit_gates = {name: count for name, count in circuit.count_ops().items() if name not in _NON_GATE_OPS}
+            for gate_name, count in circuit_gates.items():
+                gate_counts[gate_name] += count
+
+            # Simple Clifford check
+            if circuit_gates.keys() <= _SIMPLE_CLIFFORD_GATES:
                 clifford_count += 1
 
         clifford_ratio = clifford_count / len(circuits)
 
         # Most common gates
-        gate_counts: defaultdict[str, int] = defaultdict(int)
-        for gate in all_gates:
-            gate_counts[gate] += 1
-
         common_gates = [gate for gate, count in sorted(gate_counts.items(), key=lambda x: x[1], reverse=True)[:5]]
 
         # Detect circuit families
@@ -510,9 +496,9 @@ class ContextDetector:
 
         # Estimate entanglement complexity (simplified)
         total_two_qubit_gates = sum(
-            sum(1 for inst, _, _ in circuit.data if inst.num_qubits == 2) for circuit in circuits
+            sum(1 for instruction in circuit.data if instruction.operation.num_qubits == 2) for circuit in circuits
         )
-        total_gates = len(all_gates)
+        total_gates = sum(gate_counts.values())
         entanglement_complexity = total_two_qubit_gates / max(total_gates, 1)
 
         return CircuitPattern(
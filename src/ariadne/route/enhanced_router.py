@@ -6,17 +6,18 @@ Next-generation intelligent routing with multiple optimization strategies.
 
 from __future__ import annotations
 
-import math
 import os
 import platform
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Any
+from typing import Any, cast
 
 from qiskit import QuantumCircuit
 
-from ..route.analyze import analyze_circuit, is_clifford_circuit, should_use_tensor_network
+from ..core.cache import CircuitAnalysisCache
+from ..route.analyze import analyze_circuit, calculate_gate_entropy, is_clifford_circuit, should_use_tensor_network
 from ..route.mps_analyzer import should_use_mps
 from ..route.topology_analyzer import detect_layout_properties
 from ..types import BackendType, RoutingDecision
@@ -105,6 +106,19 @@ class QuantumRouterStrategy(ABC):
 class SpeedOptimizerStrategy(QuantumRouterStrategy):
     """Optimize for fastest execution."""
 
+    BASE_SPEEDS: dict[BackendType, float] = {
+        BackendType.STIM: 10.0,
+        BackendType.CUDA: 9.0,
+        BackendType.JAX_METAL: 8.0,
+        BackendType.TENSOR_NETWORK: 6.0,
+        BackendType.DDSIM: 5.0,
+        BackendType.QISKIT: 3.0,
+        BackendType.CIRQ: 6.0,
+        BackendType.PENNYLANE: 6.5,
+        BackendType.QULACS: 7.5,
+        BackendType.OPENCL: 6.0,
+    }
+
     def score_backend(
         self,
         circuit: QuantumCircuit,
@@ -112,43 +126,30 @@ class SpeedOptimizerStrategy(QuantumRouterStrategy):
         context: UserContext,
         analysis: dict[str, Any],
     ) -> RouteScore:
-        base_speeds = {
-            BackendType.STIM: 10.0,
-            BackendType.CUDA: 9.0,
-            BackendType.JAX_METAL: 8.0,
-            BackendType.TENSOR_NETWORK: 6.0,
-            BackendType.DDSIM: 5.0,
-            BackendType.QISKIT: 3.0,
-            BackendType.CIRQ: 6.0,
-            BackendType.PENNYLANE: 6.5,
-            BackendType.QULACS: 7.5,
-            BackendType.OPENCL: 6.0,
-        }
-
-        speed_score = base_speeds.get(backend, 1.0)
+        speed_score = self.BASE_SPEEDS.get(backend, 1.0)
 
         # Clifford circuit optimization
         if analysis["is_clifford"]:
-            if backend == BackendType.STIM:
+            if backend is BackendType.STIM:
                 speed_score = 10.0
-            elif backend == BackendType.DDSIM:
+            elif backend is BackendType.DDSIM:
                 # DDSIM is also good for Clifford circuits as a fallback
                 speed_score = 9.0
-            elif backend == BackendType.QISKIT:
+            elif backend is BackendType.QISKIT:
                 # Qiskit can handle Clifford circuits well
                 speed_score = 7.0
-        elif backend == BackendType.STIM:
+        elif backend is BackendType.STIM:
             # STIM can only handle Clifford circuits
             speed_score = 0.0
 
         # Hardware acceleration (but don't let it override Clifford optimizations)
         if not analysis["is_clifford"]:
-            if backend == BackendType.JAX_METAL and context.hardware_profile.apple_silicon:
+            if backend is BackendType.JAX_METAL and context.hardware_profile.apple_silicon:
                 speed_score *= 1.8
-            elif backend == BackendType.CUDA and context.hardware_profile.cuda_capable:
+            elif backend is BackendType.CUDA and context.hardware_profile.cuda_capable:
                 speed_score *= 2.0
 
-        if backend == BackendType.CUDA and not context.hardware_profile.cuda_capable:
+        if backend is BackendType.CUDA and not context.hardware_profile.cuda_capable:
             speed_score = 0.0
 
         return RouteScore(
@@ -164,6 +165,19 @@ class SpeedOptimizerStrategy(QuantumRouterStrategy):
 class AccuracyOptimizerStrategy(QuantumRouterStrategy):
     """Optimize for numerical accuracy."""
 
+    BASE_ACCURACY: dict[BackendType, float] = {
+        BackendType.STIM: 10.0,
+        BackendType.TENSOR_NETWORK: 9.0,
+        BackendType.DDSIM: 8.5,
+        BackendType.QISKIT: 8.0,
+        BackendType.CUDA: 7.5,
+        BackendType.JAX_METAL: 7.0,
+        BackendType.CIRQ: 8.0,
+        BackendType.PENNYLANE: 8.0,
+        BackendType.QULACS: 8.0,
+        BackendType.OPENCL: 7.0,
+    }
+
     def score_backend(
         self,
         circuit: QuantumCircuit,
@@ -171,31 +185,18 @@ class AccuracyOptimizerStrategy(QuantumRouterStrategy):
         context: UserContext,
         analysis: dict[str, Any],
     ) -> RouteScore:
-        base_accuracy = {
-            BackendType.STIM: 10.0,
-            BackendType.TENSOR_NETWORK: 9.0,
-            BackendType.DDSIM: 8.5,
-            BackendType.QISKIT: 8.0,
-            BackendType.CUDA: 7.5,
-            BackendType.JAX_METAL: 7.0,
-            BackendType.CIRQ: 8.0,
-            BackendType.PENNYLANE: 8.0,
-            BackendType.QULACS: 8.0,
-            BackendType.OPENCL: 7.0,
-        }
-
-        accuracy_score = base_accuracy.get(backend, 5.0)
+        accuracy_score = self.BASE_ACCURACY.get(backend, 5.0)
 
         if analysis["is_clifford"]:
-            if backend == BackendType.STIM:
+            if backend is BackendType.STIM:
                 accuracy_score = 10.0
-            elif backend == BackendType.DDSIM:
+            elif backend is BackendType.DDSIM:
                 # DDSIM is also accurate for Clifford circuits
                 accuracy_score = 9.5
-            elif backend == BackendType.QISKIT:
+            elif backend is BackendType.QISKIT:
                 # Qiskit is accurate for Clifford circuits
                 accuracy_score = 8.5
-        elif backend == BackendType.STIM:
+        elif backend is BackendType.STIM:
             # STIM can only handle Clifford circuits
             accuracy_score = 0.0
 
@@ -212,6 +213,10 @@ class AccuracyOptimizerStrategy(QuantumRouterStrategy):
 class HybridOptimizerStrategy(QuantumRouterStrategy):
     """Multi-objective optimization."""
 
+    def __init__(self) -> None:
+        self._speed_strategy = SpeedOptimizerStrategy()
+        self._accuracy_strategy = AccuracyOptimizerStrategy()
+
     def score_backend(
         self,
         circuit: QuantumCircuit,
@@ -219,11 +224,8 @@ class HybridOptimizerStrategy(QuantumRouterStrategy):
         context: UserContext,
         analysis: dict[str, Any],
     ) -> RouteScore:
-        speed_strategy = SpeedOptimizerStrategy()
-        accuracy_strategy = AccuracyOptimizerStrategy()
-
-        speed_score_obj = speed_strategy.score_backend(circuit, backend, context, analysis)
-        accuracy_score_obj = accuracy_strategy.score_backend(circuit, backend, context, analysis)
+        speed_score_obj = self._speed_strategy.score_backend(circuit, backend, context, analysis)
+        accuracy_score_obj = self._accuracy_strategy.score_backend(circuit, backend, context, analysis)
 
         prefs = context.performance_preferences
         weighted_score = (
@@ -244,9 +246,13 @@ class HybridOptimizerStrategy(QuantumRouterStrategy):
 class EnhancedQuantumRouter:
     """Next-generation intelligent quantum router."""
 
+    DECISION_CACHE_SIZE = 256
+
     def __init__(self, default_strategy: RouterType = RouterType.HYBRID_ROUTER):
         self.default_strategy = default_strategy
         self.user_context = self._detect_system_context()
+        self._decision_cache = CircuitAnalysisCache(max_size=self.DECISION_CACHE_SIZE, ttl_seconds=float("inf"))
+        self._decision_cache_lock = threading.Lock()
 
         self.strategies = {
             RouterType.SPEED_OPTIMIZER: SpeedOptimizerStrategy(),
@@ -263,7 +269,7 @@ class EnhancedQuantumRouter:
 
         # Phase 1: Prioritized Filter Chain (Specialized Triage)
         # Order matters: fastest/most specialized first.
-        # Specialized fast-path filters. Order matters.
+        # Cheap fast-path filters, checked on every call.
         self._specialized_filters: list[tuple[BackendType, Any]] = [
             (BackendType.STIM, is_clifford_circuit),
             # If user requested higher precision/noise support, prefer DDSIM when available
@@ -276,24 +282,28 @@ class EnhancedQuantumRouter:
                 BackendType.PENNYLANE,
                 lambda circ: hasattr(circ, "parameters") and len(circ.parameters) > 0,
             ),
+        ]
+        # Structural filters that walk the circuit; their outcome is cached with the decision.
+        # They share one _CircuitMetrics per routing call so depth and full analysis run at most once.
+        self._structural_filters: list[tuple[BackendType, Any]] = [
             # Prefer MPS if either the MPS analyzer or topology suggests it, BUT NOT for Clifford circuits
             # (Clifford circuits should use STIM when available, or fall through to Phase 2 scoring)
             (
                 BackendType.MPS,
-                lambda circ: (
+                lambda circ, metrics: (
                     not is_clifford_circuit(circ)  # Exclude Clifford circuits from MPS fast-path
-                    and (should_use_mps(circ) or _topology_prefers_mps(circ))
+                    and (should_use_mps(circ, metrics.depth) or _topology_prefers_mps(circ, metrics.depth))
                 ),
             ),
             # Prefer Tensor Network when analysis recommends it
             (
                 BackendType.TENSOR_NETWORK,
-                lambda circ: should_use_tensor_network(circ),
+                lambda circ, metrics: should_use_tensor_network(circ, metrics.analysis),
             ),
             # Prefer PennyLane for ML/optimization families when available (after structural checks)
             (
                 BackendType.PENNYLANE,
-                lambda circ: _belongs_to_families(circ, {"machine_learning", "optimization"}),
+                lambda circ, _metrics: _belongs_to_families(circ, {"machine_learning", "optimization"}),
             ),
         ]
 
@@ -317,30 +327,73 @@ class EnhancedQuantumRouter:
             performance_preferences=PerformancePreferences(),
         )
 
-    def select_optimal_backend(self, circuit: QuantumCircuit, strategy: RouterType | None = None) -> RoutingDecision:
-        """Select optimal backend using specified strategy."""
+    def select_optimal_backend(
+        self, circuit: QuantumCircuit, strategy: RouterType | None = None, depth: int | None = None
+    ) -> RoutingDecision:
+        """Select optimal backend using specified strategy.
 
-        entropy = self._calculate_entropy(circuit)
+        Callers that already computed ``circuit.depth()`` can pass it as ``depth`` to skip that DAG walk.
+        """
 
         # --- Phase 1: Prioritized Filter Chain (Specialized Triage) ---
-        for backend_type, check_func in self._specialized_filters:
-            if self._is_backend_available(backend_type) and check_func(circuit):
+        decision = self._apply_filters(circuit, self._specialized_filters)
+        if decision is not None:
+            return decision
+
+        # Everything past the cheap filters depends only on the circuit structure and the
+        # routing inputs below, so structurally identical circuits reuse the earlier result.
+        strategy = strategy or self.default_strategy
+        cache_key = repr((strategy, os.getenv("ARIADNE_ROUTING_BUDGET_MS", "0"), self.user_context))
+        with self._decision_cache_lock:
+            cached_decisions = self._decision_cache.get_analysis(circuit) or {}
+        if cache_key in cached_decisions:
+            return _copy_decision(cast(RoutingDecision, cached_decisions[cache_key]))
+
+        metrics = _CircuitMetrics(circuit, depth)
+        decision = self._apply_filters(circuit, self._structural_filters, metrics) or self._score_backends(
+            circuit, strategy, metrics.analysis
+        )
+        # Callers own the returned decision, so the cache keeps a private copy
+        cached_decisions[cache_key] = _copy_decision(decision)
+        with self._decision_cache_lock:
+            self._decision_cache.store_analysis(circuit, cached_decisions)
+        return decision
+
+    def clear_cache(self) -> None:
+        """Forget memoized routing decisions, e.g. after installing a new backend."""
+        with self._decision_cache_lock:
+            self._decision_cache.clear()
+
+    def _apply_filters(
+        self, circuit: QuantumCircuit, filters: list[tuple[BackendType, Any]], *args: Any
+    ) -> RoutingDecision | None:
+        """Return a specialized decision for the first matching filter, if any.
+
+        Extra ``args`` are passed to every filter after the circuit.
+        """
+        for backend_type, check_func in filters:
+            if self._is_backend_available(backend_type) and check_func(circuit, *args):
                 # Found a specialized, fast match. Terminate routing early.
                 return RoutingDecision(
-                    circuit_entropy=entropy,
+                    circuit_entropy=self._calculate_entropy(circuit),
                     recommended_backend=backend_type,
                     confidence_score=1.0,
                     expected_speedup=5.0,  # Assume significant speedup for specialized backends
                     channel_capacity_match=1.0,
                     alternatives=[],
                 )
+        return None
 
+    def _score_backends(
+        self, circuit: QuantumCircuit, strategy: RouterType, analysis: dict[str, Any] | None = None
+    ) -> RoutingDecision:
+        """Score every available backend with ``strategy`` and pick the best."""
         # --- Phase 2: General Backend Scoring (Strategy Pattern) ---
-        strategy = strategy or self.default_strategy
         strategy_impl = self.strategies.get(strategy, self.strategies[RouterType.HYBRID_ROUTER])
 
         # Run full analysis only if Phase 1 failed
-        analysis = analyze_circuit(circuit)
+        if analysis is None:
+            analysis = analyze_circuit(circuit)
         backend_scores = {}
 
         for backend in BackendType:
@@ -369,7 +422,7 @@ class EnhancedQuantumRouter:
         alternatives = [
             (backend, score)
             for backend, score in backend_scores.items()
-            if score >= optimal_score * 0.75 and backend != optimal_backend
+            if score >= optimal_score * 0.75 and backend is not optimal_backend
         ]
         alternatives.sort(key=lambda x: x[1], reverse=True)
 
@@ -379,7 +432,7 @@ class EnhancedQuantumRouter:
         confidence = 0.9 if not alternatives else min(1.0, 0.5 + (optimal_score - alternatives[0][1]) / 10.0)
 
         return RoutingDecision(
-            circuit_entropy=entropy,
+            circuit_entropy=analysis["gate_entropy"],
             recommended_backend=optimal_backend,
             confidence_score=confidence,
             expected_speedup=max(1.0, expected_speedup),
@@ -389,25 +442,7 @@ class EnhancedQuantumRouter:
 
     def _calculate_entropy(self, circuit: QuantumCircuit) -> float:
         """Calculate gate entropy."""
-        gate_counts: dict[str, int] = {}
-        total_gates = 0
-
-        for instruction in circuit.data:
-            name = instruction.operation.name
-            if name not in ["measure", "barrier", "delay"]:
-                gate_counts[name] = gate_counts.get(name, 0) + 1
-                total_gates += 1
-
-        if total_gates == 0:
-            return 0.0
-
-        entropy = 0.0
-        for count in gate_counts.values():
-            p = count / total_gates
-            if p > 0:
-                entropy -= p * math.log2(p)
-
-        return entropy
+        return calculate_gate_entropy(circuit)
 
     def _is_backend_available(self, backend: BackendType) -> bool:
         """Check backend availability."""
@@ -479,11 +514,59 @@ class EnhancedQuantumRouter:
         except Exception:
             return False
 
-    def simulate(self, circuit: QuantumCircuit, shots: int = 1000) -> Any:
-        """Simulate circuit using the selected backend."""
+    def simulate(self, circuit: QuantumCircuit, shots: int = 1000, decision: RoutingDecision | None = None) -> Any:
+        """Simulate circuit using the selected backend.
+
+        Pass the ``decision`` already returned by :meth:`select_optimal_backend` to skip routing again.
+        """
         from ..router import simulate as router_simulate
 
-        return router_simulate(circuit, shots=shots)
+        return router_simulate(circuit, shots=shots, decision=decision)
+
+
+# Global instance
+_enhanced_router: EnhancedQuantumRouter | None = None
+_enhanced_router_lock = threading.Lock()
+
+
+def get_enhanced_router() -> EnhancedQuantumRouter:
+    """Get the global enhanced router instance."""
+    global _enhanced_router
+    if _enhanced_router is None:
+        # Routing runs from worker threads; every caller must share one decision cache
+        with _enhanced_router_lock:
+            if _enhanced_router is None:
+                _enhanced_router = EnhancedQuantumRouter()
+    return _enhanced_router
+
+
+class _CircuitMetrics:
+    """Depth and full analysis of one circuit, each computed on first use.
+
+    Shared by the structural filters and backend scoring of a single routing call.
+    """
+
+    def __init__(self, circuit: QuantumCircuit, depth: int | None = None) -> None:
+        self._circuit = circuit
+        self._depth = depth
+        self._analysis: dict[str, Any] | None = None
+
+    @property
+    def depth(self) -> int:
+        if self._depth is None:
+            self._depth = int(self._circuit.depth())
+        return self._depth
+
+    @property
+    def analysis(self) -> dict[str, Any]:
+        if self._analysis is None:
+            self._analysis = analyze_circuit(self._circuit, depth=self.depth)
+        return self._analysis
+
+
+def _copy_decision(decision: RoutingDecision) -> RoutingDecision:
+    """Copy a routing decision, including its mutable alternatives list."""
+    return replace(decision, alternatives=list(decision.alternatives))
 
 
 def _belongs_to_families(circuit: QuantumCircuit, families: set[str]) -> bool:
@@ -498,14 +581,14 @@ def _belongs_to_families(circuit: QuantumCircuit, families: set[str]) -> bool:
         return False
 
 
-def _topology_prefers_mps(circuit: QuantumCircuit) -> bool:
+def _topology_prefers_mps(circuit: QuantumCircuit, depth: int | None = None) -> bool:
     """Heuristic: prefer MPS for chain-like shallow circuits.
 
     Uses interaction graph shape to bias toward MPS when appropriate.
     Conservative to avoid over-selecting MPS.
     """
     try:
-        props = detect_layout_properties(circuit)
+        props = detect_layout_properties(circuit, depth=depth)
         chain_like = bool(props.get("chain_like", False))
         depth = int(props.get("depth", 0))
         # shallow relative to width
@@ -7,7 +7,7 @@ from qiskit import QuantumCircuit
 from .topology_analyzer import detect_layout_properties
 
 
-def should_use_mps(circuit: QuantumCircuit) -> bool:
+def should_use_mps(circuit: QuantumCircuit, depth: int | None = None) -> bool:
     """
     The Feynman Intuition: Why Matrix Product States (MPS) work.
 
@@ -43,12 +43,14 @@ def should_use_mps(circuit: QuantumCircuit) -> bool:
 
     Args:
         circuit: The quantum circuit to analyze.
+        depth: ``circuit.depth()`` if the caller has already computed it.
 
     Returns:
         True if the circuit is likely suitable for efficient MPS simulation, False otherwise.
     """
     num_qubits = circuit.num_qubits
-    depth = circuit.depth()
+    if depth is None:
+        depth = circuit.depth()
 
     # For small circuits, use the original two-qubit gate counting heuristic
     if num_qubits < 15:
@@ -71,7 +73,7 @@ def should_use_mps(circuit: QuantumCircuit) -> bool:
     # For larger circuits (≥15 qubits), check topology
     # Circuits with low max degree and shallow depth can still benefit from MPS
     try:
-        props = detect_layout_properties(circuit)
+        props = detect_layout_properties(circuit, depth=depth)
         max_degree = int(props.get("max_degree", num_qubits))
 
         # Accept sparse circuits (max degree <= 2) with shallow depth
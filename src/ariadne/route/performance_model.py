@@ -158,12 +158,15 @@ class CircuitFeatureExtractor:
 
     def _calculate_parallelization_factor(self, circuit: QuantumCircuit) -> float:
         """Calculate how parallelizable the circuit is."""
-        if circuit.depth() == 0:
+        depth = circuit.depth()
+        if depth == 0:
             return 1.0
 
-        total_gates = sum(1 for inst, _, _ in circuit.data if inst.name not in ["measure", "barrier", "delay"])
+        # len(circuit.data) is O(1); count_ops tallies the excluded names natively
+        op_counts = circuit.count_ops()
+        total_gates = len(circuit.data) - sum(op_counts.get(name, 0) for name in ("measure", "barrier", "delay"))
 
-        return total_gates / circuit.depth() if circuit.depth() > 0 else 1.0
+        return total_gates / depth
 
     def _estimate_entanglement_complexity(self, circuit: QuantumCircuit) -> float:
         """Estimate entanglement generation complexity."""
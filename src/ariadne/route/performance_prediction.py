@@ -538,8 +538,6 @@ class PerformancePredictor:
         self, circuit: QuantumCircuit
     ) -> tuple[QuantumCircuit | None, QuantumCircuit | None]:
         """Partition circuit into Clifford and non-Clifford regions."""
-        from qiskit import QuantumCircuit
-
         clifford_gates = {"x", "y", "z", "h", "s", "sdg", "cx", "cz", "swap"}
 
         clifford_circuit = QuantumCircuit(circuit.num_qubits)
@@ -562,8 +560,6 @@ class PerformancePredictor:
 
     def _partition_by_depth(self, circuit: QuantumCircuit, max_depth: int = 25) -> list[QuantumCircuit]:
         """Partition circuit by depth to create smaller segments."""
-        from qiskit import QuantumCircuit
-
         if circuit.depth() <= max_depth:
             return [circuit]
 
@@ -592,8 +588,6 @@ class PerformancePredictor:
 
     def _partition_by_qubits(self, circuit: QuantumCircuit, max_qubits: int = 15) -> list[QuantumCircuit]:
         """Partition circuit by qubit count to create smaller segments."""
-        from qiskit import QuantumCircuit
-
         if circuit.num_qubits <= max_qubits:
             return [circuit]
 
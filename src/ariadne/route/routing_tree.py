@@ -15,6 +15,7 @@ from typing import Any, Protocol
 
 from qiskit import QuantumCircuit
 
+from ..core.cache import CircuitAnalysisCache
 from ..types import BackendType, RoutingDecision
 from .analyze import analyze_circuit, is_clifford_circuit
 from .context_detection import detect_user_context
@@ -79,10 +80,16 @@ class ComprehensiveRoutingTree:
     decision tree that can handle any circuit type and user context.
     """
 
+    # Routing features are memoized per circuit structure so that evaluating the
+    # same circuit under several strategies only analyzes it once.
+    FEATURE_CACHE_SIZE = 512
+
     def __init__(self):
         """Initialize the comprehensive routing tree."""
         self.tree = self._build_routing_tree()
         self.backend_availability = self._check_backend_availability()
+        self._feature_cache = CircuitAnalysisCache(max_size=self.FEATURE_CACHE_SIZE, ttl_seconds=float("inf"))
+        self._rendered_tree: str | None = None
 
     def _check_backend_availability(self) -> dict[BackendType, bool]:
         """Check which backends are actually available."""
@@ -432,20 +439,72 @@ class ComprehensiveRoutingTree:
         if user_context is None:
             user_context = self._detect_user_context()
 
+        return self._decide(circuit, strategy, user_context, self._circuit_features(circuit))
+
+    def route_circuits_multi_strategy(
+        self,
+        circuit: QuantumCircuit,
+        strategies: list[RoutingStrategy],
+        user_context: UserContext | None = None,
+    ) -> dict[RoutingStrategy, RoutingDecision]:
+        """
+        Route one circuit under several strategies, analyzing it only once.
+
+        Args:
+            circuit: The quantum circuit to route
+            strategies: The routing strategies to evaluate
+            user_context: Optional user context shared by every strategy
+
+        Returns:
+            Mapping from each strategy to its routing decision
+        """
+        if user_context is None:
+            user_context = self._detect_user_context()
+
+        features = self._circuit_features(circuit)
+        return {strategy: self._decide(circuit, strategy, user_context, features) for strategy in strategies}
+
+    def _decide(
+        self,
+        circuit: QuantumCircuit,
+        strategy: RoutingStrategy,
+        user_context: UserContext,
+        features: dict[str, bool],
+    ) -> RoutingDecision:
+        """Apply a routing strategy to precomputed circuit features."""
         # Apply strategy-specific modifications to the tree traversal
-        if strategy == RoutingStrategy.CLIFFORD_OPTIMIZED:
-            return self._clifford_optimized_routing(circuit, user_context)
-        elif strategy == RoutingStrategy.APPLE_SILICON_OPTIMIZED:
-            return self._apple_silicon_routing(circuit, user_context)
-        elif strategy == RoutingStrategy.CUDA_OPTIMIZED:
-            return self._cuda_routing(circuit, user_context)
-        elif strategy == RoutingStrategy.MEMORY_EFFICIENT:
-            return self._memory_efficient_routing(circuit, user_context)
+        if strategy is RoutingStrategy.CLIFFORD_OPTIMIZED:
+            return self._clifford_optimized_routing(circuit, user_context, features)
+        elif strategy is RoutingStrategy.APPLE_SILICON_OPTIMIZED:
+            return self._apple_silicon_routing(circuit, user_context, features)
+        elif strategy is RoutingStrategy.CUDA_OPTIMIZED:
+            return self._cuda_routing(circuit, user_context, features)
+        elif strategy is RoutingStrategy.MEMORY_EFFICIENT:
+            return self._memory_efficient_routing(circuit, user_context, features)
         else:
             # Default tree traversal
-            return self._traverse_tree(self.tree, circuit, user_context)
-
-    def _traverse_tree(self, node: RoutingNode, circuit: QuantumCircuit, context: UserContext) -> RoutingDecision:
+            return self._traverse_tree(self.tree, circuit, user_context, features)
+
+    def _circuit_features(self, circuit: QuantumCircuit) -> dict[str, bool]:
+        """Return the circuit properties the tree branches on, memoized by circuit structure."""
+        features = self._feature_cache.get_analysis(circuit)
+        if features is None:
+            features = {
+                "is_clifford": is_clifford_circuit(circuit),
+                # Only circuits wider than 20 qubits reach an entanglement branch,
+                # so skip the depth/topology analysis for everything else.
+                "low_entanglement": circuit.num_qubits > 20 and self._has_low_entanglement(circuit),
+            }
+            self._feature_cache.store_analysis(circuit, features)
+        return features
+
+    def _traverse_tree(
+        self,
+        node: RoutingNode,
+        circuit: QuantumCircuit,
+        context: UserContext,
+        features: dict[str, bool],
+    ) -> RoutingDecision:
         """Traverse the routing tree to find the best backend."""
 
         # If this node has a backend and is available, consider it
@@ -461,8 +520,8 @@ class ComprehensiveRoutingTree:
 
         # Otherwise, traverse children
         for child in node.children:
-            if self._evaluate_condition(child.condition, circuit, context):
-                return self._traverse_tree(child, circuit, context)
+            if self._evaluate_condition(child.condition, circuit, context, features):
+                return self._traverse_tree(child, circuit, context, features)
 
         # Fallback to default
         return RoutingDecision(
@@ -474,15 +533,21 @@ class ComprehensiveRoutingTree:
             alternatives=[],
         )
 
-    def _evaluate_condition(self, condition: str, circuit: QuantumCircuit, context: UserContext) -> bool:
+    def _evaluate_condition(
+        self,
+        condition: str,
+        circuit: QuantumCircuit,
+        context: UserContext,
+        features: dict[str, bool],
+    ) -> bool:
         """Evaluate a routing condition."""
 
         if condition == "always":
             return True
         elif condition == "is_clifford_circuit(circuit)":
-            return is_clifford_circuit(circuit)
+            return features["is_clifford"]
         elif condition == "not is_clifford_circuit(circuit)":
-            return not is_clifford_circuit(circuit)
+            return not features["is_clifford"]
         elif condition == "circuit.num_qubits <= 20":
             return circuit.num_qubits <= 20
         elif condition == "20 < circuit.num_qubits <= 35":
@@ -494,7 +559,7 @@ class ComprehensiveRoutingTree:
         elif condition == "has_cuda()":
             return self._has_cuda()
         elif condition == "has_low_entanglement(circuit)":
-            return self._has_low_entanglement(circuit)
+            return features["low_entanglement"]
         elif "backend_available" in condition:
             # Extract backend type from condition
             backend_name = condition.split("BackendType.")[1].rstrip(")")
@@ -519,9 +584,11 @@ class ComprehensiveRoutingTree:
         """Check if circuit has low entanglement."""
         return should_use_mps(circuit)
 
-    def _clifford_optimized_routing(self, circuit: QuantumCircuit, context: UserContext) -> RoutingDecision:
+    def _clifford_optimized_routing(
+        self, circuit: QuantumCircuit, context: UserContext, features: dict[str, bool]
+    ) -> RoutingDecision:
         """Routing optimized for Clifford circuits."""
-        if is_clifford_circuit(circuit):
+        if features["is_clifford"]:
             if self.backend_availability.get(BackendType.STIM, False):
                 return RoutingDecision(
                     circuit_entropy=0.1,
@@ -533,9 +600,11 @@ class ComprehensiveRoutingTree:
                 )
 
         # Fallback to general routing
-        return self._traverse_tree(self.tree, circuit, context)
+        return self._traverse_tree(self.tree, circuit, context, features)
 
-    def _apple_silicon_routing(self, circuit: QuantumCircuit, context: UserContext) -> RoutingDecision:
+    def _apple_silicon_routing(
+        self, circuit: QuantumCircuit, context: UserContext, features: dict[str, bool]
+    ) -> RoutingDecision:
         """Routing optimized for Apple Silicon."""
         if self._is_apple_silicon() and self.backend_availability.get(BackendType.JAX_METAL, False):
             return RoutingDecision(
@@ -547,9 +616,11 @@ class ComprehensiveRoutingTree:
                 alternatives=[(BackendType.QISKIT, 0.7)],
             )
 
-        return self._traverse_tree(self.tree, circuit, context)
+        return self._traverse_tree(self.tree, circuit, context, features)
 
-    def _cuda_routing(self, circuit: QuantumCircuit, context: UserContext) -> RoutingDecision:
+    def _cuda_routing(
+        self, circuit: QuantumCircuit, context: UserContext, features: dict[str, bool]
+    ) -> RoutingDecision:
         """Routing optimized for CUDA."""
         if self._has_cuda():
             return RoutingDecision(
@@ -561,11 +632,13 @@ class ComprehensiveRoutingTree:
                 alternatives=[(BackendType.QISKIT, 0.7)],
             )
 
-        return self._traverse_tree(self.tree, circuit, context)
+        return self._traverse_tree(self.tree, circuit, context, features)
 
-    def _memory_efficient_routing(self, circuit: QuantumCircuit, context: UserContext) -> RoutingDecision:
+    def _memory_efficient_routing(
+        self, circuit: QuantumCircuit, context: UserContext, features: dict[str, bool]
+    ) -> RoutingDecision:
         """Routing optimized for memory efficiency."""
-        if circuit.num_qubits > 30 and self._has_low_entanglement(circuit):
+        if circuit.num_qubits > 30 and features["low_entanglement"]:
             if self.backend_availability.get(BackendType.MPS, False):
                 return RoutingDecision(
                     circuit_entropy=0.2,
@@ -576,7 +649,7 @@ class ComprehensiveRoutingTree:
                     alternatives=[(BackendType.TENSOR_NETWORK, 0.8)],
                 )
 
-        return self._traverse_tree(self.tree, circuit, context)
+        return self._traverse_tree(self.tree, circuit, context, features)
 
     def get_routing_explanation(self, circuit: QuantumCircuit) -> str:
         """Get a detailed explanation of why a particular routing was chosen."""
@@ -601,8 +674,8 @@ Routing Decision Explanation:
 Circuit Properties:
 - Qubits: {circuit.num_qubits}
 - Gates: {len(circuit)}
-- Depth: {circuit.depth()}
-- Is Clifford: {is_clifford_circuit(circuit)}
+- Depth: {analysis_details["depth"]}
+- Is Clifford: {analysis_details["is_clifford"]}
 - Estimated Entanglement: {"Low" if should_use_mps(circuit) else "High"}
 
 Hardware Environment:
@@ -627,7 +700,17 @@ Analysis Details:
         return explanation
 
     def visualize_routing_tree(self) -> str:
-        """Generate a text visualization of the routing tree."""
+        """Generate a text visualization of the routing tree.
+
+        The tree is fixed once built, so the rendering is produced on first use and
+        reused afterwards.
+        """
+        if self._rendered_tree is None:
+            self._rendered_tree = self._render_routing_tree()
+        return self._rendered_tree
+
+    def _render_routing_tree(self) -> str:
+        """Walk the routing tree and render it as indented text."""
 
         def _visualize_node(node: RoutingNode, depth: int = 0) -> str:
             indent = "  " * depth
@@ -21,13 +21,13 @@ class TopologyProperties:
     max_degree: int
 
 
-def detect_layout_properties(circuit: QuantumCircuit) -> dict[str, int | bool]:
+def detect_layout_properties(circuit: QuantumCircuit, depth: int | None = None) -> dict[str, int | bool]:
     """Detect coarse topology/layout properties of the circuit's interaction graph.
 
     Heuristics:
     - chain_like: graph is a path (max degree <= 2, and #edges ≈ #nodes-1)
     - grid_like: simple proxy (not implemented, always False for now)
-    - depth: circuit depth (qiskit-reported)
+    - depth: circuit depth (qiskit-reported, or ``depth`` when already known)
     - max_degree: maximum node degree in interaction graph
     """
     g = interaction_graph(circuit)
@@ -44,7 +44,7 @@ def detect_layout_properties(circuit: QuantumCircuit) -> dict[str, int | bool]:
     props = TopologyProperties(
         chain_like=bool(chain_like),
         grid_like=False,
-        depth=int(circuit.depth()),
+        depth=int(circuit.depth()) if depth is None else depth,
         max_degree=int(max_deg),
     )
     return {
@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 import warnings
 from time import perf_counter
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 from qiskit import QuantumCircuit
@@ -22,9 +22,15 @@ from .core import (
     get_logger,
     get_resource_manager,
 )
-from .route.enhanced_router import EnhancedQuantumRouter, RouterType
+from .route.enhanced_router import EnhancedQuantumRouter, RouterType, get_enhanced_router  # noqa: F401
 from .types import BackendType, RoutingDecision, SimulationResult
 
+if TYPE_CHECKING:
+    from .backends.mps_backend import MPSBackend
+
+# Operations that leave every qubit in |0⟩ when applied to the initial state
+_ZERO_STATE_OPS = frozenset({"measure", "reset", "barrier", "delay"})
+
 CUDABackend: type[Any] | None = None
 
 
@@ -70,6 +76,9 @@ except ImportError:  # pragma: no cover - executed when dependencies missing
 # Global state for Tensor Network Backend instance
 _TENSOR_BACKEND: TensorNetworkBackend | None = None
 
+# Shared MPS backend instance, created on first use
+_MPS_BACKEND: MPSBackend | None = None
+
 # ------------------------------------------------------------------
 # Analysis helpers
 
@@ -104,6 +113,22 @@ def _simulate_stim(circuit: QuantumCircuit, shots: int) -> dict[str, int]:
         raise SimulationError(f"Stim simulation failed: {exc}", backend="stim") from exc
 
 
+def _zero_state_counts(circuit: QuantumCircuit, shots: int) -> dict[str, int] | None:
+    """Return analytic counts for circuits that never leave |0...0⟩, otherwise ``None``.
+
+    Measurements, resets and directives alone cannot change the all-zero state, so
+    such circuits are answered without building a simulator.  Keys follow Qiskit's
+    space-separated classical-register layout.
+    """
+    if any(inst.operation.name not in _ZERO_STATE_OPS for inst in circuit.data):
+        return None
+    if sum(creg.size for creg in circuit.cregs) != circuit.num_clbits:
+        # Loose classical bits have no register-based key layout to mirror
+        return None
+    key = " ".join("0" * creg.size for creg in reversed(circuit.cregs))
+    return {key: shots} if shots > 0 else {}
+
+
 def _simulate_qiskit(circuit: QuantumCircuit, shots: int) -> dict[str, int]:
     logger = get_logger("router")
 
@@ -112,6 +137,10 @@ def _simulate_qiskit(circuit: QuantumCircuit, shots: int) -> dict[str, int]:
         circuit = circuit.copy()
         circuit.measure_all()
 
+    zero_state_counts = _zero_state_counts(circuit, shots)
+    if zero_state_counts is not None:
+        return zero_state_counts
+
     try:
         from qiskit_aer import AerSimulator
     except ImportError:
@@ -400,9 +429,11 @@ def _simulate_mps(circuit: QuantumCircuit, shots: int) -> dict[str, int]:
     except ImportError as exc:
         raise BackendUnavailableError("mps", "MPS backend dependencies not available") from exc
 
+    global _MPS_BACKEND
     try:
-        backend = MPSBackend()
-        return backend.simulate(circuit, shots)
+        if _MPS_BACKEND is None:
+            _MPS_BACKEND = MPSBackend()
+        return _MPS_BACKEND.simulate(circuit, shots)
     except Exception as exc:
         logger.log_simulation_error(exc, backend="mps")
         raise SimulationError(f"MPS simulation failed: {exc}", backend="mps") from exc
@@ -476,7 +507,7 @@ def _generate_routing_explanation(
     """
     import platform
 
-    from .route.analyze import analyze_circuit, is_clifford_circuit
+    from .route.analyze import analyze_circuit
     from .route.mps_analyzer import should_use_mps
     from .route.routing_tree import get_routing_tree
 
@@ -505,8 +536,8 @@ Routing Decision Explanation:
 Circuit Properties:
 - Qubits: {circuit.num_qubits}
 - Gates: {len(circuit)}
-- Depth: {circuit.depth()}
-- Is Clifford: {is_clifford_circuit(circuit)}
+- Depth: {analysis_details["depth"]}
+- Is Clifford: {analysis_details["is_clifford"]}
 - Estimated Entanglement: {"Low" if should_use_mps(circuit) else "High"}
 
 Hardware Environment:
@@ -697,7 +728,12 @@ def _execute_simulation(circuit: QuantumCircuit, shots: int, routing_decision: R
     )
 
 
-def simulate(circuit: QuantumCircuit, shots: int = 1024, backend: str | None = None) -> SimulationResult:
+def simulate(
+    circuit: QuantumCircuit,
+    shots: int = 1024,
+    backend: str | None = None,
+    decision: RoutingDecision | None = None,
+) -> SimulationResult:
     """
     Route and execute a quantum circuit on the most appropriate simulator.
 
@@ -710,11 +746,17 @@ def simulate(circuit: QuantumCircuit, shots: int = 1024, backend: str | None = N
     backend : str or None, optional
         Explicit backend override (e.g. ``"qiskit"``). When ``None`` the router
         selects the backend automatically.
+    decision : RoutingDecision or None, optional
+        Routing decision already obtained from
+        :meth:`EnhancedQuantumRouter.select_optimal_backend` for this circuit.
+        When given (and ``backend`` is ``None``) routing is skipped entirely.
 
     Returns
     -------
     SimulationResult
         Execution outcome with counts, metadata, and routing explanation.
+        ``execution_time`` covers the backend run only; the seconds spent
+        selecting the backend are reported as ``metadata["routing_time"]``.
 
     Raises
     ------
@@ -759,8 +801,9 @@ def simulate(circuit: QuantumCircuit, shots: int = 1024, backend: str | None = N
             metadata={"shots": shots},
         )
 
-    # Initialize Enhanced Router
-    enhanced_router = EnhancedQuantumRouter()
+    # Shared router, so repeated routing of the same circuit structure is cached
+    enhanced_router = get_enhanced_router()
+    routing_start = perf_counter()
 
     if backend is not None:
         # Force specific backend
@@ -783,6 +826,9 @@ def simulate(circuit: QuantumCircuit, shots: int = 1024, backend: str | None = N
         )
 
         logger.info(f"Using forced backend: {backend}")
+    elif decision is not None:
+        # Caller already routed this circuit
+        routing_decision = decision
     else:
         # Optionally use the predictive model for selection
         use_predictor = os.getenv("ARIADNE_ROUTING_PREDICT", "").lower() in {"1", "true", "yes"}
@@ -843,8 +889,10 @@ def simulate(circuit: QuantumCircuit, shots: int = 1024, backend: str | None = N
             logger.error(f"Router failed to select backend: {exc}")
             raise SimulationError(f"Router failed: {exc}") from exc
 
+    routing_time = perf_counter() - routing_start
+
     try:
-        return _execute_simulation(circuit, shots, routing_decision)
+        result = _execute_simulation(circuit, shots, routing_decision)
     except ResourceExhaustionError as exc:
         logger.error(f"Resource exhaustion error: {exc}")
         raise CircuitTooLargeError(circuit.num_qubits, circuit.depth(), backend) from exc
@@ -852,6 +900,10 @@ def simulate(circuit: QuantumCircuit, shots: int = 1024, backend: str | None = N
         logger.error(f"Simulation failed: {exc}")
         raise
 
+    # Backend time is already in ``execution_time``; keep routing overhead separate from it
+    result.metadata["routing_time"] = routing_time
+    return result
+
 
 def simulate_and_explain(
     circuit: QuantumCircuit,
@@ -896,3 +948,48 @@ def simulate_and_explain(
     result = simulate(circuit, shots=shots, **kwargs)
 
     return result, explanation
+
+
+def warmup(shots: int = 16) -> dict[str, float]:
+    """
+    Pay one-time backend start-up costs before timing-sensitive work.
+
+    The first simulation on a backend imports its dependencies (quimb and numba
+    for MPS, Stim's converter, Aer) which can take far longer than the
+    simulation itself.  This routes a small Clifford and a small non-Clifford
+    circuit through :func:`simulate` so later small-circuit calls skip that cost.
+
+    Parameters
+    ----------
+    shots : int, optional
+        Shots per warm-up circuit (default: 16).
+
+    Returns
+    -------
+    dict[str, float]
+        Seconds spent warming each backend that handled a probe circuit.
+    """
+    logger = get_logger("router")
+
+    clifford = QuantumCircuit(2)
+    clifford.h(0)
+    clifford.cx(0, 1)
+    clifford.measure_all()
+
+    non_clifford = QuantumCircuit(2)
+    non_clifford.h(0)
+    non_clifford.t(0)
+    non_clifford.cx(0, 1)
+    non_clifford.measure_all()
+
+    timings: dict[str, float] = {}
+    for circuit in (clifford, non_clifford):
+        start = perf_counter()
+        try:
+            result = simulate(circuit, shots=shots)
+        except Exception as exc:
+            logger.debug(f"Warm-up simulation failed: {exc}")
+            continue
+        backend_name = result.backend_used.value
+        timings[backend_name] = timings.get(backend_name, 0.0) + perf_counter() - start
+    return timings
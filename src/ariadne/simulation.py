@@ -121,13 +121,18 @@ class EnhancedSimulationResult:
     def get_expectation_value(self, observable: str) -> float:
         """Calculate expectation value for a Pauli observable."""
         # Simplified implementation - in practice would use proper Pauli algebra
-        total_shots = sum(self.counts.values())
-
         if observable == "Z":
-            # For single-qubit Z observable
-            prob_0 = sum(count for state, count in self.counts.items() if state.endswith("0")) / total_shots
-            prob_1 = sum(count for state, count in self.counts.items() if state.endswith("1")) / total_shots
-            return prob_0 - prob_1
+            # For single-qubit Z observable: one pass tallies the shots by each key's last
+            # character (qubit 0 in Qiskit's LSB-last layout); keys may differ in width
+            total_shots = shots_0 = shots_1 = 0
+            for state, count in self.counts.items():
+                total_shots += count
+                last = state[-1:]
+                if last == "0":
+                    shots_0 += count
+                elif last == "1":
+                    shots_1 += count
+            return (shots_0 - shots_1) / total_shots
 
         return 0.0  # Placeholder for complex observables
 
@@ -40,7 +40,7 @@ class BackendCapacity:
     apple_silicon_boost: float
 
 
-@dataclass
+@dataclass(slots=True)
 class RoutingDecision:
     """Information returned by the routing mechanism."""
 
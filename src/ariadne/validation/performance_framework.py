@@ -177,11 +177,11 @@ class AccuracyValidationTest(ValidationTest):
         if total_shots == 0:
             return 0.0
 
+        # Convert bitstrings to indices (reversed for Qiskit bit ordering) and scatter in one step
+        indices = np.fromiter((int(bitstring[::-1], 2) for bitstring in counts), dtype=np.int64, count=len(counts))
+        shot_counts = np.fromiter(counts.values(), dtype=float, count=len(counts))
         measured_probs = np.zeros(2**num_qubits)
-        for bitstring, count in counts.items():
-            # Convert bitstring to index (Qiskit bit ordering)
-            index = int(bitstring[::-1], 2)  # Reverse for Qiskit convention
-            measured_probs[index] = count / total_shots
+        measured_probs[indices] = shot_counts / total_shots
 
         # Calculate expected probabilities
         expected_probs = np.abs(expected_state) ** 2
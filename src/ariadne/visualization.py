@@ -18,6 +18,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.figure import Figure
 
+from .distributions import probability_matrix
+
 try:  # Optional dependency for backward compatibility
     import seaborn as sns
 except ImportError:  # pragma: no cover - executed when seaborn is unavailable
@@ -515,12 +517,9 @@ class ResultVisualizer:
 
         # Use first backend as reference
         reference_backend = backend_names[0]
-        reference_counts = backend_results[reference_backend].counts
 
-        similarities = []
-        for backend in backend_names[1:]:
-            similarity = self._calculate_distribution_similarity(reference_counts, backend_results[backend].counts)
-            similarities.append(similarity)
+        probs = probability_matrix([backend_results[backend].counts for backend in backend_names])
+        similarities = np.sqrt(probs[0] * probs[1:]).sum(axis=1)
 
         axes.bar(backend_names[1:], similarities)
         axes.set_ylabel("Similarity to Reference")
@@ -589,15 +588,7 @@ class ResultVisualizer:
     def _calculate_distribution_similarity(self, counts1: dict[str, int], counts2: dict[str, int]) -> float:
         """Calculate similarity between two probability distributions."""
 
-        # Get all unique states
-        all_states = set(counts1.keys()) | set(counts2.keys())
-
-        # Normalize to probabilities
-        total1 = sum(counts1.values())
-        total2 = sum(counts2.values())
-
-        prob1 = np.array([counts1.get(state, 0) / total1 for state in all_states])
-        prob2 = np.array([counts2.get(state, 0) / total2 for state in all_states])
+        prob1, prob2 = probability_matrix([counts1, counts2])
 
         # Calculate Bhattacharyya coefficient (similarity measure)
         similarity = float(np.sqrt(prob1 * prob2).sum())
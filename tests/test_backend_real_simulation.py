@@ -32,6 +32,24 @@ def test_tensor_network_backend_matches_statevector_distribution() -> None:
     assert counts == expected
 
 
+def test_tensor_network_backend_reuses_compiled_circuit(monkeypatch: MonkeyPatch) -> None:
+    def build() -> QuantumCircuit:
+        qc = QuantumCircuit(3)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.t(2)
+        return qc
+
+    backend = TensorNetworkBackend(TensorNetworkOptions(seed=7))
+    first = backend.simulate(build(), shots=256)
+
+    def _fail_compile(_circuit: QuantumCircuit) -> None:
+        raise AssertionError("structurally identical circuit should not be recompiled")
+
+    monkeypatch.setattr(backend, "_compile_to_tensor_network", _fail_compile)
+    assert backend.simulate(build(), shots=256) == first
+
+
 @pytest.mark.skipif(platform.system() == "Windows", reason="JAX Metal not supported on Windows")
 def test_jax_metal_backend_matches_statevector(monkeypatch: MonkeyPatch) -> None:
     pytest.importorskip("jax")
@@ -161,3 +161,125 @@ class TestConfigurationLoading:
                 assert isinstance(config, dict)
         finally:
             Path(temp_path).unlink(missing_ok=True)
+
+    def test_load_file_cache_invalidated_on_change(self, tmp_path):
+        """Test that parsed files are cached until they change on disk."""
+        import os
+
+        from ariadne.config.loader import ProgressiveConfigLoader
+
+        config_path = tmp_path / "ariadne.yaml"
+        config_path.write_text("shots: 100\n")
+        loader = ProgressiveConfigLoader()
+
+        first = loader._load_file(str(config_path))
+        first["shots"] = 1
+        assert loader._load_file(str(config_path)) == {"shots": 100}
+
+        config_path.write_text("shots: 2000\n")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert loader._load_file(str(config_path)) == {"shots": 2000}
+
+        ProgressiveConfigLoader.clear_file_cache()
+        assert loader._load_file(str(config_path)) == {"shots": 2000}
+
+    def test_load_history_is_opt_in(self):
+        """Test that load history is only recorded when requested."""
+        import hashlib
+
+        from ariadne.config.loader import ProgressiveConfigLoader
+
+        loader = ProgressiveConfigLoader()
+        loader.add_dict_source("defaults", {"shots": 100})
+        loader.load()
+        assert loader.get_load_history() == ()
+
+        loader = ProgressiveConfigLoader(record_history=True)
+        loader.add_dict_source("defaults", {"shots": 100})
+        loader.load()
+        (entry,) = loader.get_load_history()
+        assert entry["source"] == "defaults"
+        assert entry["keys_added"] == ["shots"]
+        # A stable digest, so history entries can be compared across runs
+        assert entry["hash"] == hashlib.blake2b(b'{"shots": 100}', digest_size=16).hexdigest()
+
+    def test_builtin_templates_are_shared_and_frozen(self):
+        """Test that built-in templates are built once and cannot be modified."""
+        import pytest
+
+        from ariadne.config.loader import create_default_template
+        from ariadne.core import ConfigurationError
+
+        template = create_default_template()
+        assert create_default_template() is template
+        with pytest.raises(ConfigurationError):
+            template.add_section("extra", {})
+
+    def test_loader_get_dotted_key(self):
+        """Test dotted-key lookup into the merged configuration."""
+        from ariadne.config.loader import ProgressiveConfigLoader
+
+        loader = ProgressiveConfigLoader()
+        loader.add_dict_source("defaults", {"backends": {"default_backend": "qiskit", "pool": {"max": 5}}})
+        loader.load()
+        assert loader.get("backends.default_backend") == "qiskit"
+        assert loader.get("backends.pool.max") == 5
+        assert loader.get("backends.missing", "fallback") == "fallback"
+
+    def test_load_skips_revalidating_unchanged_config(self):
+        """Test that an unchanged merged config is validated only once per schema."""
+        from unittest.mock import Mock
+
+        from ariadne.config.loader import ProgressiveConfigLoader
+
+        validator = Mock()
+        validator.validate.return_value = Mock(is_valid=True)
+        loader = ProgressiveConfigLoader(validator=validator)
+        loader.add_dict_source("defaults", {"shots": 100})
+
+        loader.load(schema_name="ariadne")
+        loader.load(schema_name="ariadne")
+        assert validator.validate.call_count == 1
+
+        loader.add_dict_source("override", {"shots": 200}, priority=-1)
+        loader.load(schema_name="ariadne")
+        assert validator.validate.call_count == 2
+
+    def test_large_json_integers_stay_exact(self, tmp_path, monkeypatch):
+        """Test that integers beyond 64 bits are not rounded to floats."""
+        from ariadne.config.loader import ProgressiveConfigLoader
+
+        big = 12345678901234567890123
+        monkeypatch.setenv("ARIADNETEST_SEED", str(big))
+        config_path = tmp_path / "ariadne.json"
+        config_path.write_text(f'{{"limit": {big}, "shots": 100}}')
+
+        loader = ProgressiveConfigLoader()
+        loader.add_env_source("ARIADNETEST_")
+        loader.add_file_source(str(config_path))
+        config = loader.load()
+        assert config["seed"] == big
+        assert config["limit"] == big
+        assert config["shots"] == 100
+
+    def test_env_values_parse_like_json_loads(self, monkeypatch):
+        """Test that environment values parse exactly as json.loads would."""
+        import json
+        import math
+
+        from ariadne.config.loader import ProgressiveConfigLoader
+
+        values = {"NAN": "NaN", "INF": "Infinity", "NEGINF": "-Infinity", "PADDED": " 5", "LIST": "\t[1, 2]"}
+        plain = {"WORD": "qiskit", "EMPTY": "", "BLANK": "  "}
+        for name, value in {**values, **plain}.items():
+            monkeypatch.setenv(f"ARIADNETEST_{name}", value)
+
+        loader = ProgressiveConfigLoader()
+        loader.add_env_source("ARIADNETEST_")
+        config = loader.load()
+        assert math.isnan(config["nan"])
+        for name in ("INF", "NEGINF", "PADDED", "LIST"):
+            assert config[name.lower()] == json.loads(values[name])
+        for name, value in plain.items():
+            assert config[name.lower()] == value
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from ariadne.route.analyze import clifford_ratio, is_clifford_circuit
+from ariadne.route.analyze import analyze_circuit_fused, clifford_ratio, is_clifford_circuit
 
 
 def test_clifford_ratio_for_clifford_only() -> None:
@@ -16,3 +16,129 @@ def test_clifford_ratio_for_clifford_only() -> None:
     qc.cz(1, 2)
     assert is_clifford_circuit(qc) is True
     assert clifford_ratio(qc) == 1.0
+
+
+def test_identity_and_measurements_keep_circuit_clifford() -> None:
+    pytest.importorskip("qiskit")
+    from qiskit import QuantumCircuit
+
+    qc = QuantumCircuit(2, 2)
+    qc.h(0)
+    qc.id(1)
+    qc.cx(0, 1)
+    qc.barrier()
+    qc.measure([0, 1], [0, 1])
+    assert is_clifford_circuit(qc) is True
+    assert clifford_ratio(qc) == 1.0
+
+
+def test_resets_keep_circuit_clifford_and_convert_to_stim() -> None:
+    pytest.importorskip("qiskit")
+    pytest.importorskip("stim")
+    from qiskit import QuantumCircuit
+
+    from ariadne.converters import convert_qiskit_to_stim
+
+    qc = QuantumCircuit(2, 2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure(1, 0)
+    qc.reset(1)
+    qc.measure([0, 1], [0, 1])
+    assert is_clifford_circuit(qc) is True
+    assert analyze_circuit_fused(qc)["is_clifford"] is True
+
+    stim_circuit, measurement_map = convert_qiskit_to_stim(qc)
+    assert "R 1" in str(stim_circuit)
+    assert len(measurement_map) == 3
+
+
+def test_non_clifford_gate_breaks_clifford_detection() -> None:
+    pytest.importorskip("qiskit")
+    from qiskit import QuantumCircuit
+
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.t(0)
+    qc.cx(0, 1)
+    assert is_clifford_circuit(qc) is False
+    assert clifford_ratio(qc) == pytest.approx(2 / 3)
+
+
+def test_fused_analysis_matches_separate_passes() -> None:
+    pytest.importorskip("qiskit")
+    from qiskit import QuantumCircuit
+
+    from ariadne.route.analyze import analyze_circuit, analyze_circuit_fused
+
+    qc = QuantumCircuit(3, 3)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.t(1)
+    qc.cz(1, 2)
+    qc.barrier()
+    qc.measure([0, 1, 2], [0, 1, 2])
+
+    fused = analyze_circuit_fused(qc)
+    full = analyze_circuit(qc)
+
+    assert fused["depth"] == qc.depth()
+    assert fused["is_clifford"] is False
+    assert fused["clifford_ratio"] == full["clifford_ratio"]
+    assert fused["total_gates"] == full["total_gates"]
+    assert fused["num_2q"] == full["two_qubit_gates"]
+    assert fused["gate_entropy"] == pytest.approx(full["gate_entropy"])
+
+
+def test_analyze_circuit_computes_depth_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("qiskit")
+    from qiskit import QuantumCircuit
+
+    from ariadne.route.analyze import analyze_circuit
+
+    qc = QuantumCircuit(3)
+    qc.h(0)
+    qc.t(1)
+    qc.cx(0, 1)
+    qc.cx(1, 2)
+
+    calls = 0
+    original_depth = QuantumCircuit.depth
+
+    def counting_depth(self: QuantumCircuit, *args: object, **kwargs: object) -> int:
+        nonlocal calls
+        calls += 1
+        return original_depth(self, *args, **kwargs)
+
+    monkeypatch.setattr(QuantumCircuit, "depth", counting_depth)
+
+    analysis = analyze_circuit(qc)
+
+    assert analysis["depth"] == 3
+    assert calls == 1
+
+
+def test_circuit_properties_skip_measure_barrier_and_delay() -> None:
+    from qiskit import QuantumCircuit
+
+    from ariadne.route.analyze import _get_circuit_properties
+
+    qc = QuantumCircuit(2, 2)
+    qc.h(0)
+    qc.rx(0.3, 1)
+    qc.cx(0, 1)
+    qc.reset(1)
+    qc.barrier()
+    qc.delay(10, 0)
+    qc.t(0)
+    qc.measure([0, 1], [0, 1])
+
+    assert _get_circuit_properties(qc) == {
+        "total_gates": 5,
+        "two_qubit_gates": 1,
+        "parameterized_gates": 1,
+        # reset is a stabilizer operation, so it counts towards the Clifford gates
+        "clifford_gates": 3,
+        "gate_counts": {"h": 1, "rx": 1, "cx": 1, "reset": 1, "t": 1},
+        "gate_types": {"h", "rx", "cx", "reset", "t"},
+    }
@@ -2,9 +2,12 @@
 Test module for enhanced benchmarking functionality.
 """
 
+import pytest
+
 from ariadne.enhanced_benchmarking import (
     CrossValidationSuite,
     EnhancedBenchmarkSuite,
+    _max_probability_differences,
     compare_backends,
     quick_performance_test,
     run_comprehensive_benchmark,
@@ -84,6 +87,17 @@ def test_cross_validation_suite():
     assert isinstance(validation_result["results"], dict)
 
 
+def test_max_probability_differences_aligns_outcomes():
+    """Test that each distribution is compared to the reference over the union of outcomes."""
+    reference = {"00": 50, "11": 50}
+    others = [{"00": 50, "11": 50}, {"00": 100}, {"01": 30, "11": 70}]
+
+    diffs = _max_probability_differences(reference, others)
+
+    assert diffs == pytest.approx([0.0, 0.5, 0.5])
+    assert _max_probability_differences(reference, []) == []
+
+
 def test_convenience_functions():
     """Test the convenience functions."""
     # Test quick performance test
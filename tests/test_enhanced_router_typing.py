@@ -2,6 +2,7 @@
 Test enhanced_router module typing and edge cases to improve coverage.
 """
 
+import pytest
 from qiskit import QuantumCircuit
 
 from ariadne.route.enhanced_router import EnhancedQuantumRouter, RouterType
@@ -135,6 +136,181 @@ class TestEnhancedRouterTyping:
         assert clifford_result.backend_used is not None
         assert non_clifford_result.backend_used is not None
 
+    def test_clifford_fast_path_skips_full_analysis(self, monkeypatch):
+        """Clifford circuits are routed to Stim without depth or full analysis."""
+        from ariadne.route import enhanced_router
+        from ariadne.types import BackendType
+
+        router = EnhancedQuantumRouter()
+        if not router._is_backend_available(BackendType.STIM):
+            pytest.skip("Stim not installed")
+
+        def _fail(*_args, **_kwargs):
+            raise AssertionError("Clifford fast path should not run full analysis")
+
+        monkeypatch.setattr(enhanced_router, "analyze_circuit", _fail)
+        monkeypatch.setattr(QuantumCircuit, "depth", _fail)
+
+        qc = QuantumCircuit(3)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.cx(1, 2)
+        qc.s(0)
+
+        decision = router.select_optimal_backend(qc)
+        assert decision.recommended_backend == BackendType.STIM
+        assert decision.circuit_entropy == pytest.approx(1.5)
+
+    def test_structurally_identical_circuits_reuse_decision(self, monkeypatch):
+        """Repeated routing of the same structure skips the structural checks."""
+        from ariadne.route import enhanced_router
+
+        calls = []
+        original = enhanced_router.should_use_mps
+
+        def _counting_should_use_mps(circuit, depth=None):
+            calls.append(circuit)
+            return original(circuit, depth)
+
+        monkeypatch.setattr(enhanced_router, "should_use_mps", _counting_should_use_mps)
+
+        def build():
+            qc = QuantumCircuit(3)
+            qc.h(0)
+            qc.t(0)
+            qc.cx(0, 1)
+            qc.t(1)
+            qc.cx(1, 2)
+            return qc
+
+        router = EnhancedQuantumRouter()
+        first = router.select_optimal_backend(build())
+        second = router.select_optimal_backend(build())
+        assert second.recommended_backend == first.recommended_backend
+        assert len(calls) == 1
+
+        # A different strategy or context is routed afresh
+        router.select_optimal_backend(build(), strategy=RouterType.SPEED_OPTIMIZER)
+        router.user_context.hardware_profile.cuda_capable = not router.user_context.hardware_profile.cuda_capable
+        router.select_optimal_backend(build())
+        assert len(calls) == 3
+
+    def test_routing_computes_depth_at_most_once(self, monkeypatch):
+        """Structural filters and scoring share one depth; a caller-supplied depth is reused."""
+        calls = []
+        original_depth = QuantumCircuit.depth
+
+        def _counting_depth(circuit, *args, **kwargs):
+            calls.append(circuit)
+            return original_depth(circuit, *args, **kwargs)
+
+        monkeypatch.setattr(QuantumCircuit, "depth", _counting_depth)
+
+        def build():
+            qc = QuantumCircuit(3)
+            qc.h(0)
+            qc.t(0)
+            qc.cx(0, 1)
+            qc.t(1)
+            qc.cx(1, 2)
+            return qc
+
+        EnhancedQuantumRouter().select_optimal_backend(build())
+        assert len(calls) == 1
+
+        qc = build()
+        depth = original_depth(qc)
+        EnhancedQuantumRouter().select_optimal_backend(qc, depth=depth)
+        assert len(calls) == 1
+
+    def test_global_router_is_shared(self):
+        """simulate() routes through one shared router instance."""
+        from ariadne.route.enhanced_router import get_enhanced_router
+
+        router = get_enhanced_router()
+        assert router is get_enhanced_router()
+
+        qc = QuantumCircuit(3)
+        qc.h(0)
+        qc.t(0)
+        qc.cx(0, 1)
+        qc.t(1)
+        qc.cx(1, 2)
+        qc.measure_all()
+        router.simulate(qc, shots=10)
+        assert router._decision_cache.get_stats()["size"] >= 1
+
+    def test_global_router_is_created_once_across_threads(self, monkeypatch):
+        """Concurrent first calls to get_enhanced_router() share one instance."""
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        from ariadne.route import enhanced_router
+
+        monkeypatch.setattr(enhanced_router, "_enhanced_router", None)
+        original_init = EnhancedQuantumRouter.__init__
+        barrier = threading.Barrier(8)
+
+        def slow_init(self, *args, **kwargs):
+            time.sleep(0.01)
+            original_init(self, *args, **kwargs)
+
+        monkeypatch.setattr(EnhancedQuantumRouter, "__init__", slow_init)
+
+        def first_call(_):
+            barrier.wait()
+            return enhanced_router.get_enhanced_router()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            routers = list(pool.map(first_call, range(8)))
+        assert all(router is routers[0] for router in routers)
+
+    def test_simulate_reuses_precomputed_decision(self, monkeypatch):
+        """A decision passed to simulate() is used without routing again."""
+        from ariadne import router as router_module
+
+        router = EnhancedQuantumRouter()
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.t(0)
+        qc.cx(0, 1)
+        qc.measure_all()
+        decision = router.select_optimal_backend(qc)
+
+        def _no_rerouting(*_args, **_kwargs):
+            raise AssertionError("simulate() should not route again")
+
+        monkeypatch.setattr(router_module.get_enhanced_router(), "select_optimal_backend", _no_rerouting)
+        result = router_module.simulate(qc, shots=10, decision=decision)
+        assert result.routing_decision is decision
+
+        result = router.simulate(qc, shots=10, decision=decision)
+        assert result.routing_decision is decision
+
+        router.clear_cache()
+        assert router._decision_cache.get_stats()["size"] == 0
+
+    def test_cached_decisions_are_not_shared_with_callers(self):
+        """Mutating a returned decision does not change later routing results."""
+        router = EnhancedQuantumRouter()
+        qc = QuantumCircuit(3)
+        qc.h(0)
+        qc.t(0)
+        qc.cx(0, 1)
+        qc.cx(1, 2)
+        qc.measure_all()
+
+        first = router.select_optimal_backend(qc)
+        expected = list(first.alternatives)
+        first.alternatives.clear()
+        first.confidence_score = -1.0
+
+        second = router.select_optimal_backend(qc)
+        assert second is not first
+        assert second.alternatives == expected
+        assert second.confidence_score != -1.0
+
     def test_edge_cases_and_error_handling(self):
         """Test edge cases and error handling in the router."""
         router = EnhancedQuantumRouter()
@@ -10,6 +10,16 @@ def _has_module(name: str) -> bool:
     return importlib.util.find_spec(name) is not None
 
 
+def test_package_exports_only_importable_backends() -> None:
+    import ariadne
+
+    for name in ariadne._LAZY_EXPORTS:
+        assert (name in ariadne.__all__) == (getattr(ariadne, name) is not None)
+    namespace: dict[str, object] = {}
+    exec("from ariadne import *", namespace)
+    assert all(namespace[name] is not None for name in ariadne.__all__)
+
+
 @pytest.mark.skipif(not _has_module("cirq"), reason="Cirq not installed")
 def test_cirq_backend_simulation() -> None:
     qc = QuantumCircuit(2)
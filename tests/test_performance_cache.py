@@ -0,0 +1,253 @@
+"""Tests for the simulation result cache backends."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+
+from ariadne.performance import cache as cache_module
+from ariadne.performance.cache import (
+    CachePolicy,
+    CircuitHasher,
+    IntelligentCache,
+    Memoizer,
+    MemoryCacheBackend,
+    SimulationCache,
+    TinyLFUAdmission,
+    cached_simulate,
+    memoize_hashable,
+)
+
+
+def test_memory_backend_evicts_least_recently_used() -> None:
+    backend = MemoryCacheBackend(max_size=2)
+    backend.set("a", 1)
+    backend.set("b", 2)
+
+    assert backend.get("a") == 1  # "b" is now least recently used
+    backend.set("c", 3)
+
+    assert backend.get("b") is None
+    assert backend.keys() == ["a", "c"]
+    assert backend.get_statistics()["evictions"] == 1
+
+
+def test_memory_backend_overwrite_tracks_memory() -> None:
+    backend = MemoryCacheBackend(max_size=10)
+    backend.set("a", "x" * 100)
+    backend.set("a", "y")
+
+    assert backend.size() == 1
+    assert backend.get("a") == "y"
+    assert backend.delete("a")
+    assert backend.get_statistics()["current_memory_bytes"] == 0
+
+
+def test_memory_backend_lfu_evicts_least_frequently_used() -> None:
+    backend = MemoryCacheBackend(max_size=2, policy=CachePolicy.LFU)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    backend.get("a")
+    backend.get("a")
+    backend.get("b")  # "b" is most recent but less frequently used than "a"
+
+    backend.set("c", 3)
+    assert sorted(backend.keys()) == ["a", "c"]
+
+    backend.set("d", 4)  # "c" has never been read
+    assert sorted(backend.keys()) == ["a", "d"]
+
+
+def test_circuit_hash_distinguishes_structure() -> None:
+    def circuit(angle: float, target: int) -> QuantumCircuit:
+        qc = QuantumCircuit(3, 1)
+        qc.h(0)
+        qc.rx(angle, 1)
+        qc.cx(0, target)
+        qc.measure(0, 0)
+        return qc
+
+    base = CircuitHasher.hash_circuit(circuit(0.5, 2))
+    assert CircuitHasher.hash_circuit(circuit(0.5, 2)) == base
+    assert CircuitHasher.hash_circuit(circuit(0.6, 2)) != base
+    assert CircuitHasher.hash_circuit(circuit(0.5, 1)) != base
+    assert len(CircuitHasher.hash_circuit(circuit(0.5, 2), secure=True)) == 64
+
+
+def test_cached_simulate_hashes_circuit_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache_module, "_global_simulation_cache", SimulationCache())
+    calls = []
+    original = CircuitHasher.hash_circuit
+
+    def counting_hash(circuit: QuantumCircuit, secure: bool = False) -> str:
+        calls.append(circuit)
+        return original(circuit, secure)
+
+    monkeypatch.setattr(CircuitHasher, "hash_circuit", staticmethod(counting_hash))
+
+    @cached_simulate()
+    def fake_simulate(circuit: QuantumCircuit, shots: int, backend: str | None = None) -> object:
+        return {"shots": shots}
+
+    qc = QuantumCircuit(1)
+    qc.h(0)
+    assert fake_simulate(qc, 10, "qiskit") == {"shots": 10}
+    assert len(calls) == 1
+    assert fake_simulate(qc, 10, "qiskit") == {"shots": 10}
+    assert len(calls) == 2
+
+
+def test_invalidate_backend_matches_key_suffix() -> None:
+    cache = SimulationCache()
+    qc = QuantumCircuit(1)
+    cache.set(qc, 10, "stim-result", backend="stim")
+    cache.set(qc, 10, "qiskit-result", backend="qiskit")
+
+    assert cache.invalidate_backend("stim") == 1
+    assert cache.get(qc, 10, backend="stim") is None
+    assert cache.get(qc, 10, backend="qiskit") == "qiskit-result"
+
+
+def test_memory_backend_size_estimate_uses_reported_sizes() -> None:
+    class Sized:
+        __cache_size__ = 4096
+
+    backend = MemoryCacheBackend()
+    backend.set("array", np.zeros(256))
+    backend.set("sized", Sized())
+
+    assert backend.get_statistics()["current_memory_bytes"] == 256 * 8 + 4096
+
+
+def test_invalidate_by_rule_does_not_touch_entries() -> None:
+    backend = MemoryCacheBackend(max_size=3)
+    cache = IntelligentCache(backend=backend)
+    for key in ("a", "b", "c"):
+        cache.set(key, key.upper())
+    cache.add_invalidation_rule(lambda key, value: value == "B")
+
+    assert cache.invalidate_by_rule() == 1
+    assert backend.keys() == ["a", "c"]
+    assert backend._cache["a"].access_count == 0  # scanning does not count as an access
+
+
+def test_expire_tick_removes_unread_expired_entries() -> None:
+    backend = MemoryCacheBackend()
+    backend.set("short", 1, ttl=5.0)
+    backend.set("long", 2, ttl=500.0)
+    backend.set("forever", 3)
+    created = backend._cache["short"].created_at
+
+    assert backend.expire_tick(now=created + 1.0) == 0
+    assert backend.expire_tick(now=created + 10.0) == 1
+    assert sorted(backend.keys()) == ["forever", "long"]
+
+
+def test_memoizer_keys_distinguish_scalars_with_equal_hashes() -> None:
+    memoizer = Memoizer(IntelligentCache())
+    calls = []
+
+    @memoizer.memoize()
+    def identity(value: object, *, scale: int = 1) -> object:
+        calls.append(value)
+        return value
+
+    for value in (-1, -2, 1, 1.0, True):
+        assert identity(value) == value
+        assert type(identity(value)) is type(value)
+    assert identity([1, 2]) == [1, 2]  # unhashable arguments use the general serializer
+    assert identity([1, 2]) == [1, 2]
+    assert len(calls) == 6
+
+    key = memoizer._generate_cache_key(identity, (3,), {"scale": 2})
+    assert key == memoizer._generate_cache_key(identity, (3,), {"scale": 2})
+    assert key != memoizer._generate_cache_key(identity, (2,), {"scale": 3})
+
+
+def test_memoize_hashable_caches_by_type_and_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    calls = []
+
+    @memoize_hashable(ttl=10.0)
+    def square(value: float) -> float:
+        calls.append(value)
+        return value * value
+
+    assert square(3) == 9
+    assert square(3) == 9
+    assert square(3.0) == 9.0  # typed: 3 and 3.0 are cached separately
+    assert calls == [3, 3.0]
+
+    now[0] = 110.0
+    assert square(3) == 9
+    assert calls == [3, 3.0, 3]
+    square.cache_clear()
+    assert square.cache_info().currsize == 0
+
+
+def test_tinylfu_admission_rejects_one_hit_wonders() -> None:
+    admission = TinyLFUAdmission(width=1024)
+    backend = MemoryCacheBackend(max_size=2, admission=admission)
+
+    def lookup(key: str, value: int) -> None:
+        # The miss-then-store pattern used by cached_simulate
+        if backend.get(key) is None:
+            backend.set(key, value)
+
+    lookup("hot", 1)
+    lookup("warm", 2)
+    lookup("hot", 1)
+    lookup("hot", 1)
+    assert admission.frequency("hot") == 3
+
+    lookup("once", 3)  # the least recently used entry is "warm", requested once
+    assert sorted(backend.keys()) == ["hot", "once"]
+
+    lookup("fresh", 4)  # one request cannot displace "hot", requested three times
+    assert admission.frequency("fresh") == 1
+    assert sorted(backend.keys()) == ["hot", "once"]
+    assert backend.get_statistics()["admission_rejections"] == 1
+
+    for _ in range(3):
+        backend.get("popular")
+    backend.set("popular", 5)
+    assert "popular" in backend.keys()
+
+
+def test_tinylfu_admission_keeps_lru_for_unread_keys() -> None:
+    backend = MemoryCacheBackend(max_size=2, admission=TinyLFUAdmission(width=1024))
+    for key in ("a", "b", "c"):
+        backend.set(key, key)
+
+    assert sorted(backend.keys()) == ["b", "c"]
+
+
+def test_tinylfu_sketch_ages_counters() -> None:
+    admission = TinyLFUAdmission(width=1024, sample_size=8)
+    for _ in range(6):
+        admission.record("a")
+    assert admission.frequency("a") == 6
+
+    admission.record("b")
+    admission.record("b")  # eighth recording halves every counter
+    assert admission.frequency("a") == 3
+    assert admission.frequency("b") == 1
+
+    with pytest.raises(ValueError):
+        TinyLFUAdmission(width=100)
+
+
+def test_memory_backend_recycles_evicted_entries() -> None:
+    backend = MemoryCacheBackend(max_size=1)
+    backend.set("a", [1, 2, 3])
+    first_entry = backend._cache["a"]
+
+    backend.set("b", 2, ttl=60.0)
+
+    assert backend._cache["b"] is first_entry
+    assert first_entry.key == "b" and first_entry.ttl == 60.0 and first_entry.access_count == 0
+    assert backend.get("a") is None
+    assert backend.delete("b")
+    assert backend._entry_pool == [first_entry] and first_entry.value is None
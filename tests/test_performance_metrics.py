@@ -0,0 +1,99 @@
+"""Tests for benchmark telemetry aggregation."""
+
+from __future__ import annotations
+
+import json
+import statistics
+from collections.abc import Callable
+
+import pytest
+
+from ariadne.performance import metrics
+from ariadne.performance.metrics import (
+    BenchmarkMetricsAggregator,
+    ExecutionTelemetry,
+    dump_telemetry,
+    measure_simulation_run,
+)
+
+
+def _sample(iteration: int, duration: float, success: bool = True) -> ExecutionTelemetry:
+    return ExecutionTelemetry(
+        backend="qiskit",
+        iteration=iteration,
+        shots=100,
+        duration_s=duration,
+        start_time=float(iteration),
+        end_time=float(iteration) + duration,
+        peak_memory_kb=float(iteration % 5),
+        success=success,
+        error=None if success else "failed",
+    )
+
+
+@pytest.mark.parametrize("count", [3, 50])
+def test_aggregator_round_trips_samples_and_summarises(count: int) -> None:
+    samples = [_sample(i, 0.01 * (i % 9 + 1), success=i % 6 != 0) for i in range(1, count + 1)]
+    aggregator = BenchmarkMetricsAggregator(backend="qiskit", shots=100)
+    for sample in samples:
+        aggregator.add(sample)
+
+    assert list(aggregator.telemetry) == samples
+
+    durations = [sample.duration_s for sample in samples if sample.success]
+    summary = aggregator.summary()
+    assert summary.iterations == count
+    assert summary.successes == len(durations)
+    assert summary.avg_time_s == pytest.approx(statistics.mean(durations))
+    assert summary.median_time_s == pytest.approx(statistics.median(durations))
+    assert summary.std_time_s == pytest.approx(statistics.pstdev(durations))
+    assert summary.peak_memory_kb == max(sample.peak_memory_kb for sample in samples)
+
+
+def test_empty_aggregator_summary() -> None:
+    summary = BenchmarkMetricsAggregator(backend="qiskit", shots=100).summary()
+
+    assert summary.iterations == 0
+    assert summary.avg_time_s is None
+    assert summary.peak_memory_kb is None
+
+
+def test_dump_telemetry_serialises_every_field() -> None:
+    samples = [_sample(1, 0.5), _sample(2, 0.25, success=False)]
+
+    rows = json.loads(dump_telemetry(samples))
+
+    assert rows == [sample.to_dict() for sample in samples]
+    assert rows[1]["error"] == "failed"
+    assert list(rows[0]) == [
+        "backend",
+        "iteration",
+        "shots",
+        "duration_s",
+        "start_time",
+        "end_time",
+        "peak_memory_kb",
+        "success",
+        "error",
+    ]
+
+
+def test_measure_simulation_run_reports_per_run_memory() -> None:
+    _, telemetry = measure_simulation_run(lambda: bytearray(4 * 1024 * 1024), backend="qiskit", iteration=1, shots=1)
+    assert telemetry.success
+    assert telemetry.peak_memory_kb >= 4 * 1024
+
+    _, telemetry = measure_simulation_run(lambda: None, backend="qiskit", iteration=2, shots=1)
+    assert telemetry.peak_memory_kb < 4 * 1024
+
+
+@pytest.mark.skipif(metrics.resource is None, reason="resource module unavailable")
+def test_rusage_profiler_reports_high_water_mark_growth() -> None:
+    def allocate(megabytes: int) -> Callable[[], int]:
+        return lambda: len(bytes(megabytes * 1024 * 1024))
+
+    measure_simulation_run(allocate(64), backend="qiskit", iteration=1, shots=1, memory_profiler="rusage")
+    _, telemetry = measure_simulation_run(allocate(1), backend="qiskit", iteration=2, shots=1, memory_profiler="rusage")
+
+    # The first run already set a higher process peak, so the smaller run adds nothing
+    assert telemetry.peak_memory_kb == 0.0
@@ -20,12 +20,19 @@ def _make_mixed_circuit() -> QuantumCircuit:
     return circuit
 
 
+def _make_chain_layer() -> QuantumCircuit:
+    layer = QuantumCircuit(3)
+    layer.h(0)
+    layer.cx(0, 1)
+    layer.cx(1, 2)
+    return layer
+
+
 def _make_deep_circuit() -> QuantumCircuit:
+    layer = _make_chain_layer()
     circuit = QuantumCircuit(3)
     for _ in range(60):
-        circuit.h(0)
-        circuit.cx(0, 1)
-        circuit.cx(1, 2)
+        circuit.compose(layer, inplace=True)
     return circuit
 
 
@@ -37,11 +44,10 @@ def _make_wide_circuit(qubits: int = 24) -> QuantumCircuit:
 
 
 def _make_clifford_chain() -> QuantumCircuit:
+    layer = _make_chain_layer()
     circuit = QuantumCircuit(3)
     for _ in range(10):
-        circuit.h(0)
-        circuit.cx(0, 1)
-        circuit.cx(1, 2)
+        circuit.compose(layer, inplace=True)
     return circuit
 
 
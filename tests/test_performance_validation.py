@@ -269,10 +269,13 @@ class TestCrossPlatformComparison:
         assert system_info.platform_type is not None
         assert len(system_info.python_version) > 0
 
-    def test_quick_comparison(self) -> None:
+    def test_quick_comparison(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test quick performance comparison."""
         from ariadne.cross_platform_comparison import BackendType
 
+        # The comparison saves its report to the working directory
+        monkeypatch.chdir(tmp_path)
+
         # Run quick comparison with available backends
         available_backends = [BackendType.CPU_NUMPY]  # Always available
 
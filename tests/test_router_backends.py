@@ -40,6 +40,8 @@ def test_optional_backends_success(
 ) -> None:
     dummy_module = SimpleNamespace(**{attribute: _StubBackend})
     monkeypatch.setitem(sys.modules, module_path, dummy_module)
+    # Drop any MPS backend instance cached by an earlier simulation in this process
+    monkeypatch.setattr(router, "_MPS_BACKEND", None)
 
     circuit = QuantumCircuit(1)
     circuit.h(0)
@@ -7,7 +7,15 @@ import pytest
 from qiskit import QuantumCircuit
 
 from ariadne.core.resource_manager import ResourceRequirements
-from ariadne.router import BackendType, RoutingDecision, _execute_simulation, _sample_statevector_counts, simulate
+from ariadne.router import (
+    BackendType,
+    RoutingDecision,
+    _execute_simulation,
+    _sample_statevector_counts,
+    _zero_state_counts,
+    simulate,
+    warmup,
+)
 
 
 class _DummyResources:
@@ -122,6 +130,22 @@ def test_sample_statevector_counts_behaviour(monkeypatch: pytest.MonkeyPatch) ->
         _sample_statevector_counts(circuit, shots=-4)
 
 
+def test_zero_state_counts_for_measure_only_circuits() -> None:
+    measured = QuantumCircuit(2, 2)
+    measured.barrier()
+    measured.measure_all()
+    assert _zero_state_counts(measured, shots=100) == {"00 00": 100}
+    assert _zero_state_counts(measured, shots=0) == {}
+
+    entangled = QuantumCircuit(2, 2)
+    entangled.h(0)
+    entangled.measure([0, 1], [0, 1])
+    assert _zero_state_counts(entangled, shots=100) is None
+
+    result = simulate(measured, shots=100, backend="qiskit")
+    assert result.counts == {"00 00": 100}
+
+
 def test_simulate_handles_empty_circuit(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr("ariadne.route.routing_tree.explain_routing", lambda _circuit: "empty", raising=False)
 
@@ -131,7 +155,27 @@ def test_simulate_handles_empty_circuit(monkeypatch: pytest.MonkeyPatch) -> None
     assert result.backend_used == BackendType.QISKIT
 
 
+def test_simulate_reports_routing_time_separately() -> None:
+    circuit = QuantumCircuit(2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.measure_all()
+
+    result = simulate(circuit, shots=10)
+    assert result.metadata["shots"] == 10
+    assert result.metadata["routing_time"] >= 0
+    assert result.execution_time >= 0
+
+
 def test_simulate_rejects_unknown_forced_backend() -> None:
     circuit = QuantumCircuit(1)
     with pytest.raises(ValueError):
         simulate(circuit, backend="unknown-backend")
+
+
+def test_warmup_reports_backends_used() -> None:
+    timings = warmup(shots=4)
+
+    assert timings
+    assert set(timings) <= {backend.value for backend in BackendType}
+    assert all(seconds >= 0 for seconds in timings.values())
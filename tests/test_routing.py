@@ -51,10 +51,8 @@ class TestEnhancedQuantumRouter:
         """Test routing for large circuits."""
         # Create a large sparse circuit
         qc = QuantumCircuit(100)
-        for i in range(0, 100, 10):
-            qc.h(i)
-            if i + 1 < 100:
-                qc.cx(i, i + 1)
+        qc.h(range(0, 100, 10))
+        qc.cx(range(0, 100, 10), range(1, 100, 10))
         qc.measure_all()
 
         decision = self.router.select_optimal_backend(qc)
@@ -87,8 +85,7 @@ class TestEnhancedQuantumRouter:
         qc = QuantumCircuit(n_qubits)
         # Create GHZ state (Clifford circuit)
         qc.h(0)
-        for i in range(1, n_qubits):
-            qc.cx(0, i)
+        qc.cx(0, range(1, n_qubits))
         qc.measure_all()
 
         decision = self.router.select_optimal_backend(qc)
@@ -227,10 +224,8 @@ class TestPerformance:
     def test_routing_speed(self) -> None:
         """Test that routing decisions are fast."""
         qc = QuantumCircuit(20)
-        for i in range(20):
-            qc.h(i)
-        for i in range(0, 19, 2):
-            qc.cx(i, i + 1)
+        qc.h(range(20))
+        qc.cx(range(0, 19, 2), range(1, 20, 2))
 
         router = EnhancedQuantumRouter()
 
@@ -241,10 +236,8 @@ class TestPerformance:
     def test_analysis_speed(self) -> None:
         """Test that circuit analysis works for larger circuits."""
         qc = QuantumCircuit(50)
-        for i in range(50):
-            qc.h(i)
-            if i > 0:
-                qc.cx(i - 1, i)
+        qc.h(range(50))
+        qc.cx(range(49), range(1, 50))
 
         # Analysis should work even for larger circuits
         result = analyze_circuit(qc)
@@ -0,0 +1,88 @@
+"""Tests for the comprehensive routing decision tree."""
+
+from __future__ import annotations
+
+from qiskit import QuantumCircuit
+
+from ariadne.route.routing_tree import ComprehensiveRoutingTree, RoutingStrategy
+from ariadne.types import BackendType
+
+
+def _ghz(num_qubits: int) -> QuantumCircuit:
+    qc = QuantumCircuit(num_qubits)
+    qc.h(0)
+    for idx in range(num_qubits - 1):
+        qc.cx(idx, idx + 1)
+    return qc
+
+
+def test_clifford_circuit_routes_to_stim() -> None:
+    tree = ComprehensiveRoutingTree()
+    decision = tree.route_circuit(_ghz(5))
+    assert decision.recommended_backend is BackendType.STIM
+
+
+def test_features_are_reused_across_strategies(monkeypatch) -> None:
+    import ariadne.route.routing_tree as routing_tree
+
+    calls = 0
+    original = routing_tree.is_clifford_circuit
+
+    def counting_is_clifford(circuit: QuantumCircuit) -> bool:
+        nonlocal calls
+        calls += 1
+        return original(circuit)
+
+    monkeypatch.setattr(routing_tree, "is_clifford_circuit", counting_is_clifford)
+
+    tree = ComprehensiveRoutingTree()
+    circuit = _ghz(4)
+    for strategy in (
+        RoutingStrategy.AUTO_DETECT,
+        RoutingStrategy.SPEED_FIRST,
+        RoutingStrategy.MEMORY_EFFICIENT,
+        RoutingStrategy.CLIFFORD_OPTIMIZED,
+    ):
+        tree.route_circuit(circuit, strategy)
+
+    # An equivalent but distinct circuit object hits the same cache entry
+    tree.route_circuit(_ghz(4))
+
+    assert calls == 1
+
+
+def test_structurally_different_circuits_are_not_conflated() -> None:
+    tree = ComprehensiveRoutingTree()
+    clifford = _ghz(3)
+    non_clifford = _ghz(3)
+    non_clifford.t(2)
+
+    assert tree.route_circuit(clifford).recommended_backend is BackendType.STIM
+    assert tree.route_circuit(non_clifford).recommended_backend is not BackendType.STIM
+
+
+def test_routing_tree_rendering_is_reused() -> None:
+    tree = ComprehensiveRoutingTree()
+    first = tree.visualize_routing_tree()
+
+    assert first.startswith("Ariadne Routing Tree:")
+    assert "stim_backend → stim" in first
+    assert tree.visualize_routing_tree() is first
+
+
+def test_multi_strategy_routing_matches_individual_calls() -> None:
+    tree = ComprehensiveRoutingTree()
+    circuit = _ghz(6)
+    circuit.t(5)
+    strategies = [
+        RoutingStrategy.AUTO_DETECT,
+        RoutingStrategy.CLIFFORD_OPTIMIZED,
+        RoutingStrategy.MEMORY_EFFICIENT,
+    ]
+
+    decisions = tree.route_circuits_multi_strategy(circuit, strategies)
+
+    assert list(decisions) == strategies
+    for strategy in strategies:
+        expected = tree.route_circuit(circuit, strategy)
+        assert decisions[strategy].recommended_backend is expected.recommended_backend
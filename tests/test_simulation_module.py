@@ -163,6 +163,19 @@ def test_enhanced_simulation_result_helpers() -> None:
     assert as_dict["warnings"] == ["note"]
 
 
+@pytest.mark.parametrize(
+    ("counts", "expected"),
+    [
+        ({"0": 1, "11": 1, "01": 2}, -0.5),
+        ({"00 1": 2, "01 0": 1, "1 10": 1}, 0.0),
+    ],
+)
+def test_expectation_value_handles_mixed_width_keys(counts: dict[str, int], expected: float) -> None:
+    result = EnhancedSimulationResult(counts=counts, execution_time=0.0, backend_used="qiskit", circuit_analysis={})
+
+    assert result.get_expectation_value("Z") == pytest.approx(expected)
+
+
 def test_simulate_batch_uses_shared_options(monkeypatch: pytest.MonkeyPatch) -> None:
     simulator = QuantumSimulator()
     circuits = [QuantumCircuit(1), QuantumCircuit(1)]
@@ -139,10 +139,12 @@ class TestValidationTyping:
         assert result["valid"] is True  # Single qubit circuits are valid
 
         # Very deep circuit
+        layer = QuantumCircuit(2)
+        layer.h(0)
+        layer.cx(0, 1)
         qc_deep = QuantumCircuit(2)
         for _ in range(150):  # Should trigger depth warning
-            qc_deep.h(0)
-            qc_deep.cx(0, 1)
+            qc_deep.compose(layer, inplace=True)
 
         result_deep = check_simulation_requirements(qc_deep)
         warnings = result_deep["warnings"]
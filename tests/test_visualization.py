@@ -13,6 +13,7 @@ import numpy as np
 import pytest
 from pytest import CaptureFixture
 
+from ariadne.distributions import probability_matrix
 from ariadne.types import BackendType, SimulationResult
 from ariadne.visualization import (
     ResultAnalyzer,
@@ -329,6 +330,18 @@ class TestResultVisualizer:
         similarity2 = self.visualizer._calculate_distribution_similarity(counts1, counts3)
         assert similarity2 < similarity  # Should be less similar
 
+    def test_probability_matrix_aligns_states(self) -> None:
+        """Test that distributions with different states share one column layout."""
+        probs = probability_matrix([{"00": 500, "11": 500}, {"11": 750, "01": 250}, {}])
+
+        assert probs.shape == (3, 3)
+        np.testing.assert_allclose(probs[0], [0.5, 0.5, 0.0])
+        np.testing.assert_allclose(probs[1], [0.0, 0.75, 0.25])
+        np.testing.assert_allclose(probs[2], [0.0, 0.0, 0.0])
+
+        similarity = self.visualizer._calculate_distribution_similarity({"00": 500, "11": 500}, {"11": 750, "01": 250})
+        assert similarity == pytest.approx(np.sqrt(0.5 * 0.75))
+
     @patch("ariadne.visualization.plt.show")
     @patch("ariadne.visualization.plt.close")
     def test_save_figure(self, mock_close: MagicMock, mock_show: MagicMock) -> None: